@@ -0,0 +1,293 @@
+"""
+Benchmarks of the public functions of t_eda_analysis on synthetic frames.
+
+Every function is timed on every configuration of the grid of rows,
+columns, NA densities and category cardinalities, recording the best wall
+time of untraced runs and the peak memory of one more run traced by
+`tracemalloc` (numpy and pandas report their buffers to it). The results
+are written as JSON so that two releases can be compared:
+
+    python -m benchmarks.run_benchmarks --output new.json
+    python -m benchmarks.run_benchmarks --compare old.json new.json
+
+The configurations above `--max-cells` cells are recorded as skipped, raise
+it to run the 10^8 rows and 5,000 columns scales on a large machine. A
+function failing on a configuration is recorded with the status "error" and
+its message, and is left out of the comparisons.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from t_eda_analysis import t_eda_analysis as eda
+
+ROWS = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8]
+COLUMNS = [5, 50, 500, 5000]
+NA_DENSITIES = [0.0, 0.1]
+CARDINALITIES = [10, 10000]
+FUNCTIONS = ["describe_na_values", "describe_cat_var", "describe_num_var",
+             "calc_cor", "generate_report"]
+# The compute-only tables should import in about the time of numpy and
+# pandas, Altair being imported with the first chart only
+IMPORTS = {"numpy, pandas": "import numpy, pandas",
+           "t_eda_analysis.tables": "import t_eda_analysis.tables",
+           "altair": "import altair"}
+
+
+def make_frame(n_rows, n_cols, na_density=0.0, cardinality=10, seed=0):
+    """
+    Generates a synthetic frame, one categorical column for every four
+    numeric columns.
+
+    Parameters
+    -----------
+    n_rows: `int`
+        The number of rows.
+    n_cols: `int`
+        The number of columns.
+    na_density: `float`, optional
+        The fraction of NA values of every column.
+    cardinality: `int`, optional
+        The number of distinct categories of the categorical columns.
+    seed: `int`, optional
+        The seed of the random values.
+
+    Returns
+    --------
+    tuple
+        The frame, the names of its categorical columns and the names of
+        its numeric columns.
+    """
+    rng = np.random.default_rng(seed)
+    n_cat = max(1, n_cols // 5)
+    cat_vars = ["cat_{}".format(j) for j in range(n_cat)]
+    num_vars = ["num_{}".format(j) for j in range(n_cols - n_cat)]
+    labels = np.array(["c{}".format(i) for i in range(cardinality)],
+                      dtype=object)
+
+    columns = {}
+    for item in cat_vars:
+        values = labels[rng.integers(0, cardinality, n_rows)]
+        values[rng.random(n_rows) < na_density] = None
+        columns[item] = values
+    for item in num_vars:
+        values = rng.standard_normal(n_rows)
+        values[rng.random(n_rows) < na_density] = np.nan
+        columns[item] = values
+    return pd.DataFrame(columns), cat_vars, num_vars
+
+
+def _call(function, dataframe, cat_vars, num_vars):
+    if function == "describe_na_values":
+        return eda.describe_na_values(dataframe)
+    if function == "describe_cat_var":
+        return eda.describe_cat_var(dataframe, cat_vars)
+    if function == "describe_num_var":
+        return eda.describe_num_var(dataframe, num_vars)
+    if function == "calc_cor":
+        return eda.calc_cor(dataframe, num_vars)
+    with contextlib.redirect_stdout(io.StringIO()) as printed:
+        report = eda.generate_report(dataframe, cat_vars, num_vars)
+    # A failed report is printed and returned as False
+    if report is False:
+        raise Exception(printed.getvalue().strip())
+    return report
+
+
+def measure(function, dataframe, cat_vars, num_vars, repeat=3):
+    """
+    Times a function on a frame. The repeats are timed without tracing,
+    which would slow the allocations down, and the peak memory is traced
+    in one more run.
+
+    Returns
+    --------
+    dict
+        The best wall time in seconds as 'wall_seconds' and the peak traced
+        memory in bytes as 'peak_bytes'.
+    """
+    walls = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        _call(function, dataframe, cat_vars, num_vars)
+        walls.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _call(function, dataframe, cat_vars, num_vars)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"wall_seconds": min(walls), "peak_bytes": peak}
+
+
+def import_times(repeat=3):
+    """
+    Times the imports of `IMPORTS`, each in a fresh interpreter.
+
+    Returns
+    --------
+    dict
+        The best import time in seconds of each entry of `IMPORTS`.
+    """
+    code = ("import time\n"
+            "start = time.perf_counter()\n"
+            "{}\n"
+            "print(time.perf_counter() - start)\n")
+    times = {}
+    for name, statement in IMPORTS.items():
+        times[name] = min(
+            float(subprocess.run([sys.executable, "-c",
+                                  code.format(statement)],
+                                 check=True, stdout=subprocess.PIPE,
+                                 universal_newlines=True).stdout)
+            for _ in range(repeat))
+    return times
+
+
+def run(rows=ROWS, columns=COLUMNS, na_densities=NA_DENSITIES,
+        cardinalities=CARDINALITIES, functions=FUNCTIONS, max_cells=10 ** 7,
+        repeat=3, log=None):
+    """
+    Runs the benchmarks on every configuration of the grid.
+
+    Returns
+    --------
+    dict
+        The environment and the import times as 'meta', and one record per
+        function and configuration as 'results'.
+    """
+    results = []
+    grid = itertools.product(rows, columns, na_densities, cardinalities)
+    for n_rows, n_cols, na_density, cardinality in grid:
+        config = {"rows": n_rows, "columns": n_cols,
+                  "na_density": na_density, "cardinality": cardinality}
+        if n_rows * n_cols > max_cells:
+            results.extend(dict(config, function=function, status="skipped")
+                           for function in functions)
+            continue
+
+        dataframe, cat_vars, num_vars = make_frame(n_rows, n_cols,
+                                                   na_density, cardinality)
+        for function in functions:
+            record = dict(config, function=function, status="ok")
+            try:
+                record.update(measure(function, dataframe, cat_vars,
+                                      num_vars, repeat))
+            except Exception as ex:
+                record.update(status="error", error=str(ex))
+            results.append(record)
+            if log is not None:
+                outcome = "error: {error}" if record["status"] == "error" \
+                    else "{wall_seconds:.4f}s {peak_bytes:,d}B"
+                log(("{function} rows={rows} columns={columns} "
+                     "na={na_density} cardinality={cardinality}: " +
+                     outcome).format(**record))
+        del dataframe
+
+    meta = _meta()
+    meta["import_seconds"] = import_times(repeat)
+    return {"meta": meta, "results": results}
+
+
+def _meta():
+    return {"python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__, "pandas": pd.__version__,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+
+
+def compare(baseline, current, tolerance=0.2):
+    """
+    Compares two benchmark results.
+
+    Parameters
+    -----------
+    baseline, current: `dict`
+        Results of `run`.
+    tolerance: `float`, optional
+        The relative slowdown or memory growth reported as a regression.
+
+    Returns
+    --------
+    list
+        The regressions, as (function, configuration, metric, baseline
+        value, current value) tuples.
+    """
+    def key(record):
+        return (record["function"], record["rows"], record["columns"],
+                record["na_density"], record["cardinality"])
+
+    old = {key(record): record for record in baseline["results"]
+           if record["status"] == "ok"}
+    regressions = []
+    for record in current["results"]:
+        if record["status"] != "ok" or key(record) not in old:
+            continue
+        for metric in ["wall_seconds", "peak_bytes"]:
+            before, after = old[key(record)][metric], record[metric]
+            if after > before * (1 + tolerance):
+                regressions.append((record["function"], key(record)[1:],
+                                    metric, before, after))
+
+    old_imports = baseline["meta"].get("import_seconds", {})
+    for name, after in current["meta"].get("import_seconds", {}).items():
+        before = old_imports.get(name)
+        if before is not None and after > before * (1 + tolerance):
+            regressions.append(("import", name, "import_seconds", before,
+                                after))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=ROWS)
+    parser.add_argument("--columns", type=int, nargs="+", default=COLUMNS)
+    parser.add_argument("--na-densities", type=float, nargs="+",
+                        default=NA_DENSITIES)
+    parser.add_argument("--cardinalities", type=int, nargs="+",
+                        default=CARDINALITIES)
+    parser.add_argument("--functions", nargs="+", default=FUNCTIONS,
+                        choices=FUNCTIONS)
+    parser.add_argument("--max-cells", type=int, default=10 ** 7)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmarks.json")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "NEW"),
+                        help="compare two result files instead of running")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as file:
+            baseline = json.load(file)
+        with open(args.compare[1]) as file:
+            current = json.load(file)
+        regressions = compare(baseline, current, args.tolerance)
+        for function, config, metric, before, after in regressions:
+            print("{} {}: {} {:.4g} -> {:.4g}".format(
+                function, config, metric, before, after))
+        return 1 if regressions else 0
+
+    results = run(args.rows, args.columns, args.na_densities,
+                  args.cardinalities, args.functions, args.max_cells,
+                  args.repeat, log=print)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
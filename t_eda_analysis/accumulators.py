@@ -0,0 +1,799 @@
+import numpy as np
+import pandas as pd
+
+from t_eda_analysis import t_eda_analysis as eda
+from t_eda_analysis.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+class NACounts:
+    """
+    Mergeable count of the NA values in each column.
+
+    Examples
+    ---------
+    >>> na = NACounts()
+    >>> for chunk in pandas.read_csv("data.csv", chunksize=100000):
+    ...     na.update(chunk)
+    >>> na.result()
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self.columns = []
+        self.counts = {}
+
+    def update(self, dataframe):
+        """
+        Adds the NA values of a chunk of rows.
+
+        Parameters
+        -----------
+        dataframe: `pandas.DataFrame`
+            A chunk of rows.
+
+        Returns
+        --------
+        `NACounts`
+            The updated accumulator.
+        """
+        # Uncached, as a chunk is counted only once
+        na_counts = eda._na_counts(dataframe)
+        self.n_rows += len(dataframe)
+        for item, count in na_counts.items():
+            self._add(item, int(count))
+        return self
+
+    def merge(self, other):
+        """
+        Adds the NA values counted by another accumulator.
+
+        Parameters
+        -----------
+        other: `NACounts`
+            The accumulator to merge into this one.
+
+        Returns
+        --------
+        `NACounts`
+            The updated accumulator.
+        """
+        self.n_rows += other.n_rows
+        for item in other.columns:
+            self._add(item, other.counts[item])
+        return self
+
+    def _add(self, item, count):
+        if item not in self.counts:
+            self.columns.append(item)
+            self.counts[item] = 0
+        self.counts[item] += count
+
+    def result(self):
+        """
+        Returns
+        --------
+        `pandas.Series`
+            The number of NA values in each column, indexed by column name.
+        """
+        return pd.Series([self.counts[item] for item in self.columns],
+                         index=self.columns, dtype=np.int64,
+                         name=eda._NA_COUNT_NAME)
+
+
+class Moments:
+    """
+    Mergeable count, minimum, maximum, mean and sum of squared deviations
+    of the columns of numeric blocks, merged with the parallel variant of
+    Welford's algorithm (Chan et al.).
+
+    Parameters
+    -----------
+    n_vars: `int`
+        The number of columns of the blocks.
+    """
+
+    def __init__(self, n_vars):
+        self.count = np.zeros(n_vars, dtype=np.int64)
+        self.mean = np.zeros(n_vars)
+        self.m2 = np.zeros(n_vars)
+        self.min = np.full(n_vars, np.nan)
+        self.max = np.full(n_vars, np.nan)
+
+    def update(self, block):
+        """
+        Adds a rows x variables float array, NaN marking missing values.
+
+        Returns
+        --------
+        `Moments`
+            The updated accumulator.
+        """
+        other = Moments(block.shape[1])
+        mask = np.isnan(block)
+        other.count = block.shape[0] - np.count_nonzero(mask, axis=0)
+        seen = other.count > 0
+        filled = np.where(mask, 0.0, block)
+        other.mean[seen] = filled[:, seen].sum(axis=0) / other.count[seen]
+        filled -= other.mean
+        filled[mask] = 0.0
+        other.m2 = np.einsum("ij,ij->j", filled, filled)
+        if block.shape[0]:
+            other.min[seen] = np.nanmin(block[:, seen], axis=0)
+            other.max[seen] = np.nanmax(block[:, seen], axis=0)
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Adds the values summarised by another accumulator.
+
+        Returns
+        --------
+        `Moments`
+            The updated accumulator.
+        """
+        count = self.count + other.count
+        seen = count > 0
+        delta = other.mean - self.mean
+        weight = np.zeros_like(self.mean)
+        weight[seen] = other.count[seen] / count[seen]
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * weight
+        self.count = count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        return self
+
+    def std(self):
+        """
+        Returns
+        --------
+        `numpy.ndarray`
+            The population standard deviation of each column, like
+            `numpy.nanstd`.
+        """
+        std = np.full(len(self.count), np.nan)
+        seen = self.count > 0
+        std[seen] = np.sqrt(self.m2[seen] / self.count[seen])
+        return std
+
+
+class Histograms:
+    """
+    Mergeable histograms of the columns of numeric blocks. The bins of a
+    column have a width of a power of two and start at a multiple of that
+    width, so histograms built on different chunks can always be aligned:
+    whenever the values span more than `bins` bins, the width is doubled
+    by merging pairs of neighbouring bins.
+
+    Parameters
+    -----------
+    n_vars: `int`
+        The number of columns of the blocks.
+    bins: `int`, optional
+        The maximum number of bins of each column, the values of a column
+        end up in between bins / 2 and bins bins.
+    """
+
+    def __init__(self, n_vars, bins=30):
+        self.bins = bins
+        self.exponent = [None] * n_vars
+        self.start = [0] * n_vars
+        self.counts = [np.zeros(0, dtype=np.int64) for _ in range(n_vars)]
+
+    def update(self, block):
+        """
+        Adds a rows x variables float array, NaN marking missing values.
+
+        Returns
+        --------
+        `Histograms`
+            The updated accumulator.
+        """
+        for j in range(block.shape[1]):
+            values = block[:, j]
+            values = values[np.isfinite(values)]
+            if not len(values):
+                continue
+            lo, hi = values.min(), values.max()
+            if self.exponent[j] is None:
+                self.exponent[j] = self._initial_exponent(lo, hi)
+            self._extend(j, lo, hi)
+            width = 2.0 ** self.exponent[j]
+            index = np.floor(values / width).astype(np.int64) - self.start[j]
+            self.counts[j] += np.bincount(index,
+                                          minlength=len(self.counts[j]))
+        return self
+
+    def merge(self, other):
+        """
+        Adds the values binned by another accumulator.
+
+        Returns
+        --------
+        `Histograms`
+            The updated accumulator.
+        """
+        for j in range(len(self.counts)):
+            if other.exponent[j] is None:
+                continue
+            exponent = other.exponent[j]
+            start, counts = other.start[j], other.counts[j]
+            if self.exponent[j] is None:
+                self.exponent[j] = exponent
+                self.start[j], self.counts[j] = start, counts.copy()
+                continue
+
+            # Bring both histograms to the same bin width, covering the
+            # bins of both
+            while True:
+                while exponent < self.exponent[j]:
+                    start, counts = _coarsen(start, counts)
+                    exponent += 1
+                while self.exponent[j] < exponent:
+                    self._coarsen(j)
+                width = 2.0 ** exponent
+                self._extend(j, start * width,
+                             (start + len(counts) - 1) * width)
+                if self.exponent[j] == exponent:
+                    break
+
+            offset = start - self.start[j]
+            self.counts[j][offset:offset + len(counts)] += counts
+        return self
+
+    def _initial_exponent(self, lo, hi):
+        if hi > lo:
+            return int(np.ceil(np.log2((hi - lo) / self.bins)))
+        if lo != 0:
+            return int(np.floor(np.log2(abs(lo)))) - 10
+        return 0
+
+    def _extend(self, j, lo, hi):
+        # Grow the bins of column j to cover [lo, hi], coarsening them until
+        # the range fits in the maximum number of bins
+        while True:
+            width = 2.0 ** self.exponent[j]
+            first, last = int(np.floor(lo / width)), int(np.floor(hi / width))
+            if len(self.counts[j]):
+                first = min(first, self.start[j])
+                last = max(last, self.start[j] + len(self.counts[j]) - 1)
+            if last - first < self.bins:
+                break
+            self._coarsen(j)
+
+        counts = np.zeros(last - first + 1, dtype=np.int64)
+        offset = self.start[j] - first
+        counts[offset:offset + len(self.counts[j])] = self.counts[j]
+        self.start[j], self.counts[j] = first, counts
+
+    def _coarsen(self, j):
+        self.start[j], self.counts[j] = _coarsen(self.start[j],
+                                                 self.counts[j])
+        self.exponent[j] += 1
+
+    def table(self, num_vars):
+        """
+        Formats the histograms like `describe_num_var`.
+
+        Parameters
+        -----------
+        num_vars: `list`
+            The names of the columns.
+
+        Returns
+        --------
+        `pandas.DataFrame`
+            A dataframe with the columns 'variable', 'value' (bin start),
+            'value_end' (bin end) and 'count'.
+        """
+        tables = []
+        for j, item in enumerate(num_vars):
+            if self.exponent[j] is None:
+                continue
+            width = 2.0 ** self.exponent[j]
+            edges = (self.start[j] + np.arange(len(self.counts[j]) + 1)) \
+                * width
+            tables.append(pd.DataFrame({"variable": item,
+                                        "value": edges[:-1],
+                                        "value_end": edges[1:],
+                                        "count": self.counts[j]}))
+        return eda._hist_frame(tables)
+
+
+def _coarsen(start, counts):
+    """
+    Merges pairs of neighbouring power of two bins.
+    """
+    new_start = start // 2
+    index = (start + np.arange(len(counts))) // 2 - new_start
+    return new_start, np.bincount(index, weights=counts,
+                                  minlength=index[-1] + 1 if len(index)
+                                  else 0).astype(np.int64)
+
+
+class Quantiles:
+    """
+    Mergeable approximate quantiles of the columns of numeric blocks, one
+    `KLLSketch` per column.
+
+    Parameters
+    -----------
+    n_vars: `int`
+        The number of columns of the blocks.
+    error: `float`, optional
+        The target rank error of the sketches.
+    seed: `int`, optional
+        The seed of the sketches, see `KLLSketch`.
+    """
+
+    def __init__(self, n_vars, error=0.01, seed=0):
+        self.sketches = [KLLSketch(error, seed) for _ in range(n_vars)]
+
+    def update(self, block):
+        """
+        Adds a rows x variables float array, NaN marking missing values.
+
+        Returns
+        --------
+        `Quantiles`
+            The updated accumulator.
+        """
+        for j, sketch in enumerate(self.sketches):
+            sketch.update(block[:, j])
+        return self
+
+    def merge(self, other):
+        """
+        Adds the values summarised by another accumulator.
+
+        Returns
+        --------
+        `Quantiles`
+            The updated accumulator.
+        """
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+        return self
+
+    def quantile(self, q):
+        """
+        Returns
+        --------
+        `numpy.ndarray`
+            The estimated q quantile of each column.
+        """
+        return np.array([sketch.quantile(q) for sketch in self.sketches])
+
+
+def _summary_frame(moments, quantiles, num_vars):
+    """
+    Formats the moments and the quantile sketches of the numerical
+    variables like the summary of `describe_num_var`, the quantiles and
+    median being listed in `summary.attrs["approximate"]`.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        The statistical summary, NaN for the variables without value.
+    """
+    seen = moments.count > 0
+    rows = {"25%": quantiles.quantile(0.25), "75%": quantiles.quantile(0.75),
+            "min": moments.min, "max": moments.max,
+            "median": quantiles.quantile(0.5), "mean": moments.mean,
+            "sd": moments.std()}
+    summary = np.full((len(eda._SUMMARY_INDEX), len(num_vars)), np.nan)
+    for i, row in enumerate(eda._SUMMARY_INDEX):
+        summary[i, seen] = rows[row][seen]
+    summary = pd.DataFrame(summary, index=eda._SUMMARY_INDEX,
+                           columns=num_vars)
+    summary.attrs["approximate"] = list(eda._QUANTILE_ROWS)
+    return summary
+
+
+class CategoryCounts:
+    """
+    Mergeable counts of the categories of categorical variables, NA values
+    dropped separately for each variable. The categories of a variable are
+    counted exactly until it has more than `max_distinct` of them. From
+    then on its number of distinct categories is estimated with a
+    `HyperLogLog` sketch and only its most frequent categories are counted
+    with a `SpaceSaving` sketch, so the memory stays bounded.
+
+    Parameters
+    -----------
+    cat_vars: `list`
+        A list containing names of categorical variables.
+    max_distinct: `int`, optional
+        The number of distinct categories above which a variable is
+        sketched, the cap of `describe_cat_var` by default.
+    capacity: `int`, optional
+        The number of categories counted by the heavy hitters sketches.
+    """
+
+    def __init__(self, cat_vars, max_distinct=eda._MAX_DISTINCT,
+                 capacity=1000):
+        self.cat_vars = list(cat_vars)
+        self.max_distinct = max_distinct
+        self.capacity = capacity
+        self.counts = {item: pd.Series([], dtype=np.int64)
+                       for item in self.cat_vars}
+        self.distinct = {}
+        self.heavy_hitters = {}
+
+    def update(self, dataframe):
+        """
+        Adds the categories of a chunk of rows.
+
+        Returns
+        --------
+        `CategoryCounts`
+            The updated accumulator.
+        """
+        for item in self.cat_vars:
+            self._add(item, dataframe[item].value_counts(dropna=True))
+        return self
+
+    def merge(self, other):
+        """
+        Adds the categories counted by another accumulator.
+
+        Returns
+        --------
+        `CategoryCounts`
+            The updated accumulator.
+        """
+        for item in self.cat_vars:
+            if item in other.heavy_hitters:
+                if item not in self.heavy_hitters:
+                    self._sketch(item)
+                self.distinct[item].merge(other.distinct[item])
+                self.heavy_hitters[item].merge(other.heavy_hitters[item])
+            else:
+                self._add(item, other.counts[item])
+        return self
+
+    def _add(self, item, counts):
+        if item in self.heavy_hitters:
+            self.distinct[item].update(counts.index.to_numpy())
+            self.heavy_hitters[item].update_counts(counts)
+            return
+
+        counts = pd.Series(counts.to_numpy(),
+                           index=counts.index.astype(object))
+        self.counts[item] = self.counts[item].add(
+            counts, fill_value=0).astype(np.int64)
+        if len(self.counts[item]) > self.max_distinct:
+            self._sketch(item)
+
+    def _sketch(self, item):
+        counts = self.counts.pop(item)
+        self.distinct[item] = HyperLogLog().update(counts.index.to_numpy())
+        self.heavy_hitters[item] = SpaceSaving(self.capacity)
+        self.heavy_hitters[item].update_counts(counts)
+
+    def distinct_counts(self):
+        """
+        Returns
+        --------
+        `pandas.Series`
+            The number of distinct categories of each variable, estimated
+            for the sketched variables.
+        """
+        return pd.Series([self.distinct[item].estimate()
+                          if item in self.distinct
+                          else float(len(self.counts[item]))
+                          for item in self.cat_vars], index=self.cat_vars)
+
+    def table(self, top_k=None):
+        """
+        Formats the counts like `describe_cat_var`.
+
+        Parameters
+        -----------
+        top_k: `int`, optional
+            If given, keep the top_k most frequent categories of each
+            variable and sum the remaining ones into an "Other" category.
+            The sketched variables always keep their top_k (by default 20)
+            categories.
+
+        Returns
+        --------
+        `pandas.DataFrame`
+            A dataframe with the columns 'variable', 'category' and
+            'count'. The estimated number of distinct categories of the
+            sketched variables is kept in `table.attrs["distinct"]`.
+        """
+        value_counts = []
+        for item in self.cat_vars:
+            if item in self.heavy_hitters:
+                heavy_hitters = self.heavy_hitters[item]
+                counts = eda._top_counts(
+                    eda._sort_counts(heavy_hitters.counts),
+                    top_k or eda._HIGH_CARDINALITY_TOP_K,
+                    heavy_hitters.n_values)
+            else:
+                counts = eda._top_counts(
+                    eda._sort_counts(self.counts[item]), top_k)
+            value_counts.append((item, counts))
+
+        table = eda._count_table(value_counts)
+        table.attrs["distinct"] = {item: self.distinct[item].estimate()
+                                   for item in self.heavy_hitters}
+        return table
+
+
+class CoMoments:
+    """
+    Mergeable means and co-moment matrix of the rows of numeric blocks
+    without NA values, from which the correlation matrix of `calc_cor` is
+    derived.
+
+    Parameters
+    -----------
+    n_vars: `int`
+        The number of columns of the blocks.
+    """
+
+    def __init__(self, n_vars):
+        self.count = 0
+        self.mean = np.zeros(n_vars)
+        self.comoment = np.zeros((n_vars, n_vars))
+
+    def update(self, block):
+        """
+        Adds the rows without NA values of a rows x variables float array.
+
+        Returns
+        --------
+        `CoMoments`
+            The updated accumulator.
+        """
+        other = CoMoments(block.shape[1])
+        rows = block[~np.isnan(block).any(axis=1)]
+        other.count = len(rows)
+        if other.count:
+            other.mean = rows.mean(axis=0)
+            rows = rows - other.mean
+            other.comoment = rows.T @ rows
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Adds the rows summarised by another accumulator.
+
+        Returns
+        --------
+        `CoMoments`
+            The updated accumulator.
+        """
+        count = self.count + other.count
+        if not other.count:
+            return self
+        delta = other.mean - self.mean
+        weight = other.count / count
+        self.mean = self.mean + delta * weight
+        self.comoment = self.comoment + other.comoment + \
+            np.outer(delta, delta) * self.count * weight
+        self.count = count
+        return self
+
+    def corr(self):
+        """
+        Returns
+        --------
+        `numpy.ndarray`
+            The Pearson correlation matrix, NaN for constant variables.
+        """
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.comoment / np.outer(scale, scale)
+        corr[:, scale == 0] = np.nan
+        corr[scale == 0, :] = np.nan
+        return np.clip(corr, -1, 1)
+
+
+class ReportAccumulator:
+    """
+    Mergeable statistics behind `generate_report`, built one chunk of rows
+    at a time: the NA counts of every column, the moments, histograms and
+    correlation of the numeric variables and the category counts of the
+    categorical variables.
+
+    Parameters
+    -----------
+    cat_vars: `list`
+        A list containing names of categorical variables.
+    num_vars: `list`
+        A list containing names of numerical variables.
+    bins: `int`, optional
+        The maximum number of histogram bins of each numerical variable.
+    quantile_error: `float`, optional
+        The target rank error of the quantile sketches.
+    max_distinct: `int`, optional
+        The number of distinct categories above which a categorical
+        variable is sketched, see `CategoryCounts`.
+
+    Examples
+    ---------
+    >>> acc = ReportAccumulator(['type'], ['height'])
+    >>> for chunk in pandas.read_csv("data.csv", chunksize=100000):
+    ...     acc.update(chunk)
+    >>> summary = acc.num_summary()
+    """
+
+    def __init__(self, cat_vars, num_vars, bins=30, quantile_error=0.01,
+                 max_distinct=eda._MAX_DISTINCT):
+        _check_vars(cat_vars, 'cat_vars')
+        _check_vars(num_vars, 'num_vars')
+        if not isinstance(bins, int) or bins <= 1:
+            raise Exception("The value of the argument 'bins' " +
+                            "should be an integer greater than 1.")
+
+        self.cat_vars = list(cat_vars)
+        self.num_vars = list(num_vars)
+        self.na = NACounts()
+        self.categories = CategoryCounts(cat_vars, max_distinct)
+        self.moments = Moments(len(num_vars))
+        self.histograms = Histograms(len(num_vars), bins)
+        self.comoments = CoMoments(len(num_vars))
+        self.quantiles = Quantiles(len(num_vars), quantile_error)
+
+    @property
+    def n_rows(self):
+        return self.na.n_rows
+
+    def update(self, dataframe):
+        """
+        Adds a chunk of rows.
+
+        Parameters
+        -----------
+        dataframe: `pandas.DataFrame`
+            A chunk of rows holding at least `cat_vars` and `num_vars`.
+
+        Returns
+        --------
+        `ReportAccumulator`
+            The updated accumulator.
+        """
+        if not isinstance(dataframe, pd.DataFrame):
+            raise Exception("The value of the argument 'dataframe' " +
+                            "should be of type pandas dataframe.")
+
+        if not all(item in dataframe.columns
+                   for item in self.cat_vars + self.num_vars):
+            raise Exception("The variables should be a subset of the " +
+                            "column names from the dataframe.")
+
+        if not all(eda._is_numeric(dataframe[item].dtype)
+                   for item in self.num_vars):
+            raise Exception("Only numeric columns expected, please " +
+                            "check the input.")
+
+        block = eda._numeric_block(dataframe, self.num_vars)
+        self.na.update(dataframe)
+        self.categories.update(dataframe)
+        self.moments.update(block)
+        self.histograms.update(block)
+        self.comoments.update(block)
+        self.quantiles.update(block)
+        return self
+
+    def merge(self, other):
+        """
+        Adds the rows summarised by another accumulator of the same
+        variables.
+
+        Returns
+        --------
+        `ReportAccumulator`
+            The updated accumulator.
+        """
+        if other.cat_vars != self.cat_vars or \
+                other.num_vars != self.num_vars:
+            raise Exception("Only accumulators of the same variables " +
+                            "can be merged.")
+
+        self.na.merge(other.na)
+        self.categories.merge(other.categories)
+        self.moments.merge(other.moments)
+        self.histograms.merge(other.histograms)
+        self.comoments.merge(other.comoments)
+        self.quantiles.merge(other.quantiles)
+        return self
+
+    def na_counts(self):
+        """
+        Returns
+        --------
+        `pandas.Series`
+            The number of NA values in each column, like `count_na_values`.
+        """
+        return self.na.result()
+
+    def num_summary(self):
+        """
+        Returns
+        --------
+        `pandas.DataFrame`
+            The statistical summary of the numerical variables, like
+            `describe_num_var`. The quantiles and median are estimated
+            from the sketches, as listed in `summary.attrs["approximate"]`.
+        """
+        return _summary_frame(self.moments, self.quantiles, self.num_vars)
+
+    def hist_table(self):
+        """
+        Returns
+        --------
+        `pandas.DataFrame`
+            The histogram bins of the numerical variables, like the data
+            of the `describe_num_var` plot.
+        """
+        return self.histograms.table(self.num_vars)
+
+    def cat_table(self, top_k=None):
+        """
+        Returns
+        --------
+        `pandas.DataFrame`
+            The category counts of the categorical variables, like the data
+            of the `describe_cat_var` plot.
+        """
+        return self.categories.table(top_k)
+
+    def corr_table(self):
+        """
+        Returns
+        --------
+        `pandas.DataFrame`
+            The long-form correlation table of the numerical variables on
+            the rows without NA values, like `calc_cor`.
+        """
+        corr = pd.DataFrame(self.comoments.corr(), index=self.num_vars,
+                            columns=self.num_vars)
+        return eda._corr_table(corr)
+
+    def cat_chart(self, n_cols=3, top_k=None):
+        """
+        Returns
+        --------
+        `altair`
+            The histograms of the categorical variables, like
+            `describe_cat_var`.
+        """
+        return eda._cat_chart(self.cat_table(top_k), self.cat_vars, n_cols,
+                              top_k)
+
+    def num_chart(self):
+        """
+        Returns
+        --------
+        `altair`
+            The histograms of the numerical variables, like
+            `describe_num_var`.
+        """
+        return eda._num_chart(self.hist_table(), independent=True)
+
+    def corr_chart(self):
+        """
+        Returns
+        --------
+        `altair`
+            The correlogram of the numerical variables, like `calc_cor`.
+        """
+        return eda._corr_chart(self.corr_table())
+
+
+def _check_vars(variables, name):
+    """
+    Checks a list of variable names.
+    """
+    if not (isinstance(variables, list) and
+            all(isinstance(item, str) for item in variables)):
+        raise Exception("The value of the argument '" + name + "' " +
+                        "should be a list of strings.")
+
+    if len(variables) != len(set(variables)):
+        raise Exception("The elements in the argument '" + name + "' " +
+                        "should be unique.")
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+
+from t_eda_analysis import t_eda_analysis as eda
+from t_eda_analysis.accumulators import (CoMoments, Moments, Quantiles,
+                                         _summary_frame)
+
+# The number of bytes of a row block, small enough to stay in the caches
+# of the CPU and large enough to amortize the per block overhead
+_BLOCK_BYTES = 2 ** 22
+
+
+def describe_array(array, num_vars, bins=30, bin_strategy="shared",
+                   quantile_error=None, seed=0):
+    """
+    Summarizes and bins the columns of a 2d numeric array, such as a
+    `numpy.memmap` or the result of `numpy.load(path, mmap_mode='r')`,
+    without copying it. The array is walked in blocks of rows, once for
+    the moments, extremes and quantile sketches and once for the
+    histograms, so a memory-mapped file is only paged in by the operating
+    system.
+
+    Parameters
+    -----------
+    array: `numpy.ndarray`
+        A rows x variables numeric array, NaN marking missing values.
+    num_vars: `list`
+        The names of the columns of the array.
+    bins: `int`, optional
+        The number of histogram bins of each column.
+    bin_strategy: `str`, optional
+        "shared" (default) or "per_column", see `describe_num_var`.
+    quantile_error: `float`, optional
+        The rank error of the KLL sketches estimating the quantiles and
+        median, 0.01 by default as the exact quantiles would need a copy
+        of each column.
+    seed: `int`, optional
+        The seed of the KLL sketches, fixed so that the same array gives
+        the same estimates.
+
+    Returns
+    --------
+    tuple
+        The statistical summary as a `pandas.DataFrame` and the long-form
+        table of bin counts, like `tables.num_summary`.
+    """
+    n_vars = array.shape[1]
+    moments = Moments(n_vars)
+    quantiles = Quantiles(n_vars, quantile_error or 0.01, seed)
+    for block in iter_blocks(array):
+        moments.update(block)
+        quantiles.update(block)
+
+    summary = _summary_frame(moments, quantiles, num_vars)
+
+    # The ranges are known, so the bins are counted in a second pass
+    ranges = eda._bin_ranges(np.where(moments.count > 0, moments.min, np.nan),
+                             moments.max, bin_strategy,
+                             lambda j: _finite_range(array, j))
+    counts = np.zeros((n_vars, bins), dtype=np.int64)
+    for block in iter_blocks(array):
+        for j, bin_range in enumerate(ranges):
+            if bin_range is not None:
+                values = block[:, j]
+                counts[j] += np.histogram(values[np.isfinite(values)], bins,
+                                          bin_range)[0]
+
+    return summary, eda._bin_table(num_vars, counts, ranges, bins)
+
+
+def array_corr(array, num_vars):
+    """
+    Computes the long-form correlation table of `calc_cor` for the columns
+    of a 2d numeric array over its rows without NA values, accumulating the
+    cross-products of blocks of rows.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        The long-form correlation table with the columns 'Var1', 'Var2'
+        and 'Corr'.
+    """
+    comoments = CoMoments(array.shape[1])
+    for block in iter_blocks(array):
+        comoments.update(block)
+    corr = comoments.corr()
+    diagonal = np.diag(corr).copy()
+    diagonal[~np.isnan(diagonal)] = 1.0
+    np.fill_diagonal(corr, diagonal)
+    return eda._corr_table(pd.DataFrame(corr, index=num_vars,
+                                        columns=num_vars))
+
+
+def _finite_range(array, j):
+    """
+    Returns
+    --------
+    tuple
+        The minimum and maximum of the finite values of the column j of an
+        array, None if there is none.
+    """
+    ranges = [eda._finite_range(block[:, j]) for block in iter_blocks(array)]
+    ranges = [bin_range for bin_range in ranges if bin_range is not None]
+    if not ranges:
+        return None
+    return min(low for low, _ in ranges), max(high for _, high in ranges)
+
+
+def iter_blocks(array, block_bytes=None):
+    """
+    Iterates over the blocks of rows of a 2d array as float64 arrays, of
+    `block_bytes` bytes (by default `_BLOCK_BYTES`). The blocks of a
+    C-ordered float64 array are views, the other ones are converted one
+    block at a time.
+    """
+    if block_bytes is None:
+        block_bytes = _BLOCK_BYTES
+    n_rows, n_vars = array.shape
+    block_rows = max(block_bytes // (8 * max(n_vars, 1)), 1)
+    for start in range(0, n_rows, block_rows):
+        yield np.asarray(array[start:start + block_rows], dtype=np.float64)
+
+
+def check_array(array, num_vars):
+    """
+    Checks a 2d numeric array and the names of its columns.
+    """
+    if array.ndim != 2 or not np.issubdtype(array.dtype, np.number):
+        raise Exception("The value of the argument 'dataframe' should be " +
+                        "a pandas dataframe or a 2d numeric array.")
+
+    if not (isinstance(num_vars, list) and
+            all(isinstance(item, str) for item in num_vars)):
+        raise Exception("The value of the argument 'num_vars' " +
+                        "should be a list of strings.")
+
+    if len(num_vars) != len(set(num_vars)):
+        raise Exception("The elements in the argument 'num_vars' " +
+                        "should be unique.")
+
+    if len(num_vars) != array.shape[1]:
+        raise Exception("The argument 'num_vars' should name every " +
+                        "column of the array.")
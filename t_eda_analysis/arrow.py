@@ -0,0 +1,404 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from t_eda_analysis import t_eda_analysis as eda
+from t_eda_analysis.accumulators import (Moments, Quantiles, _check_vars,
+                                         _summary_frame)
+
+_STATS_COLUMNS = ["rows", "na_count", "min", "max"]
+
+
+def column_stats(source, columns=None):
+    """
+    Counts the rows and the NA values, and finds the minimum and maximum of
+    the columns of a Parquet file or an Arrow table without converting it
+    to pandas. For a Parquet file they are read from the statistics of the
+    row groups in the file footer, and only the columns written without
+    statistics are decoded, in batches. For an Arrow table the NA counts
+    are read from the validity buffers and the extremes are computed with
+    the Arrow compute kernels.
+
+    Parameters
+    -----------
+    source: `str` or `pyarrow.Table`
+        The path of a Parquet file or an Arrow table, see the optional
+        dependency `pyarrow`.
+    columns: `list`, optional
+        The columns to describe, all of them by default.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        The number of 'rows', the 'na_count' and the 'min' and 'max' of
+        each column, indexed by column name. The columns whose values had
+        to be scanned are listed in `stats.attrs["read_columns"]`.
+
+    Examples
+    ---------
+    >>> from t_eda_analysis import arrow
+    >>> arrow.column_stats("data.parquet", ['height', 'width'])
+    """
+    pa, pc, pq = _import_pyarrow()
+    source, schema = _open(source)
+    columns = _check_columns(schema, columns, "columns")
+
+    stats = pd.DataFrame(index=pd.Index(columns, dtype=object),
+                         columns=_STATS_COLUMNS, dtype=object)
+    if isinstance(source, pa.Table):
+        for item in columns:
+            col = source.column(item)
+            stats.loc[item] = [len(col), col.null_count] + \
+                _min_max(pc, col)
+        stats.attrs["read_columns"] = list(columns)
+        return _typed_stats(stats)
+
+    metadata = source.metadata
+    leaves = {metadata.schema.column(i).path: i
+              for i in range(metadata.num_columns)}
+    read = []
+    for item in columns:
+        found = _footer_stats(metadata, leaves.get(item))
+        if found is None:
+            read.append(item)
+        else:
+            stats.loc[item] = [metadata.num_rows] + found
+
+    if read:
+        # The columns without statistics are decoded, in batches
+        partial = {item: [0, 0, None, None] for item in read}
+        for batch in source.iter_batches(columns=read):
+            for item in read:
+                col = batch.column(item)
+                low, high = _min_max(pc, col)
+                entry = partial[item]
+                entry[0] += len(col)
+                entry[1] += col.null_count
+                entry[2] = _fold(min, entry[2], low)
+                entry[3] = _fold(max, entry[3], high)
+        for item in read:
+            stats.loc[item] = partial[item]
+
+    stats.attrs["read_columns"] = read
+    return _typed_stats(stats)
+
+
+def count_na_values(source, columns=None, batch_size=65536):
+    """
+    Counts the NA values in each column of a Parquet file or an Arrow
+    table, like `count_na_values`. The null values are counted from the
+    Parquet statistics, the data pages of a file written with statistics
+    being never read, see `column_stats`. The NaN values of the floating
+    columns, which are NA for pandas but not null for Arrow, are counted
+    too, decoding only those columns in batches of `batch_size` rows.
+
+    Returns
+    --------
+    `pandas.Series`
+        The number of NA values in each column, indexed by column name.
+    """
+    pa, pc, pq = _import_pyarrow()
+    source, schema = _open(source)
+    stats = column_stats(source, columns)
+    na_counts = pd.Series(stats["na_count"].to_numpy(dtype=np.int64),
+                          index=stats.index, name=eda._NA_COUNT_NAME)
+
+    floats = [item for item in stats.index
+              if pa.types.is_floating(schema.field(item).type)]
+    if floats:
+        for batch in _batches(source, floats, batch_size):
+            for item in floats:
+                nans = pc.sum(pc.is_nan(batch.column(item))).as_py()
+                na_counts[item] += nans or 0
+    return na_counts
+
+
+def category_counts(source, cat_vars, top_k=None,
+                    max_distinct=eda._MAX_DISTINCT, batch_size=65536):
+    """
+    Counts the categories of the categorical variables of a Parquet file
+    or an Arrow table, like `tables.category_counts`. Only the columns of
+    `cat_vars` are decoded, in batches, and counted with
+    `pyarrow.compute.value_counts`, so only the distinct categories are
+    converted to pandas.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        The long-form counts with the columns 'variable', 'category' and
+        'count'.
+    """
+    pa, pc, pq = _import_pyarrow()
+    source, schema = _open(source)
+    _check_vars(cat_vars, "cat_vars")
+    _check_columns(schema, cat_vars, "cat_vars")
+
+    totals = [pd.Series([], dtype=np.int64) for _ in cat_vars]
+    for batch in _batches(source, cat_vars, batch_size):
+        for j, item in enumerate(cat_vars):
+            col = pc.drop_null(batch.column(item))
+            if pa.types.is_floating(col.type):
+                # NaN is NA for pandas, not a category
+                col = pc.filter(col, pc.invert(pc.is_nan(col)))
+            counts = pc.value_counts(col)
+            counts = pd.Series(
+                counts.field("counts").to_numpy(zero_copy_only=False),
+                index=counts.field("values").to_numpy(zero_copy_only=False))
+            totals[j] = totals[j].add(counts, fill_value=0)
+
+    all_counts = [counts.astype(np.int64) for counts in totals]
+    return eda._category_table(cat_vars, all_counts, top_k, max_distinct)
+
+
+def num_summary(source, num_vars, bins=30, bin_strategy="shared",
+                quantile_error=0.01, batch_size=65536, seed=0):
+    """
+    Summarizes and bins the numerical variables of a Parquet file or an
+    Arrow table, like `tables.num_summary`, decoding only the columns of
+    `num_vars`. The bin ranges come from `column_stats`, so the values
+    are binned as they are read. Only the finite values are binned, a
+    column with infinite extremes being read once more for the range of
+    its finite values.
+
+    Parameters
+    -----------
+    source: `str` or `pyarrow.Table`
+        The path of a Parquet file or an Arrow table.
+    num_vars: `list`
+        The names of the numerical variables.
+    bins: `int`, optional
+        The number of histogram bins of each numeric variable.
+    bin_strategy: `str`, optional
+        "shared" (default) or "per_column", see `describe_num_var`.
+    quantile_error: `float`, optional
+        The rank error of the estimated quantiles and median, the columns
+        being then read in batches of `batch_size` rows with a memory use
+        set by the batch size. None computes them exactly, reading one
+        whole column at a time.
+    batch_size: `int`, optional
+        The number of rows decoded at a time.
+    seed: `int`, optional
+        The seed of the KLL sketches, fixed so that the same data gives
+        the same estimates.
+
+    Returns
+    --------
+    tuple
+        The statistical summary as a `pandas.DataFrame`, and the long-form
+        bin counts with the columns 'variable', 'value', 'value_end' and
+        'count'.
+
+    Examples
+    ---------
+    >>> summary, bins = arrow.num_summary("data.parquet", ['height'])
+    """
+    pa, pc, pq = _import_pyarrow()
+    source, schema = _open(source)
+    _check_vars(num_vars, "num_vars")
+    _check_columns(schema, num_vars, "num_vars")
+    if not all(pa.types.is_integer(schema.field(item).type) or
+               pa.types.is_floating(schema.field(item).type)
+               for item in num_vars):
+        raise Exception("Only numeric columns expected, please " +
+                        "check the input.")
+
+    if not isinstance(bins, int) or bins <= 0:
+        raise Exception("The value of the argument 'bins' " +
+                        "should be a positive integer.")
+
+    if bin_strategy not in eda._BIN_STRATEGIES:
+        raise Exception("The value of the argument 'bin_strategy' " +
+                        "should be one of " +
+                        ", ".join(eda._BIN_STRATEGIES) + ".")
+
+    if quantile_error is not None and not 0 < quantile_error < 1:
+        raise Exception("The value of the argument 'quantile_error' " +
+                        "should be between 0 and 1.")
+
+    stats = column_stats(source, num_vars)
+    mins = stats["min"].to_numpy(dtype=np.float64)
+    maxs = stats["max"].to_numpy(dtype=np.float64)
+    ranges = eda._bin_ranges(
+        mins, maxs, bin_strategy,
+        lambda j: eda._finite_range(_float_values(
+            pa, _read_column(pa, source, num_vars[j]))))
+    hist_counts = [np.zeros(bins, dtype=np.int64) for _ in num_vars]
+
+    if quantile_error is None:
+        summary = np.full((len(eda._SUMMARY_INDEX), len(num_vars)), np.nan)
+        for j, item in enumerate(num_vars):
+            values = _float_values(pa, _read_column(pa, source, item))
+            summary[:, j] = eda._summarize_column(values)
+            _add_bins(hist_counts[j], values, bins, ranges[j])
+        summary = pd.DataFrame(summary, index=eda._SUMMARY_INDEX,
+                               columns=num_vars)
+        summary.attrs["approximate"] = []
+    else:
+        moments = Moments(len(num_vars))
+        quantiles = Quantiles(len(num_vars), quantile_error, seed)
+        for batch in _batches(source, num_vars, batch_size):
+            block = np.empty((batch.num_rows, len(num_vars)), order="F")
+            for j, item in enumerate(num_vars):
+                block[:, j] = _float_values(pa, batch.column(item))
+                _add_bins(hist_counts[j], block[:, j], bins, ranges[j])
+            moments.update(block)
+            quantiles.update(block)
+        summary = _summary_frame(moments, quantiles, num_vars)
+
+    return summary, eda._bin_table(num_vars, hist_counts, ranges, bins)
+
+
+def _import_pyarrow():
+    """
+    Imports the optional dependency `pyarrow`.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise Exception("Reading Parquet files and Arrow tables requires " +
+                        "the optional dependency 'pyarrow'.")
+    return pa, pc, pq
+
+
+def _open(source):
+    """
+    Opens a Parquet file, reading only its footer, or checks an opened
+    Parquet file or an Arrow table.
+
+    Returns
+    --------
+    tuple
+        The `pyarrow.parquet.ParquetFile` or `pyarrow.Table`, and its Arrow
+        schema.
+    """
+    pa, pc, pq = _import_pyarrow()
+    if isinstance(source, pa.Table):
+        return source, source.schema
+    if isinstance(source, pq.ParquetFile):
+        return source, source.schema_arrow
+    if isinstance(source, (str, os.PathLike)):
+        parquet_file = pq.ParquetFile(os.fspath(source))
+        return parquet_file, parquet_file.schema_arrow
+    raise Exception("The value of the argument 'source' should be the " +
+                    "path of a Parquet file or an Arrow table.")
+
+
+def _check_columns(schema, columns, name):
+    """
+    Checks the columns are in an Arrow schema, all of them by default.
+    """
+    if columns is None:
+        return list(schema.names)
+    _check_vars(columns, name)
+    if not all(item in schema.names for item in columns):
+        raise Exception("The argument '" + name + "' should be a subset " +
+                        "of the column names from the source.")
+    return columns
+
+
+def _batches(source, columns, batch_size):
+    """
+    Iterates over the record batches of some columns of a Parquet file or
+    an Arrow table.
+    """
+    if not isinstance(batch_size, int) or batch_size <= 0:
+        raise Exception("The value of the argument 'batch_size' " +
+                        "should be a positive integer.")
+    if hasattr(source, "iter_batches"):
+        return source.iter_batches(batch_size=batch_size, columns=columns)
+    return source.select(columns).to_batches(max_chunksize=batch_size)
+
+
+def _footer_stats(metadata, leaf):
+    """
+    Sums the NA counts and folds the extremes of the statistics of a column
+    over the row groups of a Parquet file.
+
+    Returns
+    --------
+    list
+        The NA count, minimum and maximum, None when a row group has no
+        statistics for the column.
+    """
+    if leaf is None:
+        return None
+    na_count, low, high = 0, None, None
+    for i in range(metadata.num_row_groups):
+        group = metadata.row_group(i)
+        column = group.column(leaf)
+        stats = column.statistics
+        if stats is None or not stats.has_null_count:
+            return None
+        na_count += stats.null_count
+        if stats.null_count == group.num_rows:
+            continue
+        if not stats.has_min_max:
+            return None
+        low = _fold(min, low, stats.min)
+        high = _fold(max, high, stats.max)
+    return [na_count, low, high]
+
+
+def _min_max(pc, array):
+    """
+    Returns
+    --------
+    list
+        The minimum and maximum of an Arrow array, None when it has no
+        value.
+    """
+    extremes = pc.min_max(array)
+    return [extremes["min"].as_py(), extremes["max"].as_py()]
+
+
+def _fold(func, current, value):
+    if value is None:
+        return current
+    if current is None:
+        return value
+    return func(current, value)
+
+
+def _typed_stats(stats):
+    """
+    Casts the counts of `column_stats` to integers.
+    """
+    stats["rows"] = stats["rows"].astype(np.int64)
+    stats["na_count"] = stats["na_count"].astype(np.int64)
+    return stats
+
+
+def _float_values(pa, array):
+    """
+    Converts an Arrow numeric array to float64 values, NaN marking the NA
+    values. A float64 array of one chunk without NA values is not copied.
+    """
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    # The null values are converted to NaN by to_numpy
+    return array.cast(pa.float64()).to_numpy(zero_copy_only=False)
+
+
+def _read_column(pa, source, item):
+    """
+    Returns
+    --------
+    `pyarrow.ChunkedArray`
+        A whole column of a Parquet file or an Arrow table.
+    """
+    if isinstance(source, pa.Table):
+        return source.column(item)
+    return source.read(columns=[item]).column(0)
+
+
+def _add_bins(counts, values, bins, bin_range):
+    """
+    Adds the finite values to the counts of bins of a fixed range.
+    """
+    if bin_range is None:
+        return
+    values = values[np.isfinite(values)]
+    counts += np.histogram(values, bins=bins, range=bin_range)[0]
@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+
+import pandas as pd
+
+from t_eda_analysis import cache
+from t_eda_analysis.report import EDAReport
+
+# The table of every chart, computed before it
+_CHARTS = {"cat_chart": "categories", "num_chart": "histograms",
+           "corr_chart": "correlation"}
+# The reports in progress, shared by the identical requests
+_running = {}
+
+
+async def report_sections(dataframe, cat_vars=None, num_vars=None,
+                          sample=None, charts=True, executor=None):
+    """
+    This function generates the EDA report of `generate_report` without
+    blocking the event loop. The stages run in the threads of an executor
+    and every section is yielded as soon as it is ready, so the first ones
+    arrive long before the report is complete. The identical requests made
+    while a report is in progress, for the same content and arguments,
+    share its computation.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe whose EDA analysis is to be performed.
+    cat_vars: `list`, optional
+        A list containing names of categorical variables, inferred if
+        omitted.
+    num_vars: `list`, optional
+        A list containing names of numerical variable, inferred if omitted.
+    sample: `int` or `sampling.Sample`, optional
+        If given, the sections are estimated from a sample of the rows, see
+        `generate_report`.
+    charts: `bool`, optional
+        Whether the charts are built and yielded after their tables.
+    executor: `concurrent.futures.ThreadPoolExecutor`, optional
+        The executor running the stages, the default executor of the event
+        loop if omitted. The sections share the report, so the executor
+        should run threads.
+
+    Yields
+    -------
+    tuple
+        The name and the value of every section in the order they are
+        ready: 'na_counts', 'categories', 'summary', 'histograms' and
+        'correlation', see `report.EDAReport`, then 'cat_chart',
+        'num_chart' and 'corr_chart' each after its table. The exception of
+        a section, or of invalid arguments, is raised when it is reached.
+
+    Examples
+    ---------
+    >>> async for name, section in report_sections(X, ['type'], ['height']):
+    ...     await publish(name, section)
+    """
+    if not isinstance(dataframe, pd.DataFrame):
+        raise Exception("The value of the argument 'dataframe' " +
+                        "should be of type pandas dataframe.")
+
+    loop = asyncio.get_running_loop()
+    # Hashing the content takes a pass over the data
+    key = await loop.run_in_executor(executor, _key, dataframe, cat_vars,
+                                     num_vars, sample, charts)
+    tasks = _running.get(key)
+    if tasks is None:
+        tasks = _start(loop, executor, dataframe, cat_vars, num_vars,
+                       sample, charts)
+        _running[key] = tasks
+        done = asyncio.gather(*tasks, return_exceptions=True)
+        done.add_done_callback(lambda _: _running.pop(key, None))
+
+    for section in asyncio.as_completed(tasks):
+        yield await section
+
+
+def _start(loop, executor, dataframe, cat_vars, num_vars, sample, charts):
+    """
+    Starts the stages of a report in the executor.
+
+    Returns
+    --------
+    list
+        The tasks of the sections, each returning its name and value.
+    """
+    report = loop.run_in_executor(executor, EDAReport, dataframe, cat_vars,
+                                  num_vars, 1, "thread", sample)
+
+    async def section(name, after=None):
+        if after is not None:
+            await after
+        value = await loop.run_in_executor(executor, getattr, await report,
+                                           name)
+        return name, value
+
+    tasks = {}
+    for name in ["na_counts", "categories", "summary", "correlation"]:
+        tasks[name] = loop.create_task(section(name))
+    # The histograms are computed along with the summary
+    tasks["histograms"] = loop.create_task(
+        section("histograms", tasks["summary"]))
+    if charts:
+        for name, table in _CHARTS.items():
+            tasks[name] = loop.create_task(section(name, tasks[table]))
+    return list(tasks.values())
+
+
+def _key(dataframe, cat_vars, num_vars, sample, charts):
+    """
+    Returns
+    --------
+    `str`
+        A digest of the content of a dataframe and the arguments of a
+        report.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr((cat_vars, num_vars, sample, charts)).encode())
+    digest.update(cache.fingerprint(dataframe).encode())
+    return digest.hexdigest()
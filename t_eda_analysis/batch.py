@@ -0,0 +1,344 @@
+import os
+import time
+import traceback
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from t_eda_analysis import parallel
+from t_eda_analysis.report import EDAReport
+
+_READERS = {".csv": pd.read_csv, ".parquet": pd.read_parquet,
+            ".pq": pd.read_parquet, ".pkl": pd.read_pickle,
+            ".pickle": pd.read_pickle}
+# The in-memory size of a table over the size of its file
+_EXPANSION = {".csv": 2, ".parquet": 5, ".pq": 5, ".pkl": 1, ".pickle": 1}
+# The memory of a report over the size of its table, for the numeric block,
+# the NA masks and the category counts
+_WORKING_FACTOR = 2
+_TABLES = ("na_counts", "categories", "summary", "histograms", "correlation")
+
+
+class TableResult:
+    """
+    The result of profiling a table with `profile_tables`.
+
+    Attributes
+    -----------
+    name: `str`
+        The name of the table.
+    cat_vars: `list`
+        The categorical variables, given or inferred.
+    num_vars: `list`
+        The numerical variables, given or inferred.
+    tables: `dict`
+        The tables of the report, 'na_counts', 'categories', 'summary',
+        'histograms' and 'correlation', see `report.EDAReport`, or None
+        when the table failed.
+    error: `Exception`
+        The exception raised while profiling the table, or None.
+    traceback: `str`
+        The formatted traceback of the error, or None.
+    seconds: `float`
+        The elapsed time of the table, reading it included.
+    output: `str`
+        The path of the HTML report of the table, or None.
+    """
+
+    def __init__(self, name, cat_vars, num_vars, tables, error, traceback,
+                 seconds, output):
+        self.name = name
+        self.cat_vars = cat_vars
+        self.num_vars = num_vars
+        self.tables = tables
+        self.error = error
+        self.traceback = traceback
+        self.seconds = seconds
+        self.output = output
+
+    @property
+    def ok(self):
+        """
+        `bool`: Whether the table was profiled successfully.
+        """
+        return self.error is None
+
+    def __repr__(self):
+        return "TableResult(name={!r}, ok={!r}, seconds={:.3f})".format(
+            self.name, self.ok, self.seconds)
+
+
+def profile_tables(sources, cat_vars=None, num_vars=None, n_jobs=-1,
+                   backend="process", max_memory="auto", sample=None,
+                   output_dir=None):
+    """
+    Profiles many dataframes or files, several at a time. The tables are
+    run on a bounded pool of workers, one table per worker, and are
+    admitted while their estimated memory fits in `max_memory`, the
+    largest tables first, so that large tables do not run concurrently
+    while the smaller tables fill the budget left. A table larger than the
+    budget runs alone. Every table gets its own
+    result, a failure being kept with its table instead of stopping the
+    batch. When a worker process dies, the pool is replaced and the tables
+    that were running are retried one at a time, so that only the table
+    killing its worker fails. Nothing is printed nor plotted.
+
+    Parameters
+    -----------
+    sources: `list` or `dict`
+        The dataframes or the paths of CSV, Parquet or pickle files, which
+        are read by the workers. A dict maps the names of the tables to
+        them, otherwise a table is named after its file, or 'table<i>'
+        for the i-th dataframe.
+    cat_vars: `list`, optional
+        The categorical variables of every table, inferred for each table
+        if omitted, see `inference.infer_column_types`.
+    num_vars: `list`, optional
+        The numerical variables of every table, inferred for each table if
+        omitted.
+    n_jobs: `int`, optional
+        The number of tables profiled at a time, -1 (default) for one per
+        core.
+    backend: `str`, optional
+        "process" (default) or "thread", the kind of workers. Processes
+        scale with the cores, and read the files themselves, while the
+        dataframes are pickled to them.
+    max_memory: `int`, optional
+        The memory budget in bytes of the tables running at a time. "auto"
+        (default) uses half of the physical memory where it is known, None
+        does not limit the memory. The memory of a dataframe is estimated
+        from its size and the one of a file from the size of the file.
+    sample: `int` or `sampling.Sample`, optional
+        If given, every report is estimated from a sample of the rows of
+        its table, see `generate_report`.
+    output_dir: `str`, optional
+        If given, the report of every table is also saved as
+        '<name>.html' in this directory, see `export.save_html`.
+
+    Returns
+    --------
+    list
+        A `TableResult` of every table, in the order of `sources`.
+
+    Examples
+    ---------
+    >>> results = profile_tables(["a.csv", "b.parquet"], n_jobs=4)
+    >>> [result.name for result in results if not result.ok]
+    >>> results[0].tables["summary"]
+    """
+    workers = parallel.check_jobs(n_jobs, backend)
+    names, sources = _check_sources(sources)
+
+    if max_memory == "auto":
+        max_memory = _total_memory()
+        if max_memory is not None:
+            max_memory //= 2
+    elif max_memory is not None and \
+            (not isinstance(max_memory, int) or max_memory <= 0):
+        raise Exception("The value of the argument 'max_memory' " +
+                        "should be a positive integer, 'auto' or None.")
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    tasks = []
+    for name, source in zip(names, sources):
+        output = None if output_dir is None \
+            else os.path.join(output_dir, name + ".html")
+        tasks.append((name, source, cat_vars, num_vars, sample, output))
+
+    if workers == 1 or len(tasks) <= 1:
+        return parallel.serial(_profile, tasks)
+
+    costs = [_estimate_memory(source) for source in sources]
+    if max_memory is not None:
+        costs = [min(cost, max_memory) for cost in costs]
+    # The largest tables start first, the smaller ones then fill the gaps
+    pending = sorted(range(len(tasks)), key=lambda i: -costs[i])
+    results = [None] * len(tasks)
+    running = {}
+    in_use = 0
+
+    executor_class = ThreadPoolExecutor if backend == "thread" \
+        else ProcessPoolExecutor
+    executor = executor_class(max_workers=workers)
+    # The tables running when a worker died, retried one at a time
+    suspects = set()
+    try:
+        while pending or running:
+            broken = False
+            while pending and len(running) < workers:
+                k = 0
+                if running:
+                    if not suspects.isdisjoint(running.values()):
+                        break
+                    # The largest pending table fitting in the budget left
+                    k = next((k for k, i in enumerate(pending)
+                              if i not in suspects and
+                              (max_memory is None or
+                               in_use + costs[i] <= max_memory)), None)
+                    if k is None:
+                        break
+                i = pending[k]
+                try:
+                    future = executor.submit(_profile, *tasks[i])
+                except BrokenProcessPool:
+                    broken = True
+                    break
+                pending.pop(k)
+                running[future] = i
+                in_use += costs[i]
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            if broken or any(isinstance(future.exception(), BrokenProcessPool)
+                             for future in done):
+                # A worker died, the other running tables fail with it
+                done, _ = wait(running)
+                executor.shutdown()
+                executor = executor_class(max_workers=workers)
+
+            lost = [running[future] for future in done
+                    if isinstance(future.exception(), BrokenProcessPool)]
+            for future in done:
+                i = running.pop(future)
+                in_use -= costs[i]
+                error = future.exception()
+                if error is None:
+                    results[i] = future.result()
+                elif i in lost and len(lost) > 1 and i not in suspects:
+                    # The table that killed the worker is not known yet
+                    suspects.add(i)
+                    pending.insert(0, i)
+                else:
+                    # The worker died or its result could not be sent back
+                    results[i] = TableResult(
+                        names[i], cat_vars, num_vars, None, error,
+                        "".join(traceback.format_exception(
+                            type(error), error, error.__traceback__)),
+                        0.0, None)
+    finally:
+        executor.shutdown()
+    return results
+
+
+def _profile(name, source, cat_vars, num_vars, sample, output):
+    """
+    Profiles a table in a worker.
+
+    Returns
+    --------
+    `TableResult`
+        The tables of the report, or the error raised.
+    """
+    start = time.perf_counter()
+    try:
+        dataframe = source if isinstance(source, pd.DataFrame) \
+            else _read(source)
+        report = EDAReport(dataframe, cat_vars, num_vars, sample=sample)
+        report.compute()
+        tables = {table: getattr(report, table) for table in _TABLES}
+        if output is not None:
+            report.save_html(output)
+        return TableResult(name, report.cat_vars, report.num_vars, tables,
+                           None, None, time.perf_counter() - start, output)
+
+    except Exception as ex:
+        return TableResult(name, cat_vars, num_vars, None, ex,
+                           traceback.format_exc(),
+                           time.perf_counter() - start, None)
+
+
+def _read(path):
+    """
+    Returns
+    --------
+    `pandas.DataFrame`
+        The table of a CSV, Parquet or pickle file.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _READERS:
+        raise Exception("The file '{}' should be a CSV, Parquet or pickle "
+                        "file.".format(path))
+    return _READERS[extension](path)
+
+
+def _check_sources(sources):
+    """
+    Checks the tables of `profile_tables`.
+
+    Returns
+    --------
+    tuple
+        The names of the tables and the tables.
+    """
+    if isinstance(sources, dict):
+        names, sources = list(sources), list(sources.values())
+    elif isinstance(sources, (list, tuple)):
+        sources = list(sources)
+        names = []
+        for i, source in enumerate(sources):
+            if _is_path(source):
+                file_name = os.path.basename(os.fspath(source))
+                names.append(os.path.splitext(file_name)[0])
+            else:
+                names.append("table{}".format(i))
+    else:
+        raise Exception("The value of the argument 'sources' should be " +
+                        "a list or a dict.")
+
+    if not all(isinstance(source, pd.DataFrame) or _is_path(source)
+               for source in sources):
+        raise Exception("The tables in the argument 'sources' should be " +
+                        "pandas dataframes or paths of files.")
+
+    if not all(isinstance(name, str) for name in names):
+        raise Exception("The names of the tables in the argument " +
+                        "'sources' should be strings.")
+
+    if len(names) != len(set(names)):
+        raise Exception("The names of the tables in the argument " +
+                        "'sources' should be unique, pass a dict to name " +
+                        "them.")
+
+    sources = [source if isinstance(source, pd.DataFrame)
+               else os.fspath(source) for source in sources]
+    return names, sources
+
+
+def _is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+
+def _estimate_memory(source):
+    """
+    Returns
+    --------
+    `int`
+        The estimated peak memory in bytes of profiling a table.
+    """
+    if isinstance(source, pd.DataFrame):
+        size = int(source.memory_usage(deep=True).sum())
+    else:
+        extension = os.path.splitext(source)[1].lower()
+        try:
+            size = os.path.getsize(source) * _EXPANSION.get(extension, 1)
+        except OSError:
+            # The worker reports the missing file
+            size = 0
+    return _WORKING_FACTOR * size
+
+
+def _total_memory():
+    """
+    Returns
+    --------
+    `int`
+        The physical memory in bytes, or None where it is not known.
+    """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        # os.sysconf is not available on Windows
+        return None
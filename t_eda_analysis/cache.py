@@ -0,0 +1,324 @@
+import collections
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+
+import pandas as pd
+
+_cache = None
+
+
+class ResultCache:
+    """
+    Least recently used cache of the results of the report functions, kept
+    in memory and optionally on disk. The memory tier is bounded by a
+    number of entries and by the pickled size of the results, the least
+    recently used results being evicted first. The disk tier keeps every
+    result until `clear` is called.
+
+    Parameters
+    -----------
+    max_entries: `int`, optional
+        The maximum number of results kept in memory.
+    max_bytes: `int`, optional
+        The maximum pickled size of the results kept in memory, None for no
+        limit.
+    directory: `str`, optional
+        If given, the results are also pickled to this directory and read
+        back when they were evicted from memory, also by other processes.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=2 ** 30, directory=None):
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise Exception("The value of the argument 'max_entries' " +
+                            "should be a positive integer.")
+
+        if max_bytes is not None and \
+                (not isinstance(max_bytes, int) or max_bytes <= 0):
+            raise Exception("The value of the argument 'max_bytes' " +
+                            "should be a positive integer.")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Looks a result up, in memory and then on disk.
+
+        Returns
+        --------
+        tuple
+            Whether the result was found, and a copy of the result.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, pickle.loads(self._entries[key])
+
+        path = self._path(key)
+        if path is not None and os.path.exists(path):
+            with open(path, "rb") as file:
+                data = file.read()
+            with self._lock:
+                self.hits += 1
+                self.disk_hits += 1
+                self._store(key, data)
+            return True, pickle.loads(data)
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key, value):
+        """
+        Stores a result, evicting the least recently used ones.
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        path = self._path(key)
+        if path is not None:
+            # Written under another name first so that no reader sees a
+            # partial file
+            tmp_path = path + ".{}.tmp".format(os.getpid())
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        with self._lock:
+            self._store(key, data)
+
+    def _store(self, key, data):
+        if key in self._entries:
+            self._bytes -= len(self._entries.pop(key))
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        self._entries[key] = data
+        self._bytes += len(data)
+        while len(self._entries) > self.max_entries or \
+                (self.max_bytes is not None and
+                 self._bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def _path(self, key):
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, key + ".pkl")
+
+    def clear(self):
+        """
+        Removes every result, from memory and from disk, and resets the
+        statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.disk_hits = self.misses = 0
+            if self.directory is not None:
+                for name in os.listdir(self.directory):
+                    if name.endswith(".pkl"):
+                        os.remove(os.path.join(self.directory, name))
+
+    def stats(self):
+        """
+        Returns
+        --------
+        dict
+            The number of 'hits' (of which 'disk_hits') and 'misses', and
+            the number of 'entries' and 'bytes' kept in memory.
+        """
+        with self._lock:
+            return {"hits": self.hits, "disk_hits": self.disk_hits,
+                    "misses": self.misses, "entries": len(self._entries),
+                    "bytes": self._bytes}
+
+
+def enable(max_entries=128, max_bytes=2 ** 30, directory=None):
+    """
+    Caches the results of the report functions from now on. The results
+    are keyed on a fingerprint of the content of the columns they read,
+    the function name and its other arguments, so an unchanged frame is
+    profiled only once.
+
+    Parameters
+    -----------
+    max_entries: `int`, optional
+        The maximum number of results kept in memory.
+    max_bytes: `int`, optional
+        The maximum pickled size of the results kept in memory, None for no
+        limit.
+    directory: `str`, optional
+        If given, the results are also kept in this directory.
+
+    Returns
+    --------
+    `ResultCache`
+        The new cache.
+
+    Examples
+    ---------
+    >>> from t_eda_analysis import cache
+    >>> cache.enable(max_entries=256, directory="/tmp/eda-cache")
+    >>> summary, plot = describe_num_var(X, ['height'])
+    >>> summary, plot = describe_num_var(X, ['height'])
+    >>> cache.stats()
+    {'hits': 1, 'disk_hits': 0, 'misses': 1, 'entries': 1, 'bytes': 3342}
+    """
+    global _cache
+    _cache = ResultCache(max_entries, max_bytes, directory)
+    return _cache
+
+
+def disable():
+    """
+    Stops caching the results of the report functions and drops the ones
+    kept in memory.
+    """
+    global _cache
+    _cache = None
+
+
+def stats():
+    """
+    Returns
+    --------
+    dict
+        The statistics of the cache, see `ResultCache.stats`, or None when
+        the cache is disabled.
+    """
+    if _cache is None:
+        return None
+    return _cache.stats()
+
+
+def clear():
+    """
+    Removes every result from the cache, if it is enabled.
+    """
+    if _cache is not None:
+        _cache.clear()
+
+
+def fingerprint(dataframe, columns=None):
+    """
+    Fingerprints the content of some columns of a dataframe by hashing
+    their values with `pandas.util.hash_pandas_object`, along with the
+    column names, dtypes and index.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe to fingerprint.
+    columns: `list`, optional
+        The columns to fingerprint, all of them by default.
+
+    Returns
+    --------
+    `str`
+        A hexadecimal digest, equal for dataframes of equal content.
+    """
+    if columns is None:
+        columns = dataframe.columns
+    columns = list(columns)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr((columns,
+                        [str(dataframe[item].dtype) for item in columns],
+                        len(dataframe))).encode())
+    digest.update(pd.util.hash_pandas_object(dataframe.index).to_numpy())
+    for item in columns:
+        digest.update(pd.util.hash_pandas_object(dataframe[item],
+                                                 index=False).to_numpy())
+    return digest.hexdigest()
+
+
+def cached(*column_args, ignore=("n_jobs", "backend")):
+    """
+    Caches the results of a function of a dataframe when the cache is
+    enabled, see `enable`.
+
+    Parameters
+    -----------
+    *column_args: `str`
+        The arguments listing the columns read by the function, all the
+        columns are fingerprinted when there is none or when one of them
+        is None, the variables being then inferred from the dataframe.
+    ignore: `tuple`, optional
+        The arguments that do not change the results.
+
+    Returns
+    --------
+    function
+        The decorator.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _cache is None:
+                return func(*args, **kwargs)
+
+            key = _key(func, signature, column_args, ignore, args, kwargs)
+            if key is None:
+                # Invalid arguments are left to the checks of the function
+                return func(*args, **kwargs)
+
+            cache = _cache
+            found, value = cache.get(key)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            cache.put(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _key(func, signature, column_args, ignore, args, kwargs):
+    """
+    Builds the cache key of a call, None when the dataframe or the columns
+    are invalid.
+    """
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+
+    dataframe = arguments.pop("dataframe")
+    if not isinstance(dataframe, pd.DataFrame):
+        return None
+    columns = None
+    # Omitted variables are inferred from every column
+    if column_args and all(arguments[name] is not None
+                           for name in column_args):
+        columns = []
+        for name in column_args:
+            if not isinstance(arguments[name], list) or \
+                    not all(item in dataframe.columns
+                            for item in arguments[name]):
+                return None
+            columns.extend(item for item in arguments[name]
+                           if item not in columns)
+
+    others = sorted((name, repr(value)) for name, value in arguments.items()
+                    if name not in ignore)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr((func.__module__, func.__qualname__,
+                        others)).encode())
+    digest.update(fingerprint(dataframe, columns).encode())
+    return digest.hexdigest()
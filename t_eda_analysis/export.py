@@ -0,0 +1,286 @@
+import hashlib
+import json
+import os
+import re
+
+import pandas as pd
+
+_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+{scripts}</head>
+<body>
+<h1>{title}</h1>
+"""
+# The scripts of the charts, unless they are inlined
+_CDN = ('<script src="https://cdn.jsdelivr.net/npm/vega@{vega}"></script>\n'
+        '<script src="https://cdn.jsdelivr.net/npm/vega-lite@{vegalite}">'
+        '</script>\n'
+        '<script src="https://cdn.jsdelivr.net/npm/vega-embed@{vegaembed}">'
+        '</script>\n')
+
+# Decodes the columnar datasets, each one once, and embeds the charts
+_SCRIPT = """<script>
+(function () {
+  var dataDir = %s;
+  var loaded = {};
+  function column(values, n) {
+    if (Array.isArray(values)) return values;
+    var out = new Array(n);
+    for (var i = 0; i < n; i++) out[i] = values.dictionary[values.codes[i]];
+    return out;
+  }
+  function rows(dataset) {
+    var names = Object.keys(dataset.columns);
+    var columns = names.map(function (name) {
+      return column(dataset.columns[name], dataset.length);
+    });
+    var out = new Array(dataset.length);
+    for (var i = 0; i < dataset.length; i++) {
+      var row = {};
+      for (var j = 0; j < names.length; j++) row[names[j]] = columns[j][i];
+      out[i] = row;
+    }
+    return out;
+  }
+  function load(name) {
+    if (!(name in loaded)) {
+      var inline = document.getElementById(name);
+      loaded[name] = (inline ?
+        Promise.resolve(JSON.parse(inline.textContent)) :
+        fetch(dataDir + "/" + name + ".json").then(function (response) {
+          return response.json();
+        })).then(rows);
+    }
+    return loaded[name];
+  }
+  document.querySelectorAll("script.eda-spec").forEach(function (script) {
+    var spec = JSON.parse(script.textContent);
+    var names = JSON.parse(script.getAttribute("data-datasets"));
+    Promise.all(names.map(load)).then(function (datasets) {
+      spec.datasets = {};
+      names.forEach(function (name, i) { spec.datasets[name] = datasets[i]; });
+      vegaEmbed("#" + script.getAttribute("data-target"), spec);
+    });
+  });
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def save_html(report, path, data_dir=None, title="EDA report",
+              scripts=None):
+    """
+    Saves a report as an HTML page. The page is written section by
+    section: the NA counts and the numeric summary as tables, then the
+    category, histogram and correlation charts. The tables of the charts
+    are kept out of their Vega-Lite specs and every table is stored once,
+    encoded from its columns, where the repeated strings of a column are
+    stored once too. The tables are thus not limited to the 5000 rows of
+    the altair data transformer. They are decoded in the browser before
+    the charts are embedded with vega-embed. By default vega, vega-lite and
+    vega-embed are loaded from the jsDelivr CDN, so the charts of the page
+    are only rendered with network access, unless `scripts` are given.
+
+    Parameters
+    -----------
+    report: `report.EDAReport`
+        The report to save.
+    path: `str`
+        The path of the HTML file.
+    data_dir: `str`, optional
+        If given, the datasets are written as JSON files in this directory
+        instead of inside the page, which then needs to be served over
+        HTTP to load them.
+    title: `str`, optional
+        The title of the page.
+    scripts: `list`, optional
+        The paths of local copies of the vega, vega-lite and vega-embed
+        JavaScript builds, in this order, which are inlined in the page
+        instead of the CDN links so that it renders offline.
+
+    Returns
+    --------
+    `str`
+        The path of the HTML file.
+
+    Examples
+    ---------
+    >>> report = generate_report(X, ['type'], ['height'], lazy=True)
+    >>> save_html(report, "report.html")
+    """
+    import altair as alt
+
+    if scripts is None:
+        head_scripts = _CDN.format(vega=alt.VEGA_VERSION,
+                                   vegalite=alt.VEGALITE_VERSION,
+                                   vegaembed=alt.VEGAEMBED_VERSION)
+    else:
+        head_scripts = _inline_scripts(scripts)
+
+    if data_dir is not None:
+        os.makedirs(data_dir, exist_ok=True)
+        data_url = os.path.relpath(
+            data_dir, os.path.dirname(os.path.abspath(path)))
+        data_url = data_url.replace(os.sep, "/")
+    written = set()
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(_HEAD.format(title=_escape(title), scripts=head_scripts))
+
+        sample = report.summary.attrs.get("sample")
+        if sample is not None:
+            file.write("<p>Estimated from a sample of {rows} of "
+                       "{population} rows</p>\n".format(**sample))
+        _write_table(file, "Number of NA values in each column",
+                     report.na_counts.to_frame())
+        _write_table(file, "Numerical variable summary", report.summary)
+        if sample is not None:
+            _write_table(file, "Standard errors of the summary",
+                         report.summary.attrs["standard_error"])
+
+        file.write("<h2>Histograms and Correlation plot</h2>\n")
+        for i, name in enumerate(["cat_chart", "num_chart", "corr_chart"]):
+            chart = getattr(report, name)
+            # The table of the chart is encoded from its columns, without
+            # the records of the spec nor their row limit
+            key = _dataset_name(chart.data)
+            if key not in written:
+                written.add(key)
+                encoded = _encode(chart.data)
+                if data_dir is None:
+                    file.write('<script type="application/json" '
+                               'id="{}">'.format(key))
+                    _dump(encoded, file)
+                    file.write("</script>\n")
+                else:
+                    with open(os.path.join(data_dir, key + ".json"), "w",
+                              encoding="utf-8") as data_file:
+                        _dump(encoded, data_file)
+            spec = chart.copy(deep=False)
+            spec.data = alt.NamedData(name=key)
+            spec = spec.to_dict()
+
+            file.write('<div id="chart-{}"></div>\n'.format(i))
+            file.write('<script type="application/json" class="eda-spec" '
+                       'data-target="chart-{}" '
+                       "data-datasets='{}'>".format(
+                           i, json.dumps(sorted(_names(spec)))))
+            _dump(spec, file)
+            file.write("</script>\n")
+
+        file.write(_SCRIPT % json.dumps(
+            None if data_dir is None else data_url))
+
+    return path
+
+
+def _inline_scripts(scripts):
+    """
+    Reads the JavaScript files inlined in a page.
+
+    Returns
+    --------
+    `str`
+        The script elements of the files.
+    """
+    if not isinstance(scripts, (list, tuple)) or len(scripts) != 3:
+        raise Exception("The value of the argument 'scripts' should be a " +
+                        "list of the paths of the vega, vega-lite and " +
+                        "vega-embed scripts.")
+
+    elements = []
+    for script in scripts:
+        with open(script, encoding="utf-8") as file:
+            source = file.read()
+        # A closing tag in the source would end the element early
+        source = re.sub(r"</(script)", r"<\\/\1", source,
+                        flags=re.IGNORECASE)
+        elements.append("<script>\n{}\n</script>\n".format(source))
+    return "".join(elements)
+
+
+def _write_table(file, heading, table):
+    file.write("<h2>{}</h2>\n".format(_escape(heading)))
+    file.write(table.to_html())
+    file.write("\n")
+
+
+def _names(spec):
+    """
+    Returns
+    --------
+    set
+        The names of the datasets referenced by a Vega-Lite spec.
+    """
+    names = set()
+    if isinstance(spec, dict):
+        data = spec.get("data")
+        if isinstance(data, dict) and "name" in data:
+            names.add(data["name"])
+        for value in spec.values():
+            names |= _names(value)
+    elif isinstance(spec, list):
+        for value in spec:
+            names |= _names(value)
+    return names
+
+
+def _encode(table):
+    """
+    Encodes a table as columns, its values converted like the data of the
+    charts. The columns of strings are dictionary encoded when their values
+    repeat.
+
+    Returns
+    --------
+    dict
+        The number of records as 'length' and the columns as 'columns'.
+    """
+    import altair as alt
+
+    table = alt.utils.sanitize_dataframe(table)
+    columns = {}
+    for name in table.columns:
+        column = table[name].tolist()
+        if all(isinstance(value, str) for value in column):
+            dictionary = list(dict.fromkeys(column))
+            if 2 * len(dictionary) < len(column):
+                codes = {value: code for code, value in enumerate(dictionary)}
+                column = {"dictionary": dictionary,
+                          "codes": [codes[value] for value in column]}
+        columns[name] = column
+    return {"length": len(table), "columns": columns}
+
+
+def _dataset_name(table):
+    """
+    Returns
+    --------
+    `str`
+        The name of a table of the charts, a digest of its content.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(table.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(table, index=False).values
+                  .tobytes())
+    return "data-" + digest.hexdigest()
+
+
+def _dump(obj, file):
+    """
+    Streams an object as JSON to a file, escaping "</" so that it can be
+    written inside a script element.
+    """
+    encoder = json.JSONEncoder(allow_nan=False, separators=(",", ":"))
+    for chunk in encoder.iterencode(obj):
+        file.write(chunk.replace("</", "<\\/"))
+
+
+def _escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;") \
+        .replace(">", "&gt;")
@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+
+_ROLES = ("cat_vars", "num_vars", "datetime_vars", "numeric_text_vars",
+          "other_vars")
+# Strings shaped like a date, checked before the slower date parsing
+_DATE_PATTERN = r"\s*(\d{4}-\d{1,2}-\d{1,2}|\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})"
+
+
+def infer_column_types(dataframe, sample_rows=10000, max_categories=1000,
+                       max_ratio=0.5, parse_rate=0.95, seed=0):
+    """
+    Infers the role of every column of a dataframe. The dtypes decide
+    first: numeric columns are numerical variables, boolean and
+    categorical columns are categorical variables and datetime columns are
+    dates. The object and string columns are then classified from a
+    sample of at most `sample_rows` rows, so the time does not depend on
+    the number of rows: a column whose values mostly parse as numbers or
+    as dates holds numeric text or dates, otherwise a column with few
+    distinct values relative to its sampled values is categorical.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe whose columns are classified.
+    sample_rows: `int`, optional
+        The maximum number of rows sampled to classify the object columns.
+    max_categories: `int`, optional
+        The maximum number of distinct sampled values of a categorical
+        variable.
+    max_ratio: `float`, optional
+        The maximum ratio of distinct values to non-NA values in the sample
+        of a categorical variable.
+    parse_rate: `float`, optional
+        The fraction of the sampled values that should parse as numbers or
+        dates.
+    seed: `int`, optional
+        The seed of the row sample.
+
+    Returns
+    --------
+    dict
+        The column names of each role, under the keys 'cat_vars',
+        'num_vars', 'datetime_vars', 'numeric_text_vars' (numbers stored
+        as text) and 'other_vars' (such as identifiers, free text or empty
+        columns). 'cat_vars' and 'num_vars' can be passed to the report
+        functions, and the dict can be saved and reused.
+
+    Examples
+    ---------
+    >>> roles = infer_column_types(X)
+    >>> generate_report(X, roles['cat_vars'], roles['num_vars'])
+    """
+    if not isinstance(dataframe, pd.DataFrame):
+        raise Exception("The value of the argument 'dataframe' " +
+                        "should be of type pandas dataframe.")
+
+    if not isinstance(sample_rows, int) or sample_rows <= 0:
+        raise Exception("The value of the argument 'sample_rows' " +
+                        "should be a positive integer.")
+
+    roles = {role: [] for role in _ROLES}
+    objects = []
+    for position, (item, dtype) in enumerate(dataframe.dtypes.items()):
+        role = _dtype_role(dtype)
+        if role is None:
+            objects.append(position)
+        else:
+            roles[role].append(item)
+
+    if objects:
+        n_rows = len(dataframe)
+        rows = slice(None)
+        if n_rows > sample_rows:
+            rng = np.random.default_rng(seed)
+            rows = np.sort(rng.choice(n_rows, sample_rows, replace=False))
+        sampled = dataframe.iloc[rows, objects]
+        # The roles are collected in the column order
+        found = {}
+        for j, position in enumerate(objects):
+            found[position] = _object_role(sampled.iloc[:, j],
+                                           max_categories, max_ratio,
+                                           parse_rate)
+        for position in objects:
+            roles[found[position]].append(dataframe.columns[position])
+
+    # The columns of each role keep their order in the dataframe
+    order = {item: i for i, item in enumerate(dataframe.columns)}
+    return {role: sorted(items, key=order.get)
+            for role, items in roles.items()}
+
+
+def _dtype_role(dtype):
+    """
+    Returns
+    --------
+    `str`
+        The role of a column set by its dtype, None when its values have to
+        be inspected.
+    """
+    # Durations and complex numbers pass for numbers but are not summarized
+    if pd.api.types.is_timedelta64_dtype(dtype) or \
+            pd.api.types.is_complex_dtype(dtype):
+        return "other_vars"
+    if isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.number):
+        return "num_vars"
+    if pd.api.types.is_bool_dtype(dtype) or \
+            isinstance(dtype, pd.CategoricalDtype):
+        return "cat_vars"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime_vars"
+    if pd.api.types.is_object_dtype(dtype) or \
+            pd.api.types.is_string_dtype(dtype):
+        return None
+    return "other_vars"
+
+
+def _object_role(col, max_categories, max_ratio, parse_rate):
+    """
+    Classifies a sampled object column. The distinct values are parsed
+    once each, weighted by their number of occurrences.
+    """
+    codes, uniques = pd.factorize(col)
+    codes = codes[codes >= 0]
+    if len(codes) == 0:
+        return "other_vars"
+    weights = np.bincount(codes, minlength=len(uniques)) / len(codes)
+    uniques = pd.Series(uniques, dtype=object)
+
+    numeric = pd.to_numeric(uniques, errors="coerce").notna().to_numpy()
+    if weights[numeric].sum() >= parse_rate:
+        return "numeric_text_vars"
+
+    strings = uniques.map(type).to_numpy() == str
+    dated = np.zeros(len(uniques), dtype=bool)
+    dated[strings] = uniques[strings].str.match(_DATE_PATTERN).to_numpy()
+    if weights[dated].sum() >= parse_rate:
+        parsed = pd.to_datetime(uniques[dated], errors="coerce")
+        dated[dated] = parsed.notna().to_numpy()
+        if weights[dated].sum() >= parse_rate:
+            return "datetime_vars"
+
+    if len(uniques) <= max_categories and \
+            len(uniques) <= max_ratio * len(codes):
+        return "cat_vars"
+    return "other_vars"
@@ -0,0 +1,158 @@
+import contextlib
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # pragma: no cover, not available on Windows
+    resource = None
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+class StageRecord:
+    """
+    Timing and memory of a stage of a report.
+
+    Attributes
+    -----------
+    stage: `str`
+        The name of the stage: "sample", "na_counts", "categories",
+        "numeric_summary", "correlation" or "charts".
+    wall_seconds: `float`
+        The elapsed time of the stage.
+    cpu_seconds: `float`
+        The CPU time of the process during the stage, including the worker
+        threads but not the worker processes.
+    peak_bytes: `int`
+        The peak memory allocated by the stage over its start, traced by
+        `tracemalloc`, or None when memory is not traced.
+    max_rss_bytes: `int`
+        The peak resident memory of the process at the end of the stage, or
+        None where it is not available.
+    rows: `int`
+        The number of rows handled by the stage.
+    columns: `int`
+        The number of columns handled by the stage.
+    """
+
+    def __init__(self, stage, wall_seconds, cpu_seconds, peak_bytes,
+                 max_rss_bytes, rows, columns):
+        self.stage = stage
+        self.wall_seconds = wall_seconds
+        self.cpu_seconds = cpu_seconds
+        self.peak_bytes = peak_bytes
+        self.max_rss_bytes = max_rss_bytes
+        self.rows = rows
+        self.columns = columns
+
+    def as_dict(self):
+        """
+        Returns
+        --------
+        dict
+            The attributes of the record, ready to be sent to a metrics
+            system or gathered into a `pandas.DataFrame`.
+        """
+        return {"stage": self.stage, "wall_seconds": self.wall_seconds,
+                "cpu_seconds": self.cpu_seconds,
+                "peak_bytes": self.peak_bytes,
+                "max_rss_bytes": self.max_rss_bytes, "rows": self.rows,
+                "columns": self.columns}
+
+    def __repr__(self):
+        return "StageRecord({})".format(", ".join(
+            "{}={!r}".format(name, value)
+            for name, value in self.as_dict().items()))
+
+
+class Stages:
+    """
+    Measures the stages of a report and passes a `StageRecord` of each one
+    to the callbacks. Without callbacks nothing is measured. The clocks and
+    the resident memory are cheap to read, only `trace_memory` slows the
+    allocations down while a stage runs.
+
+    Parameters
+    -----------
+    callbacks: `list`, optional
+        The functions called with the `StageRecord` of every stage, in the
+        order of the stages.
+    trace_memory: `bool`, optional
+        Whether to trace the peak memory of every stage with `tracemalloc`.
+    """
+
+    def __init__(self, callbacks=None, trace_memory=False):
+        self.callbacks = check_callbacks(callbacks)
+        self.trace_memory = trace_memory
+
+    @contextlib.contextmanager
+    def stage(self, name, rows, columns):
+        """
+        Measures the code run in the context as the stage `name`, handling
+        `rows` rows and `columns` columns.
+        """
+        if not self.callbacks:
+            yield
+            return
+
+        started = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+        traced = self.trace_memory and \
+            (started or hasattr(tracemalloc, "reset_peak"))
+        base = tracemalloc.get_traced_memory()[0] if traced else 0
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            peak = tracemalloc.get_traced_memory()[1] - base \
+                if traced else None
+        finally:
+            if started:
+                tracemalloc.stop()
+
+        record = StageRecord(name, wall, cpu, peak, max_rss(), rows,
+                             columns)
+        for callback in self.callbacks:
+            callback(record)
+
+
+def check_callbacks(callbacks):
+    """
+    Checks the instrumentation callbacks of a report.
+
+    Returns
+    --------
+    list
+        The callbacks, empty when None.
+    """
+    if callbacks is None:
+        return []
+
+    if not isinstance(callbacks, (list, tuple)) or \
+            not all(callable(callback) for callback in callbacks):
+        raise Exception("The value of the argument 'callbacks' " +
+                        "should be a list of functions.")
+
+    return list(callbacks)
+
+
+def max_rss():
+    """
+    Returns
+    --------
+    `int`
+        The peak resident memory of the process in bytes, None where it is
+        not available.
+    """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
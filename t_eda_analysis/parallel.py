@@ -0,0 +1,152 @@
+import contextlib
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+_BACKENDS = ("thread", "process")
+
+
+def check_jobs(n_jobs=1, backend="thread"):
+    """
+    Checks the parallel options of the report functions.
+
+    Parameters
+    -----------
+    n_jobs: `int`, optional
+        The number of workers, -1 for one worker per core.
+    backend: `str`, optional
+        "thread" or "process", the kind of workers.
+
+    Returns
+    --------
+    `int`
+        The number of workers.
+    """
+    if not isinstance(n_jobs, int) or (n_jobs <= 0 and n_jobs != -1):
+        raise Exception("The value of the argument 'n_jobs' " +
+                        "should be a positive integer or -1.")
+
+    if backend not in _BACKENDS:
+        raise Exception("The value of the argument 'backend' " +
+                        "should be one of " + ", ".join(_BACKENDS) + ".")
+
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    return n_jobs
+
+
+def serial(func, tasks):
+    """
+    Calls `func(*task)` for every task in the current thread.
+
+    Returns
+    --------
+    list
+        The results, in the order of the tasks.
+    """
+    return [func(*task) for task in tasks]
+
+
+@contextlib.contextmanager
+def pool(n_jobs=1, backend="thread"):
+    """
+    Starts a pool of workers for per-column tasks.
+
+    Parameters
+    -----------
+    n_jobs: `int`, optional
+        The number of workers, -1 for one worker per core. A single worker
+        runs the tasks in the current thread.
+    backend: `str`, optional
+        "thread" or "process". Threads share the data and suit the numpy
+        and pandas kernels that release the GIL. The functions and
+        arguments of the tasks sent to processes are pickled, so the large
+        numeric blocks should be shared with `shared_block`.
+
+    Yields
+    -------
+    function
+        A function `run(func, tasks)` calling `func(*task)` for every task
+        and returning the results in the order of the tasks, like `serial`.
+
+    Examples
+    ---------
+    >>> with pool(n_jobs=4) as run:
+    ...     counts = run(len, [("a",), ("bc",)])
+    """
+    workers = check_jobs(n_jobs, backend)
+    if workers == 1:
+        yield serial
+        return
+
+    executor_class = ThreadPoolExecutor if backend == "thread" \
+        else ProcessPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+
+        def run(func, tasks):
+            if len(tasks) <= 1:
+                return serial(func, tasks)
+            # Batches the tasks sent to processes, about four per worker
+            chunksize = 1 if backend == "thread" else \
+                max(1, len(tasks) // (4 * workers))
+            return list(executor.map(func, *zip(*tasks),
+                                     chunksize=chunksize))
+
+        yield run
+
+
+@contextlib.contextmanager
+def shared_block(shape, backend="thread"):
+    """
+    Allocates a Fortran-ordered float64 block that the workers read
+    without copying it. Processes share a memory-mapped temporary file,
+    which is removed on exit, threads share a plain array.
+
+    Parameters
+    -----------
+    shape: `tuple`
+        The rows x variables shape of the block.
+    backend: `str`, optional
+        "thread" or "process", the kind of workers reading the block.
+
+    Yields
+    -------
+    tuple
+        The block to fill and the reference to pass to the workers, which
+        get the block back with `open_block`.
+    """
+    if backend != "process" or 0 in shape:
+        block = np.empty(shape, dtype=np.float64, order="F")
+        yield block, block
+        return
+
+    tmp = tempfile.mkdtemp(prefix="t_eda_analysis-")
+    try:
+        path = os.path.join(tmp, "block.dat")
+        block = np.memmap(path, dtype=np.float64, mode="w+", shape=shape,
+                          order="F")
+        yield block, (path, shape)
+    finally:
+        block = None
+        # A file still mapped by the caller cannot be removed on Windows,
+        # it is then left to the temporary directory cleanup of the system
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def open_block(ref):
+    """
+    Returns
+    --------
+    `numpy.ndarray`
+        The block of a reference yielded by `shared_block`. A memory-mapped
+        block is opened copy-on-write, so the workers never change the
+        shared file.
+    """
+    if isinstance(ref, np.ndarray):
+        return ref
+    path, shape = ref
+    return np.memmap(path, dtype=np.float64, mode="c", shape=shape,
+                     order="F")
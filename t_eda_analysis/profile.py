@@ -0,0 +1,125 @@
+from t_eda_analysis.accumulators import ReportAccumulator
+
+
+class EDAProfile(ReportAccumulator):
+    """
+    Incremental EDA profile of a table that grows over time. The profile
+    keeps running NA counts, moments, histogram bins, category counts,
+    correlation sums and quantile sketches, so adding rows with `update`
+    costs in proportion to the new rows only. The profile renders the
+    outputs of the report functions for all the rows added so far.
+
+    Parameters
+    -----------
+    cat_vars: `list`
+        A list containing names of categorical variables.
+    num_vars: `list`
+        A list containing names of numerical variable.
+    bins: `int`, optional
+        The maximum number of histogram bins of each numerical variable.
+    quantile_error: `float`, optional
+        The target rank error of the quantile sketches.
+    max_distinct: `int`, optional
+        The number of distinct categories above which a categorical
+        variable is sketched, see `accumulators.CategoryCounts`.
+
+    Examples
+    ---------
+    >>> profile = EDAProfile(['type'], ['height'])
+    >>> profile.update(history_df)
+    >>> profile.update(new_rows_df)
+    >>> summary, plot = profile.describe_num_var()
+    >>> profile.report()
+    """
+
+    def count_na_values(self):
+        """
+        Returns
+        --------
+        `pandas.Series`
+            The number of NA values in each column, like `count_na_values`.
+        """
+        return self.na_counts()
+
+    def describe_cat_var(self, n_cols=3, top_k=None):
+        """
+        Parameters
+        -----------
+        n_cols: `int`, optional
+            A number indicating how many plots should be displayed in a row
+        top_k: `int`, optional
+            If given, only the top_k most frequent categories of each
+            variable are plotted and the remaining ones are summed into an
+            "Other" bar
+
+        Returns
+        --------
+        `altair`
+            The histograms of the categorical variables, like
+            `describe_cat_var`.
+        """
+        return self.cat_chart(n_cols, top_k)
+
+    def describe_num_var(self):
+        """
+        Returns
+        --------
+        tuple
+            The statistical summary of the numerical variables and their
+            histograms, like `describe_num_var`. The quantiles and median
+            are estimated, as listed in `summary.attrs["approximate"]`.
+        """
+        return self.num_summary(), self.num_chart()
+
+    def calc_cor(self, return_table=False):
+        """
+        Parameters
+        -----------
+        return_table: `bool`, optional
+            Whether to also return the long-form correlation table.
+
+        Returns
+        --------
+        `altair`
+            The correlogram of the numerical variables, like `calc_cor`.
+        tuple
+            If `return_table` is True, a tuple of the correlation table and
+            the correlogram.
+        """
+        if return_table:
+            return self.corr_table(), self.corr_chart()
+        return self.corr_chart()
+
+    def report(self):
+        """
+        Prints the EDA report of `generate_report` for all the rows added so
+        far.
+
+        Returns
+        --------
+        boolean
+            It returns True on successful execution else returns False
+        """
+        try:
+            print("Number of NA values in each column")
+            print(self.na_counts().to_frame())
+
+            cat_var_plot = self.cat_chart()
+            num_var_plot = self.num_chart()
+
+            print(' ')
+            print('Numerical variable summary')
+            print(self.num_summary())
+
+            print(' ')
+            print('Histograms and Correlation plot:')
+            cor_plot = self.corr_chart()
+            cat_var_plot & num_var_plot & cor_plot
+
+            return True
+
+        except Exception as ex:
+
+            print("The report was not generated successfully")
+            print(ex)
+            return False
@@ -0,0 +1,246 @@
+from t_eda_analysis import export, instrument, parallel, sampling
+from t_eda_analysis import t_eda_analysis as eda
+
+_CHARTS = ("cat_chart", "num_chart", "corr_chart")
+
+
+class EDAReport:
+    """
+    Lazy EDA report of a dataframe, returned by
+    `generate_report(..., lazy=True)`. Every section is computed on its
+    first access and then kept, so a caller reading only the numeric
+    summary never counts the categories nor builds a chart. `compute`
+    computes all the missing tables at once, sharing their intermediates.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe whose EDA analysis is to be performed.
+    cat_vars: `list`, optional
+        A list containing names of categorical variables, inferred if
+        omitted.
+    num_vars: `list`, optional
+        A list containing names of numerical variable, inferred if omitted.
+    n_jobs: `int`, optional
+        The number of workers sharing the per-column work, -1 for one
+        worker per core.
+    backend: `str`, optional
+        "thread" (default) or "process", the kind of workers.
+    sample: `int` or `sampling.Sample`, optional
+        If given, the sections are estimated from a sample of the rows,
+        the same one for every section.
+    callbacks: `list`, optional
+        Functions called with an `instrument.StageRecord` of every stage,
+        see `generate_report`.
+    trace_memory: `bool`, optional
+        Whether the records hold the peak memory traced by `tracemalloc`.
+
+    Examples
+    ---------
+    >>> report = generate_report(X, ['type'], ['height'], lazy=True)
+    >>> report.summary
+    >>> report.chart
+    """
+
+    def __init__(self, dataframe, cat_vars=None, num_vars=None, n_jobs=1,
+                 backend="thread", sample=None, callbacks=None,
+                 trace_memory=False):
+        cat_vars, num_vars = eda._infer_vars(dataframe, cat_vars, num_vars)
+        eda._check_cat_input(dataframe, cat_vars)
+        eda._check_num_input(dataframe, num_vars)
+        parallel.check_jobs(n_jobs, backend)
+        if sample is not None:
+            sample = sampling.check_sample(sample, dataframe)
+
+        self.dataframe = dataframe
+        self.cat_vars = cat_vars
+        self.num_vars = num_vars
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.sample = sample
+        self._stages = instrument.Stages(callbacks, trace_memory)
+        self._sections = {}
+
+    @property
+    def na_counts(self):
+        """
+        `pandas.Series`: The number of NA values in each column.
+        """
+        return self._table("na_counts")
+
+    @property
+    def categories(self):
+        """
+        `pandas.DataFrame`: The long-form counts of the categories, with
+        the columns 'variable', 'category' and 'count'.
+        """
+        return self._table("categories")
+
+    @property
+    def summary(self):
+        """
+        `pandas.DataFrame`: The statistical summary of the numerical
+        variables.
+        """
+        return self._table("summary")
+
+    @property
+    def histograms(self):
+        """
+        `pandas.DataFrame`: The long-form bin counts of the numerical
+        variables.
+        """
+        return self._table("histograms")
+
+    @property
+    def correlation(self):
+        """
+        `pandas.DataFrame`: The long-form correlation table, with the
+        columns 'Var1', 'Var2' and 'Corr'.
+        """
+        return self._table("correlation")
+
+    @property
+    def cat_chart(self):
+        """
+        `altair`: The histograms of the categorical variables.
+        """
+        return self._chart("cat_chart")
+
+    @property
+    def num_chart(self):
+        """
+        `altair`: The histograms of the numerical variables.
+        """
+        return self._chart("num_chart")
+
+    @property
+    def corr_chart(self):
+        """
+        `altair`: The correlogram of the numerical variables.
+        """
+        return self._chart("corr_chart")
+
+    @property
+    def chart(self):
+        """
+        `altair`: The histograms and the correlogram stacked vertically.
+        """
+        if "chart" not in self._sections:
+            self.compute()
+            with self._charts_stage(_CHARTS):
+                charts = [self._build(name) for name in _CHARTS]
+                self._sections["chart"] = charts[0] & charts[1] & charts[2]
+        return self._sections["chart"]
+
+    def computed(self):
+        """
+        Returns
+        --------
+        list
+            The names of the sections computed so far.
+        """
+        return list(self._sections)
+
+    def compute(self):
+        """
+        Computes every table not computed yet in one plan, see
+        `generate_report`.
+
+        Returns
+        --------
+        `EDAReport`
+            The report itself.
+        """
+        missing = tuple(section for section in eda._REPORT_SECTIONS
+                        if section not in self._sections)
+        if missing:
+            self._compute(missing)
+        return self
+
+    def show(self):
+        """
+        Prints the tables of the report, like `generate_report`.
+
+        Returns
+        --------
+        `altair`
+            The histograms and the correlogram, see `chart`.
+        """
+        self.compute()
+        if "sample" in self._sections:
+            print("Estimated from a sample of {rows} of {population} "
+                  "rows".format(**self._sections["sample"]))
+            print(' ')
+        print("Number of NA values in each column")
+        print(self.na_counts.to_frame())
+
+        chart = self.chart
+
+        print(' ')
+        print('Numerical variable summary')
+        print(self.summary)
+        if "sample" in self._sections:
+            print(' ')
+            print('Standard errors of the summary')
+            print(self.summary.attrs["standard_error"])
+
+        print(' ')
+        print('Histograms and Correlation plot:')
+        return chart
+
+    def save_html(self, path, data_dir=None, title="EDA report",
+                  scripts=None):
+        """
+        Saves the report as an HTML page, each dataset of the charts being
+        stored once, see `export.save_html`. The charts load vega from a
+        CDN, unless local copies of its `scripts` are inlined.
+
+        Returns
+        --------
+        `str`
+            The path of the HTML file.
+        """
+        self.compute()
+        return export.save_html(self, path, data_dir, title, scripts)
+
+    def _table(self, name):
+        if name not in self._sections:
+            self._compute(("summary",) if name == "histograms" else (name,))
+        return self._sections[name]
+
+    def _compute(self, sections):
+        self._sections.update(eda._report_tables(
+            self.dataframe, self.cat_vars, self.num_vars, self.n_jobs,
+            self.backend, self.sample, self._stages, sections))
+
+    def _chart(self, name):
+        if name not in self._sections:
+            with self._charts_stage((name,)):
+                self._build(name)
+        return self._sections[name]
+
+    def _build(self, name):
+        if name not in self._sections:
+            if name == "cat_chart":
+                chart = eda._cat_chart(self.categories, self.cat_vars)
+            elif name == "num_chart":
+                chart = eda._num_chart(self.histograms)
+            else:
+                chart = eda._corr_chart(self.correlation)
+            self._sections[name] = chart
+        return self._sections[name]
+
+    def _charts_stage(self, names):
+        tables = {"cat_chart": "categories", "num_chart": "histograms",
+                  "corr_chart": "correlation"}
+        # The tables are computed before the stage starts
+        n_rows = sum(len(self._table(tables[name])) for name in names)
+        n_cols = (len(self.cat_vars) if "cat_chart" in names else 0) + \
+            (len(self.num_vars) if set(names) - {"cat_chart"} else 0)
+        return self._stages.stage("charts", n_rows, n_cols)
+
+    def __repr__(self):
+        return "EDAReport(rows={}, cat_vars={!r}, num_vars={!r}, " \
+               "computed={!r})".format(len(self.dataframe), self.cat_vars,
+                                       self.num_vars, self.computed())
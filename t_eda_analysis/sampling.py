@@ -0,0 +1,346 @@
+import numpy as np
+import pandas as pd
+
+_METHODS = ("uniform", "reservoir", "stratified")
+_Z = 1.959963984540054
+_ERROR_ROWS = ["25%", "75%", "median", "mean", "sd"]
+
+
+class Sample:
+    """
+    Sampling option of the report functions. The statistics are then
+    estimated from a sample of the rows, with standard errors and 95%
+    confidence intervals, so that the runtime is set by the sample size.
+
+    Parameters
+    -----------
+    n: `int`
+        The number of rows to sample.
+    method: `str`, optional
+        "uniform" (default) draws the rows uniformly without replacement,
+        reading only the sampled rows. "reservoir" draws the same kind of
+        sample in a single pass over chunks of rows, see
+        `reservoir_sample`. "stratified" draws from every stratum of the
+        `strata` column in proportion to its size, at least one row per
+        stratum, so that rare strata are represented. `n` should then be
+        at least the number of strata.
+    strata: `str`, optional
+        The column defining the strata of the "stratified" method.
+    seed: `int`, optional
+        The seed of the random sample.
+
+    Examples
+    ---------
+    >>> sample = Sample(100000, method="stratified", strata="type", seed=0)
+    >>> summary, plot = describe_num_var(X, ['height'], sample=sample)
+    >>> summary.attrs["standard_error"]
+    """
+
+    def __init__(self, n, method="uniform", strata=None, seed=0):
+        if not isinstance(n, int) or n <= 0:
+            raise Exception("The value of the argument 'n' " +
+                            "should be a positive integer.")
+
+        if method not in _METHODS:
+            raise Exception("The value of the argument 'method' " +
+                            "should be one of " + ", ".join(_METHODS) + ".")
+
+        if (method == "stratified") != isinstance(strata, str):
+            raise Exception("The argument 'strata' should be the name of " +
+                            "a column, only for the stratified method.")
+
+        self.n = n
+        self.method = method
+        self.strata = strata
+        self.seed = seed
+
+    def __repr__(self):
+        return "Sample(n={!r}, method={!r}, strata={!r}, seed={!r})".format(
+            self.n, self.method, self.strata, self.seed)
+
+
+def check_sample(sample, dataframe):
+    """
+    Checks the sampling option of a report function.
+
+    Parameters
+    -----------
+    sample: `Sample` or `int`
+        The sampling option, an `int` drawing that many rows uniformly.
+    dataframe: `pandas.DataFrame`
+        The dataframe to sample.
+
+    Returns
+    --------
+    `Sample`
+        The sampling option.
+    """
+    if isinstance(sample, int) and not isinstance(sample, bool):
+        sample = Sample(sample)
+
+    if not isinstance(sample, Sample):
+        raise Exception("The value of the argument 'sample' should be " +
+                        "a positive integer or a Sample.")
+
+    if sample.strata is not None and sample.strata not in dataframe.columns:
+        raise Exception("The argument 'strata' should be one of the " +
+                        "column names from the dataframe.")
+
+    return sample
+
+
+def draw(dataframe, sample, columns):
+    """
+    Draws the sample of the rows of a dataframe.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe to sample.
+    sample: `Sample`
+        The sampling option.
+    columns: `list`
+        The columns to keep.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        The sampled rows, in their original order.
+    """
+    positions = dataframe.columns.get_indexer(columns)
+    n_rows = len(dataframe)
+    if sample.n >= n_rows:
+        return dataframe.iloc[:, positions]
+
+    if sample.method == "reservoir":
+        chunks = (dataframe.iloc[start:start + 100000, positions]
+                  for start in range(0, n_rows, 100000))
+        return reservoir_sample(chunks, sample.n, sample.seed)
+
+    rng = np.random.default_rng(sample.seed)
+    if sample.method == "uniform":
+        rows = rng.choice(n_rows, sample.n, replace=False)
+    else:
+        rows = _stratified_rows(dataframe[sample.strata], sample.n, rng)
+    return dataframe.iloc[np.sort(rows), positions]
+
+
+def _stratified_rows(strata, n, rng):
+    """
+    Draws the positions of n rows, allocated to the strata in proportion
+    to their sizes by largest remainder, at least one row per stratum.
+    """
+    codes, _ = pd.factorize(strata)
+    # NA values form a stratum of their own
+    codes = codes + 1
+    sizes = np.bincount(codes)
+    n_strata = np.count_nonzero(sizes)
+    if n < n_strata:
+        raise Exception("The value of the argument 'n' should be at least " +
+                        "the number of strata, {}.".format(n_strata))
+
+    quotas = n * sizes / len(codes)
+    alloc = np.floor(quotas).astype(np.int64)
+    remainder = n - alloc.sum()
+    alloc[np.argsort(alloc - quotas, kind="stable")[:remainder]] += 1
+    alloc = np.minimum(np.maximum(alloc, sizes > 0), sizes)
+    # The rows given to the small strata are taken from the largest ones,
+    # which keep at least one row
+    excess = alloc.sum() - n
+    while excess > 0:
+        largest = np.argmax(alloc)
+        taken = min(excess, alloc[largest] - 1)
+        alloc[largest] -= taken
+        excess -= taken
+
+    order = np.argsort(codes, kind="stable")
+    ends = np.cumsum(sizes)
+    rows = [rng.choice(order[end - size:end], count, replace=False)
+            for size, end, count in zip(sizes, ends, alloc) if count]
+    return np.concatenate(rows)
+
+
+def reservoir_sample(chunks, n, seed=0):
+    """
+    Draws n rows uniformly without replacement from chunks of rows in a
+    single pass, keeping at most n rows in memory. Every row gets a random
+    key and the rows of the n smallest keys are kept, so that samples of
+    separate streams can also be merged by their keys.
+
+    Parameters
+    -----------
+    chunks: iterable
+        The chunks of rows as `pandas.DataFrame`, such as
+        `streaming.iter_chunks(path)`.
+    n: `int`
+        The number of rows to sample.
+    seed: `int`, optional
+        The seed of the random keys.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        The sampled rows, in their order in the stream.
+
+    Examples
+    ---------
+    >>> rows = reservoir_sample(streaming.iter_chunks("data.csv"), 100000)
+    """
+    rng = np.random.default_rng(seed)
+    kept, keys = None, np.empty(0)
+    for chunk in chunks:
+        chunk_keys = rng.random(len(chunk))
+        if kept is None:
+            kept, keys = chunk, chunk_keys
+        else:
+            if len(keys) == n:
+                # Only the rows beating the largest kept key can enter
+                beat = chunk_keys < keys.max()
+                chunk, chunk_keys = chunk[beat], chunk_keys[beat]
+            kept = pd.concat([kept, chunk])
+            keys = np.concatenate([keys, chunk_keys])
+        if len(keys) > n:
+            best = np.sort(np.argpartition(keys, n - 1)[:n])
+            kept, keys = kept.iloc[best], keys[best]
+    return kept if kept is not None else pd.DataFrame()
+
+
+def num_errors(sampled, num_vars, n_population):
+    """
+    Estimates the standard errors and 95% confidence intervals of the
+    summary of `describe_num_var` from a sample. The errors of the mean and
+    standard deviation use their asymptotic variances, the intervals of the
+    quantiles use the distribution free order statistics bounds. All of
+    them include the finite population correction, and are conservative
+    for a stratified sample. The minimum and maximum have no error bounds,
+    so they are left out.
+
+    Parameters
+    -----------
+    sampled: `pandas.DataFrame`
+        The sampled rows.
+    num_vars: `list`
+        The names of the numeric variables.
+    n_population: `int`
+        The number of rows of the sampled dataframe.
+
+    Returns
+    --------
+    tuple
+        The standard errors, the lower bounds and the upper bounds, as
+        `pandas.DataFrame` with the rows '25%', '75%', 'median', 'mean'
+        and 'sd'.
+    """
+    fpc = max(1 - len(sampled) / n_population, 0.0) if n_population else 0.0
+    errors = {name: pd.DataFrame(np.nan, index=_ERROR_ROWS,
+                                 columns=num_vars)
+              for name in ["se", "lower", "upper"]}
+
+    for item in num_vars:
+        values = np.sort(sampled[item].to_numpy(dtype=np.float64))
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            continue
+
+        mean = values.mean()
+        m2 = np.mean((values - mean) ** 2)
+        m4 = np.mean((values - mean) ** 4)
+        sd = np.sqrt(m2)
+        se_mean = np.sqrt(m2 / max(n - 1, 1) * fpc)
+        se_sd = np.sqrt(max(m4 - m2 * m2, 0.0) / n * fpc) / (2 * sd) \
+            if sd > 0 else 0.0
+        for row, estimate, se in [("mean", mean, se_mean),
+                                  ("sd", sd, se_sd)]:
+            errors["se"].loc[row, item] = se
+            errors["lower"].loc[row, item] = estimate - _Z * se
+            errors["upper"].loc[row, item] = estimate + _Z * se
+
+        for row, q in [("25%", 0.25), ("75%", 0.75), ("median", 0.5)]:
+            # Bounds at the ranks q * n -+ z * sqrt(n * q * (1 - q)),
+            # interpolated like the quantile itself
+            half = _Z * np.sqrt(n * q * (1 - q) * fpc)
+            ranks = np.clip([q * (n - 1) - half, q * (n - 1) + half],
+                            0, n - 1)
+            lower, upper = np.interp(ranks, np.arange(n), values)
+            errors["se"].loc[row, item] = (upper - lower) / (2 * _Z)
+            errors["lower"].loc[row, item] = lower
+            errors["upper"].loc[row, item] = upper
+
+    return errors["se"], errors["lower"], errors["upper"]
+
+
+def scale_counts(counts, n_sample, n_population, bounds=False):
+    """
+    Estimates population counts from the counts of a sample.
+
+    Parameters
+    -----------
+    counts: array-like
+        The counts in the sample.
+    n_sample: `int`
+        The number of sampled rows.
+    n_population: `int`
+        The number of rows of the sampled dataframe.
+    bounds: `bool`, optional
+        Whether to also return the 95% confidence intervals of the
+        estimated counts.
+
+    Returns
+    --------
+    `numpy.ndarray` or `tuple`
+        The estimated counts, and their lower and upper bounds if `bounds`
+        is True.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    if not n_sample:
+        scaled = np.zeros_like(counts)
+        return (scaled, scaled, scaled) if bounds else scaled
+
+    p = counts / n_sample
+    scaled = p * n_population
+    if not bounds:
+        return scaled
+    fpc = max(1 - n_sample / n_population, 0.0)
+    half = _Z * n_population * np.sqrt(p * (1 - p) / n_sample * fpc)
+    return scaled, np.maximum(scaled - half, 0), scaled + half
+
+
+def attach_num_errors(summary, sampled, num_vars, n_population, sample):
+    """
+    Records in the attrs of a summary computed from a sample its standard
+    errors as "standard_error", its 95% confidence intervals as "lower"
+    and "upper", and the sample as "sample". Every row is then listed in
+    "approximate".
+    """
+    se, lower, upper = num_errors(sampled, num_vars, n_population)
+    summary.attrs["approximate"] = list(summary.index)
+    summary.attrs["standard_error"] = se
+    summary.attrs["lower"] = lower
+    summary.attrs["upper"] = upper
+    summary.attrs["sample"] = sample_info(sample, len(sampled),
+                                          n_population)
+    return summary
+
+
+def estimate_categories(table, n_sample, n_population):
+    """
+    Turns the category counts of a sample into estimated population counts
+    with the 95% confidence intervals in the columns 'lower' and 'upper'.
+    """
+    table = table.copy()
+    table["count"], table["lower"], table["upper"] = scale_counts(
+        table["count"], n_sample, n_population, bounds=True)
+    return table
+
+
+def sample_info(sample, n_sample, n_population):
+    """
+    Returns
+    --------
+    dict
+        The description of a sample recorded in the attrs of the results.
+    """
+    return {"method": sample.method, "strata": sample.strata,
+            "seed": sample.seed, "rows": n_sample,
+            "population": n_population}
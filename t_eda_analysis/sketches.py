@@ -0,0 +1,331 @@
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch of Karnin, Lang and Liberty (KLL). The values
+    are kept in a stack of compactors, the values of level h standing for
+    2 ** h values each. When a level is full, it is sorted and every other
+    value, starting at random, is promoted to the level above, which halves
+    the memory while keeping the rank of any value within a small error.
+
+    Parameters
+    -----------
+    error: `float`, optional
+        The target rank error, as a fraction of the number of values. The
+        sketch keeps in the order of 1 / error values.
+    seed: `int`, optional
+        The seed of the random compactions, fixed by default so that the
+        same values give the same estimates. None seeds them from the
+        operating system.
+
+    Examples
+    ---------
+    >>> sketch = KLLSketch(error=0.01)
+    >>> for chunk in pandas.read_csv("data.csv", chunksize=100000):
+    ...     sketch.update(chunk["height"].to_numpy())
+    >>> sketch.quantile([0.25, 0.5, 0.75])
+    """
+
+    _decay = 2.0 / 3.0
+
+    def __init__(self, error=0.01, seed=0):
+        if not 0 < error < 1:
+            raise Exception("The value of the argument 'error' " +
+                            "should be between 0 and 1.")
+
+        self.error = error
+        self.k = int(np.ceil(2.0 / error))
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.RandomState(seed)
+
+    def update(self, values):
+        """
+        Adds an array of values, NA and infinite values are ignored.
+
+        Returns
+        --------
+        `KLLSketch`
+            The updated sketch.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Adds the values summarised by another sketch.
+
+        Returns
+        --------
+        `KLLSketch`
+            The updated sketch.
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _capacity(self, h):
+        depth = len(self.levels) - h - 1
+        return max(2, int(np.ceil(self.k * self._decay ** depth)))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) >= self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                # An odd value out stays on this level
+                keep = level[len(level) - len(level) % 2:]
+                level = level[:len(level) - len(level) % 2]
+                promoted = level[self._rng.randint(2)::2]
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1],
+                                                     promoted])
+                self.levels[h] = keep
+            h += 1
+
+    def quantile(self, q):
+        """
+        Estimates quantiles of the values, interpolating between the closest
+        ranks like `numpy.quantile`.
+
+        Parameters
+        -----------
+        q: `float` or array-like
+            The quantiles to estimate, between 0 and 1.
+
+        Returns
+        --------
+        `float` or `numpy.ndarray`
+            The estimated quantiles, NaN if the sketch is empty.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if not self.count:
+            return np.full(q.shape, np.nan)[()]
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h)
+                                  for h, level in enumerate(self.levels)])
+        order = np.argsort(values, kind="mergesort")
+        values, weights = values[order], weights[order]
+
+        # Each value stands for the ranks cum - weight to cum - 1 and is
+        # placed at their center, the ranks in between are interpolated
+        centers = np.cumsum(weights) - (weights + 1) / 2.0
+        return np.interp(q * (self.count - 1), centers, values)[()]
+
+    def __len__(self):
+        return sum(len(level) for level in self.levels)
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct count sketch of Flajolet et al. (HyperLogLog). Each
+    value is hashed with `pandas.util.hash_array`, the first `precision`
+    bits of the hash pick a register and the register keeps the longest run
+    of leading zeros seen in the remaining bits.
+
+    Parameters
+    -----------
+    precision: `int`, optional
+        The number of bits picking a register, between 4 and 18. The sketch
+        keeps 2 ** precision registers of one byte and its relative error is
+        about 1.04 / sqrt(2 ** precision).
+
+    Examples
+    ---------
+    >>> hll = HyperLogLog()
+    >>> for chunk in pandas.read_csv("data.csv", chunksize=100000):
+    ...     hll.update(chunk["url"])
+    >>> hll.estimate()
+    """
+
+    def __init__(self, precision=14):
+        if not isinstance(precision, int) or not 4 <= precision <= 18:
+            raise Exception("The value of the argument 'precision' " +
+                            "should be an integer between 4 and 18.")
+
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update(self, values):
+        """
+        Adds an array of values, NA values are ignored.
+
+        Returns
+        --------
+        `HyperLogLog`
+            The updated sketch.
+        """
+        # Hashed as objects so that a value gets the same hash whatever the
+        # dtype of the array holding it
+        values = pd.Series(values).dropna().to_numpy(dtype=object)
+        if not len(values):
+            return self
+
+        hashes = pd.util.hash_array(values)
+        bits = 64 - self.precision
+        index = (hashes >> np.uint64(bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << bits) - 1)
+
+        # Leading zeros of the remaining bits, from their bit length, split
+        # in two halves so that every half is exact as a float
+        high = (rest >> np.uint64(32)).astype(np.float64)
+        low = (rest & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        length = np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+        rank = (bits - length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        """
+        Adds the values summarised by another sketch of the same precision.
+
+        Returns
+        --------
+        `HyperLogLog`
+            The updated sketch.
+        """
+        if other.precision != self.precision:
+            raise Exception("Only sketches of the same precision " +
+                            "can be merged.")
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        """
+        Returns
+        --------
+        `float`
+            The estimated number of distinct values.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype(
+            np.float64))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return float(estimate)
+
+
+class SpaceSaving:
+    """
+    Mergeable heavy hitters sketch of Metwally et al. (Space-Saving). At
+    most `capacity` values are counted. A value that is not counted has
+    appeared at most `min_count()` times, and the count of a counted value
+    overestimates its frequency by at most its error. Batches of values are
+    counted exactly with `pandas.Series.value_counts` and merged like
+    sketches, following Agarwal et al.
+
+    Parameters
+    -----------
+    capacity: `int`, optional
+        The number of values counted.
+
+    Examples
+    ---------
+    >>> top = SpaceSaving(capacity=1000)
+    >>> for chunk in pandas.read_csv("data.csv", chunksize=100000):
+    ...     top.update(chunk["url"])
+    >>> top.top(10)
+    """
+
+    def __init__(self, capacity=1000):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise Exception("The value of the argument 'capacity' " +
+                            "should be a positive integer.")
+
+        self.capacity = capacity
+        self.n_values = 0
+        self.counts = pd.Series([], dtype=np.int64)
+        self.errors = pd.Series([], dtype=np.int64)
+
+    def update(self, values):
+        """
+        Adds an array of values, NA values are ignored.
+
+        Returns
+        --------
+        `SpaceSaving`
+            The updated sketch.
+        """
+        return self.update_counts(pd.Series(values).value_counts(dropna=True))
+
+    def update_counts(self, counts):
+        """
+        Adds exact counts of values.
+
+        Parameters
+        -----------
+        counts: `pandas.Series`
+            The counts indexed by value.
+
+        Returns
+        --------
+        `SpaceSaving`
+            The updated sketch.
+        """
+        counts = pd.Series(counts.to_numpy(dtype=np.int64),
+                           index=counts.index.astype(object))
+        self.n_values += int(counts.sum())
+        return self._merge(counts, pd.Series(0, index=counts.index), 0)
+
+    def merge(self, other):
+        """
+        Adds the values summarised by another sketch.
+
+        Returns
+        --------
+        `SpaceSaving`
+            The updated sketch.
+        """
+        self.n_values += other.n_values
+        return self._merge(other.counts, other.errors, other.min_count())
+
+    def _merge(self, counts, errors, other_min):
+        own_min = self.min_count()
+        index = self.counts.index.union(counts.index, sort=False)
+        total = self.counts.reindex(index, fill_value=own_min) + \
+            counts.reindex(index, fill_value=other_min)
+        error = self.errors.reindex(index, fill_value=own_min) + \
+            errors.reindex(index, fill_value=other_min)
+        total = total.sort_values(ascending=False, kind="mergesort")
+        self.counts = total.iloc[:self.capacity].astype(np.int64)
+        self.errors = error[self.counts.index].astype(np.int64)
+        return self
+
+    def min_count(self):
+        """
+        Returns
+        --------
+        `int`
+            The largest possible count of a value that is not counted.
+        """
+        if len(self.counts) < self.capacity:
+            return 0
+        return int(self.counts.iloc[-1])
+
+    def top(self, k):
+        """
+        Returns
+        --------
+        `pandas.Series`
+            The k values with the largest counts, sorted by decreasing
+            count.
+        """
+        return self.counts.iloc[:k]
@@ -0,0 +1,211 @@
+import os
+
+import pandas as pd
+
+from t_eda_analysis import parallel
+from t_eda_analysis.profile import EDAProfile
+
+
+def generate_report_stream(source, cat_vars, num_vars, chunksize=100000,
+                           **read_kwargs):
+    """
+    This function generates the EDA report of `generate_report` for data
+    that does not fit in memory, reading it one chunk of rows at a time.
+    Only the statistics of the chunks are kept, so the peak memory is
+    bounded by the chunk size.
+
+    Parameters
+    -----------
+    source: `str`, `pandas.DataFrame` or iterable
+        The path of a CSV or Parquet file, a dataframe, or an iterable of
+        dataframe chunks such as `pandas.read_csv(path, chunksize=...)`
+    cat_vars: `list`
+        A list containing names of categorical variables
+    num_vars: `list`
+        A list containing names of numerical variable
+    chunksize: `int`, optional
+        The number of rows read at a time from a file or a dataframe
+    **read_kwargs
+        Extra arguments of `pandas.read_csv`
+
+    Returns
+    --------
+    boolean
+        It returns True on successful execution else returns False
+
+    Examples
+    ---------
+    >>> cat_vars = ['type']
+    >>> num_vars = ['height']
+    >>> generate_report_stream("data.csv", cat_vars, num_vars)
+    """
+
+    try:
+        profile = profile_stream(source, cat_vars, num_vars, chunksize,
+                                 **read_kwargs)
+
+    except Exception as ex:
+
+        print("The report was not generated successfully")
+        print(ex)
+        return False
+
+    return profile.report()
+
+
+def profile_stream(source, cat_vars, num_vars, chunksize=100000, bins=30,
+                   quantile_error=0.01, **read_kwargs):
+    """
+    Feeds every chunk of rows of a source into an `EDAProfile`.
+
+    Parameters
+    -----------
+    source: `str`, `pandas.DataFrame` or iterable
+        The path of a CSV or Parquet file, a dataframe, or an iterable of
+        dataframe chunks
+    cat_vars: `list`
+        A list containing names of categorical variables
+    num_vars: `list`
+        A list containing names of numerical variable
+    chunksize: `int`, optional
+        The number of rows read at a time from a file or a dataframe
+    bins: `int`, optional
+        The maximum number of histogram bins of each numerical variable
+    quantile_error: `float`, optional
+        The target rank error of the quantile sketches
+    **read_kwargs
+        Extra arguments of `pandas.read_csv`
+
+    Returns
+    --------
+    `EDAProfile`
+        The statistics of all the rows of the source, a `ReportAccumulator`
+
+    Examples
+    ---------
+    >>> acc = profile_stream("data.csv", ['type'], ['height'])
+    >>> acc.num_summary()
+    """
+    acc = EDAProfile(cat_vars, num_vars, bins, quantile_error)
+    for chunk in iter_chunks(source, chunksize, **read_kwargs):
+        acc.update(chunk)
+    return acc
+
+
+def profile_partitions(partitions, cat_vars, num_vars, n_jobs=-1,
+                       backend="process", chunksize=100000, bins=30,
+                       quantile_error=0.01, **read_kwargs):
+    """
+    Profiles every partition of a dataset in a separate worker and merges
+    the partial profiles, without concatenating the partitions. Each
+    worker reads its partition chunk by chunk like `profile_stream`, so
+    only the statistics of the partitions are sent back.
+
+    Parameters
+    -----------
+    partitions: `list`
+        The partitions, each a source of `profile_stream` such as the path
+        of a CSV or Parquet file or a dataframe
+    cat_vars: `list`
+        A list containing names of categorical variables
+    num_vars: `list`
+        A list containing names of numerical variable
+    n_jobs: `int`, optional
+        The number of workers, -1 (default) for one worker per core
+    backend: `str`, optional
+        "process" (default) or "thread", the kind of workers
+    chunksize: `int`, optional
+        The number of rows read at a time from a partition
+    bins: `int`, optional
+        The maximum number of histogram bins of each numerical variable
+    quantile_error: `float`, optional
+        The target rank error of the quantile sketches
+    **read_kwargs
+        Extra arguments of `pandas.read_csv`
+
+    Returns
+    --------
+    `EDAProfile`
+        The statistics of all the rows of the partitions, merged in the
+        order of the partitions
+
+    Examples
+    ---------
+    >>> paths = sorted(glob.glob("events/day=*.parquet"))
+    >>> acc = profile_partitions(paths, ['type'], ['height'], n_jobs=8)
+    >>> acc.num_summary()
+    >>> acc.corr_table()
+    """
+    # Check the arguments once rather than in every worker
+    acc = EDAProfile(cat_vars, num_vars, bins, quantile_error)
+    partitions = list(partitions)
+
+    with parallel.pool(n_jobs, backend) as run:
+        partials = run(_profile_partition,
+                       [(partition, cat_vars, num_vars, chunksize, bins,
+                         quantile_error, read_kwargs)
+                        for partition in partitions])
+
+    for partial in partials:
+        acc.merge(partial)
+    return acc
+
+
+def _profile_partition(source, cat_vars, num_vars, chunksize, bins,
+                       quantile_error, read_kwargs):
+    """
+    Profiles one partition, see `profile_partitions`.
+    """
+    return profile_stream(source, cat_vars, num_vars, chunksize, bins,
+                          quantile_error, **read_kwargs)
+
+
+def iter_chunks(source, chunksize=100000, columns=None, **read_kwargs):
+    """
+    Iterates over the chunks of rows of a source.
+
+    Parameters
+    -----------
+    source: `str`, `pandas.DataFrame` or iterable
+        The path of a CSV or Parquet file (read with the optional
+        dependency `pyarrow`), a dataframe, or an iterable of dataframe
+        chunks
+    chunksize: `int`, optional
+        The number of rows read at a time from a file or a dataframe
+    columns: `list`, optional
+        The columns to read from a file, all of them by default
+    **read_kwargs
+        Extra arguments of `pandas.read_csv`
+
+    Returns
+    --------
+    generator
+        The chunks as `pandas.DataFrame`
+    """
+    if not isinstance(chunksize, int) or chunksize <= 0:
+        raise Exception("The value of the argument 'chunksize' " +
+                        "should be a positive integer.")
+
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, max(len(source), 1), chunksize):
+            yield source.iloc[start:start + chunksize]
+
+    elif isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith((".parquet", ".pq")):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise Exception("Reading Parquet files requires the " +
+                                "optional dependency 'pyarrow'.")
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=chunksize,
+                                                   columns=columns):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(path, chunksize=chunksize,
+                                   usecols=columns, **read_kwargs)
+
+    else:
+        for chunk in source:
+            yield chunk
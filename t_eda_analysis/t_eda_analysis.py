@@ -1,9 +1,24 @@
-import altair as alt
 import numpy as np
 import pandas as pd
 
+from t_eda_analysis import cache, inference, instrument, parallel, sampling
+from t_eda_analysis.sketches import KLLSketch
 
-def generate_report(dataframe, cat_vars, num_vars):
+_NA_OUTPUTS = ("dataframe", "bool", "uint8", "packed")
+_NA_COUNT_NAME = "Number of NA values"
+_OTHER_LABEL = "Other"
+_HIGH_CARDINALITY_TOP_K = 20
+_MAX_DISTINCT = 1000
+_BIN_STRATEGIES = ("shared", "per_column")
+_SUMMARY_INDEX = ["25%", "75%", "min", "max", "median", "mean", "sd"]
+_QUANTILE_ROWS = ["25%", "75%", "median"]
+_REPORT_SECTIONS = ("na_counts", "categories", "summary", "correlation")
+_MAX_CORRELOGRAM_VARS = 50
+
+
+def generate_report(dataframe, cat_vars=None, num_vars=None, n_jobs=1,
+                    backend="thread", sample=None, callbacks=None,
+                    trace_memory=False, lazy=False, output=None):
     """
     This function generates an EDA report by plotting graphs and tables for the
     numeric variables, categorical variables, NA values and correlation
@@ -13,15 +28,50 @@ def generate_report(dataframe, cat_vars, num_vars):
     -----------
     dataframe: pandas.DataFrame
         The dataframe whose EDA analysis is to be performed
-    cat_vars: list
-        A list containing names of categorical variables
-    num_vars: list
-        A list containing names of numerical variable
+    cat_vars: list, optional
+        A list containing names of categorical variables. If omitted,
+        they are inferred by `inference.infer_column_types`
+    num_vars: list, optional
+        A list containing names of numerical variable. If omitted, they
+        are inferred by `inference.infer_column_types`
+    n_jobs: int, optional
+        The number of workers sharing the per-column work (NA counts,
+        category counts, numeric summaries and histograms), -1 for one
+        worker per core. The results do not depend on it
+    backend: str, optional
+        "thread" (default) or "process", the kind of workers. Processes
+        only summarize and bin the numeric variables, the NA and category
+        counts always run on threads
+    sample: int or sampling.Sample, optional
+        If given, the report is estimated from a sample of the rows, an
+        int drawing that many rows uniformly with a fixed seed. The counts
+        are scaled to the whole dataframe and the summary comes with its
+        standard errors and confidence intervals
+    callbacks: list, optional
+        Functions called with an `instrument.StageRecord` of every stage
+        of the report ("sample", "na_counts", "categories",
+        "numeric_summary", "correlation" and "charts"), holding its wall
+        time, CPU time, memory and the numbers of rows and columns it
+        handled. The stages read from the cache are not reported
+    trace_memory: bool, optional
+        Whether the records hold the peak memory of every stage traced by
+        `tracemalloc`, which slows the report down
+    lazy: bool, optional
+        If True, nothing is computed nor printed, and a `report.EDAReport`
+        is returned instead, whose sections (NA counts, categories,
+        numeric summary, correlation and charts) are computed on their
+        first access. Invalid arguments then raise an exception
+    output: str, optional
+        The path of an HTML file where the report is also saved, each
+        dataset of the charts being stored once, see
+        `report.EDAReport.save_html`
 
     Returns
     --------
     boolean
         It returns True on successful execution else returns False
+    `report.EDAReport`
+        If `lazy` is True, the lazy report
 
     Examples
     ---------
@@ -32,28 +82,24 @@ def generate_report(dataframe, cat_vars, num_vars):
     >>>cat_vars = ['type']
     >>>num_vars = ['height']
     >>> describe_cat_variable(X,cat_vars,num_vars)
+    >>> records = []
+    >>> generate_report(X, cat_vars, num_vars, callbacks=[records.append])
+    >>> summary = generate_report(X, cat_vars, num_vars, lazy=True).summary
+    >>> generate_report(X)
     """
+    # Imported here as the report module is built on this one
+    from t_eda_analysis.report import EDAReport
+
+    if lazy:
+        return EDAReport(dataframe, cat_vars, num_vars, n_jobs, backend,
+                         sample, callbacks, trace_memory)
 
     try:
-        na_df = describe_na_values(dataframe)
-        na_data = na_df.values
-        na_report = pd.DataFrame(data=np.sum(na_data != 1, axis=1),
-                                 index=list(dataframe.columns),
-                                 columns=['Number of NA values'])
-        print("Number of NA values in each column")
-        print(na_report)
-
-        cat_var_plot = describe_cat_var(dataframe, cat_vars)
-        num_var_desc, num_var_plot = describe_num_var(dataframe, num_vars)
-
-        print(' ')
-        print('Numerical variable summary')
-        print(num_var_desc)
-
-        print(' ')
-        print('Histograms and Correlation plot:')
-        cor_plot = calc_cor(dataframe, num_vars)
-        cat_var_plot & num_var_plot & cor_plot
+        report = EDAReport(dataframe, cat_vars, num_vars, n_jobs, backend,
+                           sample, callbacks, trace_memory)
+        report.show()
+        if output is not None:
+            report.save_html(output)
 
         return True
 
@@ -64,15 +110,150 @@ def generate_report(dataframe, cat_vars, num_vars):
         return False
 
 
-def describe_na_values(dataframe):
+def _infer_vars(dataframe, cat_vars, num_vars):
+    """
+    Fills the omitted lists of variables of a dataframe with the inferred
+    roles of its columns, see `inference.infer_column_types`.
+
+    Returns
+    --------
+    tuple
+        The lists of categorical and numerical variables.
+    """
+    if isinstance(dataframe, pd.DataFrame) and \
+            (cat_vars is None or num_vars is None):
+        roles = inference.infer_column_types(dataframe)
+        if cat_vars is None:
+            cat_vars = roles["cat_vars"]
+        if num_vars is None:
+            num_vars = roles["num_vars"]
+    return cat_vars, num_vars
+
+
+@cache.cached(ignore=("n_jobs", "backend", "stages"))
+def _report_tables(dataframe, cat_vars, num_vars, n_jobs=1,
+                   backend="thread", sample=None, stages=None,
+                   sections=_REPORT_SECTIONS):
+    """
+    Computes the tables of the report in one plan, so that the stages
+    share their intermediates. The inputs are checked once, each column is
+    scanned once for NA values, and the numeric variables are converted
+    once into a float64 block. The block is summarized and binned, and
+    then standardized in place for the correlation, so the peak memory is
+    a single copy of the numeric variables.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe whose EDA analysis is to be performed
+    cat_vars: `list`
+        A list containing names of categorical variables
+    num_vars: `list`
+        A list containing names of numerical variable
+    n_jobs: `int`, optional
+        The number of workers sharing the per-column work
+    backend: `str`, optional
+        "thread" or "process", the kind of workers
+    sample: `int` or `sampling.Sample`, optional
+        If given, the tables are estimated from a sample of the rows
+    stages: `instrument.Stages`, optional
+        The instrumentation of the stages
+    sections: `tuple`, optional
+        The tables to compute among 'na_counts', 'categories', 'summary'
+        (with the histogram bins) and 'correlation', all by default
+
+    Returns
+    --------
+    dict
+        The tables of the report: the NA counts as 'na_counts', the
+        category counts as 'categories', the numeric summary as 'summary',
+        the histogram bins as 'histograms' and the correlation table as
+        'correlation'. A sampled report also describes its sample as
+        'sample'
+    """
+    _check_cat_input(dataframe, cat_vars)
+    _check_num_input(dataframe, num_vars)
+    if stages is None:
+        stages = instrument.Stages()
+    n_population = len(dataframe)
+    if sample is not None:
+        sample = sampling.check_sample(sample, dataframe)
+        with stages.stage("sample", n_population, dataframe.shape[1]):
+            dataframe = sampling.draw(dataframe, sample,
+                                      list(dataframe.columns))
+    workers = parallel.check_jobs(n_jobs, backend)
+    if workers == 1:
+        backend = "thread"
+
+    numeric = "summary" in sections or "correlation" in sections
+    shape = (len(dataframe), len(num_vars))
+    # The NA and category scans run on threads, as pickling the columns to
+    # processes would cost more than scanning them
+    with parallel.shared_block(shape if numeric else (0, 0), backend) \
+            as (block, ref), parallel.pool(workers, backend) as run, \
+            parallel.pool(workers) as scan:
+        tables = {}
+        if "na_counts" in sections:
+            with stages.stage("na_counts", *dataframe.shape):
+                tables["na_counts"] = _na_counts(dataframe, scan)
+        if "categories" in sections:
+            with stages.stage("categories", len(dataframe), len(cat_vars)):
+                tables["categories"] = _category_counts(
+                    dataframe, cat_vars, None, _MAX_DISTINCT, scan)
+
+        if "summary" in sections:
+            with stages.stage("numeric_summary", *shape):
+                _numeric_block(dataframe, num_vars, out=block)
+                tables["summary"], tables["histograms"] = _describe_block(
+                    ref, num_vars, run=run)
+
+        if "correlation" in sections:
+            with stages.stage("correlation", *shape):
+                if "summary" not in sections:
+                    _numeric_block(dataframe, num_vars, out=block)
+                # The block is not read anymore, so it is standardized in
+                # place
+                corr = pd.DataFrame(_block_corr(block), index=num_vars,
+                                    columns=num_vars)
+                tables["correlation"] = _corr_table(corr)
+
+    if sample is not None:
+        n_sample = len(dataframe)
+        if "na_counts" in tables:
+            tables["na_counts"] = pd.Series(
+                sampling.scale_counts(tables["na_counts"], n_sample,
+                                      n_population),
+                index=tables["na_counts"].index, name=_NA_COUNT_NAME)
+        if "categories" in tables:
+            tables["categories"] = sampling.estimate_categories(
+                tables["categories"], n_sample, n_population)
+        if "summary" in tables:
+            sampling.attach_num_errors(tables["summary"], dataframe,
+                                       num_vars, n_population, sample)
+            tables["histograms"]["count"] = sampling.scale_counts(
+                tables["histograms"]["count"], n_sample, n_population)
+        tables["sample"] = sampling.sample_info(sample, n_sample,
+                                                n_population)
+
+    return tables
+
+
+def describe_na_values(dataframe, output="dataframe"):
     """
     Describes the na_values in an input pandas dataframe
-    as a 2d array of 1's and 0's
+    as a 2d array of 1's and 0's, or as a compact NA mask
 
     Parameters
     ----------
     dataframe: `Pandas.DataFrame`
         the input pd.DataFrame object
+    output: `str`, optional
+        The format of the result. "dataframe" (default) returns the
+        DataFrame of 1's and 0's. "bool" and "uint8" return a
+        columns x rows mask where True/1 marks an NA value, and "packed"
+        returns the same mask bit-packed along the rows with
+        `numpy.packbits` (use `numpy.unpackbits(mask, axis=1,
+        count=len(dataframe))` to recover it)
 
     Returns
     -------
@@ -80,6 +261,10 @@ def describe_na_values(dataframe):
         A DataFrame of 1's and 0's, corresponding to the value
         of each entry in the input dataframe
         0 represents an NA value, 1 represents a non-NA value
+    tuple
+        For any other `output`, a tuple of the NA mask as a
+        `numpy.ndarray` and the number of NA values in each column as a
+        `pandas.Series`
 
     Examples
     ---------
@@ -110,18 +295,138 @@ def describe_na_values(dataframe):
     Pandas.DataFrame([[1, 1],
                      [1, 1],
                      [0, 1]], index=["col_1", "col_2", "col_3"]])
+    >>> mask, na_counts = describe_na_values(na_numerical_dataframe,
+                                             output="packed")
     """
 
     if not isinstance(dataframe, pd.DataFrame):
         raise Exception("the input data is not a dataframe.")
 
-    bool_array = dataframe.isna()
-    na_val = np.array([[0 if val else 1 for val in bool_array[col]]
-                       for col in bool_array.columns])
-    return pd.DataFrame(data=na_val, index=dataframe.columns)
+    if output not in _NA_OUTPUTS:
+        raise Exception("The value of the argument 'output' must be one " +
+                        "of " + ", ".join(_NA_OUTPUTS))
+
+    mask, na_counts = _na_mask(dataframe, packed=(output == "packed"))
+    if output == "dataframe":
+        return pd.DataFrame(data=(~mask).astype(np.int64),
+                            index=dataframe.columns)
+    if output == "uint8":
+        mask = mask.view(np.uint8)
+    return mask, na_counts
+
+
+@cache.cached()
+def count_na_values(dataframe, n_jobs=1, backend="thread"):
+    """
+    Counts the na_values in each column of an input pandas dataframe
+    without building the full NA mask
+
+    Parameters
+    ----------
+    dataframe: `Pandas.DataFrame`
+        the input pd.DataFrame object
+    n_jobs: `int`, optional
+        The number of workers counting the columns, -1 for one worker per
+        core
+    backend: `str`, optional
+        "thread" (default) or "process". The columns are always counted
+        on threads, as pickling them to processes would cost more than
+        counting them
+
+    Returns
+    -------
+    `pandas.Series`
+        The number of NA values in each column, indexed by column name
+
+    Examples
+    ---------
+    >>> na_numerical_dataframe = pd.DataFrame({
+                                           "col_1": [0, 2],
+                                           "col_2": [numpy.nan, 0.1],
+                                           "col_3": ["a", "b"]
+                                           }),
+    >>> count_na_values(na_numerical_dataframe)
+    col_1    0
+    col_2    1
+    col_3    0
+    Name: Number of NA values, dtype: int64
+    """
+
+    if not isinstance(dataframe, pd.DataFrame):
+        raise Exception("the input data is not a dataframe.")
+
+    workers = parallel.check_jobs(n_jobs, backend)
+    with parallel.pool(workers) as run:
+        return _na_counts(dataframe, run)
+
 
+def _na_counts(dataframe, run=parallel.serial):
+    """
+    Counts the NA values of every column of a dataframe.
+
+    Parameters
+    ----------
+    dataframe: `pandas.DataFrame`
+        the input pd.DataFrame object
+    run: `function`, optional
+        Runs the counting of each column, see `parallel.pool`
+
+    Returns
+    -------
+    `pandas.Series`
+        The number of NA values in each column, indexed by column name
+    """
+    na_counts = run(_count_na, [(col,) for _, col in dataframe.items()])
+    return pd.Series(np.array(na_counts, dtype=np.int64),
+                     index=dataframe.columns, name=_NA_COUNT_NAME)
+
+
+def _count_na(col):
+    """
+    Counts the NA values of one column.
+    """
+    return np.count_nonzero(col.isna().to_numpy())
+
+
+def _na_mask(dataframe, packed=False):
+    """
+    Builds the columns x rows NA mask of a dataframe one column at a
+    time, so that the peak memory is the mask plus a single column.
 
-def describe_cat_var(dataframe, cat_vars, n_cols=3):
+    Parameters
+    ----------
+    dataframe: `pandas.DataFrame`
+        the input pd.DataFrame object
+    packed: `bool`, optional
+        Whether to bit-pack each row of the mask with `numpy.packbits`
+
+    Returns
+    -------
+    tuple
+        The mask as a `numpy.ndarray` (`bool`, or `uint8` when packed)
+        and the NA counts of each column as a `pandas.Series`
+    """
+    n_rows = len(dataframe)
+    if packed:
+        mask = np.empty((dataframe.shape[1], (n_rows + 7) // 8),
+                        dtype=np.uint8)
+    else:
+        mask = np.empty((dataframe.shape[1], n_rows), dtype=bool)
+    na_counts = np.empty(dataframe.shape[1], dtype=np.int64)
+
+    for i, (_, col) in enumerate(dataframe.items()):
+        col_mask = col.isna().to_numpy()
+        na_counts[i] = np.count_nonzero(col_mask)
+        mask[i] = np.packbits(col_mask) if packed else col_mask
+
+    return mask, pd.Series(na_counts, index=dataframe.columns,
+                           name=_NA_COUNT_NAME)
+
+
+@cache.cached("cat_vars")
+def describe_cat_var(dataframe, cat_vars=None, n_cols=3, top_k=None,
+                     max_distinct=_MAX_DISTINCT, n_jobs=1, backend="thread",
+                     sample=None):
     """
     This function will take dataframe and categorical variable names and will
     plot the histogram of each categorical variable
@@ -130,15 +435,38 @@ def describe_cat_var(dataframe, cat_vars, n_cols=3):
     -----------
     dataframe: `pandas.DataFrame`
         The dataframe whose EDA analysis is to be performed
-    cat_vars: `list`
-        A list containing names of categorical variables
+    cat_vars: `list`, optional
+        A list containing names of categorical variables. If omitted, they
+        are inferred by `inference.infer_column_types`
     n_cols: `int`, optional
         A number indicating how many plots should be displayed in a row
+    top_k: `int`, optional
+        If given, only the top_k most frequent categories of each variable
+        are plotted and the remaining ones are summed into an "Other" bar
+    max_distinct: `int`, optional
+        The variables with more distinct categories only plot their top_k
+        (by default 20) most frequent categories and an "Other" bar, and
+        show their number of distinct categories in the title. None plots
+        every category
+    n_jobs: `int`, optional
+        The number of workers counting the categories of the variables, -1
+        for one worker per core
+    backend: `str`, optional
+        "thread" (default) or "process". The categories are always
+        counted on threads, as pickling the columns to processes would
+        cost more than counting them
+    sample: `int` or `sampling.Sample`, optional
+        If given, the category counts are estimated from a sample of the
+        rows, an `int` drawing that many rows uniformly with a fixed seed.
+        The plot data then holds the estimated counts of the whole
+        dataframe with their 95% confidence intervals in the columns
+        'lower' and 'upper'
 
     Returns
     --------
     `altair`
-        a grid of altair plot containing all histograms
+        a grid of altair plot containing all histograms. The categories
+        are counted before plotting, so the plot only holds the counts
 
     Examples
     ---------
@@ -150,7 +478,65 @@ def describe_cat_var(dataframe, cat_vars, n_cols=3):
     >>> describe_cat_variable(X,cat_vars)
     """
 
+    cat_vars, _ = _infer_vars(dataframe, cat_vars, [])
+
     # Checking for valid inputs
+    _check_cat_input(dataframe, cat_vars)
+
+    if not isinstance(n_cols, int) or n_cols <= 0:
+        raise Exception("The value of the argument 'n_cols' must be " +
+                        "a positive non zero integer")
+
+    data = _cat_table(dataframe, cat_vars, top_k, max_distinct, n_jobs,
+                      backend, sample)
+    return _cat_chart(data, cat_vars, n_cols, top_k)
+
+
+def _cat_table(dataframe, cat_vars, top_k=None, max_distinct=_MAX_DISTINCT,
+               n_jobs=1, backend="thread", sample=None):
+    """
+    Counts the categories plotted by `describe_cat_var`, see
+    `tables.category_counts`.
+    """
+    _check_cat_input(dataframe, cat_vars)
+
+    if top_k is not None and (not isinstance(top_k, int) or top_k <= 0):
+        raise Exception("The value of the argument 'top_k' must be " +
+                        "a positive non zero integer")
+
+    if max_distinct is not None and \
+            (not isinstance(max_distinct, int) or max_distinct <= 0):
+        raise Exception("The value of the argument 'max_distinct' must be " +
+                        "a positive non zero integer")
+
+    n_population = len(dataframe)
+    if sample is not None:
+        sample = sampling.check_sample(sample, dataframe)
+        dataframe = sampling.draw(dataframe, sample, cat_vars)
+
+    workers = parallel.check_jobs(n_jobs, backend)
+    with parallel.pool(workers) as run:
+        data = _category_counts(dataframe, cat_vars, top_k, max_distinct, run)
+
+    if sample is not None:
+        data = sampling.estimate_categories(data, len(dataframe),
+                                            n_population)
+        data.attrs["sample"] = sampling.sample_info(sample, len(dataframe),
+                                                    n_population)
+    return data
+
+
+def _check_cat_input(dataframe, cat_vars):
+    """
+    Checks the dataframe and the categorical variables of a report.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe whose EDA analysis is to be performed
+    cat_vars: `list`
+        A list containing names of categorical variables
+    """
     if not isinstance(dataframe, pd.DataFrame):
         raise Exception("The value of the argument 'dataframe' must be " +
                         "of type 'pandas.DataFrame'")
@@ -160,18 +546,45 @@ def describe_cat_var(dataframe, cat_vars, n_cols=3):
         raise Exception("The value of the argument 'cat_vars' must be " +
                         "a list of strings")
 
-    if not isinstance(n_cols, int) or n_cols <= 0:
-        raise Exception("The value of the argument 'n_cols' must be " +
-                        "a positive non zero integer")
-
     col_set = set(dataframe.columns)
     col_subset = set(cat_vars)
     if not col_subset.issubset(col_set):
         raise Exception("The input categorical column names must belong to " +
                         "the dataframe")
 
-    dataframe = dataframe.dropna()
-    data = dataframe[col_subset]
+
+def _cat_chart(data, cat_vars, n_cols=3, top_k=None):
+    """
+    Plots a long-form table of category counts as a grid of histograms.
+
+    Parameters
+    -----------
+    data: `pandas.DataFrame`
+        A dataframe with the columns 'variable', 'category' and 'count'
+    cat_vars: `list`
+        A list containing names of categorical variables
+    n_cols: `int`, optional
+        A number indicating how many plots should be displayed in a row
+    top_k: `int`, optional
+        Whether the counts were limited to the top_k categories, which
+        sorts the bars by decreasing count. The variables listed in
+        `data.attrs["distinct"]` are always sorted by decreasing count and
+        show their number of distinct categories in the title
+
+    Returns
+    --------
+    `altair`
+        a grid of altair plot containing all histograms
+    """
+    # Altair is only imported once a chart is requested, so that the
+    # tables are computed without its import cost
+    import altair as alt
+
+    if not cat_vars:
+        return alt.VConcatChart(vconcat=[], data=data)
+
+    distinct = data.attrs.get("distinct", {})
+    by_count = alt.EncodingSortField(field='count', order='descending')
     n = len(cat_vars)
     n_cols = n_cols
     n_rows = int(np.ceil(n / n_cols))
@@ -184,11 +597,18 @@ def describe_cat_var(dataframe, cat_vars, n_cols=3):
                 cols = cat_vars[z]
             else:
                 break
-            hist = alt.Chart(data).mark_bar(width=40).encode(
-                x=alt.X(cols + ':O'),
-                y='count()'
-            ).properties(height=200, width=300, title='Histogram of '
-                                                      + cat_vars[z])
+            title = 'Histogram of ' + cat_vars[z]
+            sort = 'ascending'
+            if cols in distinct:
+                title += ' ({:,.0f} distinct)'.format(distinct[cols])
+            if top_k is not None or cols in distinct:
+                sort = by_count
+            hist = alt.Chart().mark_bar(width=40).encode(
+                x=alt.X('category:O', title=cols, sort=sort),
+                y=alt.Y('count:Q', title='Count')
+            ).transform_filter(
+                alt.FieldEqualPredicate(field='variable', equal=cols)
+            ).properties(height=200, width=300, title=title)
             z = z + 1
             if j == 0:
                 row_plot = hist
@@ -199,28 +619,201 @@ def describe_cat_var(dataframe, cat_vars, n_cols=3):
         else:
             plot = alt.vconcat(plot, row_plot)
 
+    # All the histograms share a single table of counts
+    plot.data = data
     return plot
 
 
-def describe_num_var(dataframe, num_vars):
+def _category_counts(dataframe, cat_vars, top_k=None, max_distinct=None,
+                     run=parallel.serial):
+    """
+    Counts the categories of each categorical variable, dropping the NA
+    values of that variable only.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe holding the categorical variables
+    cat_vars: `list`
+        A list containing names of categorical variables
+    top_k: `int`, optional
+        If given, keep the top_k most frequent categories of each variable
+        and sum the remaining ones into an "Other" category
+    max_distinct: `int`, optional
+        If given, the variables with more distinct categories only keep
+        their top_k (by default 20) most frequent categories
+    run: `function`, optional
+        Runs the counting of each variable, see `parallel.pool`
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        A dataframe with the columns 'variable', 'category' and 'count'.
+        The number of distinct categories of the variables cut down by
+        `max_distinct` is kept in `table.attrs["distinct"]`
+    """
+    all_counts = run(_value_counts, [(dataframe[item],) for item in cat_vars])
+    return _category_table(cat_vars, all_counts, top_k, max_distinct)
+
+
+def _category_table(cat_vars, all_counts, top_k=None, max_distinct=None):
+    """
+    Formats the category counts of each variable as the table of
+    `_category_counts`, sorted by `_sort_counts`.
+    """
+    value_counts = []
+    distinct = {}
+    for item, counts in zip(cat_vars, all_counts):
+        counts = _sort_counts(counts)
+        item_top_k = top_k
+        if max_distinct is not None and len(counts) > max_distinct:
+            distinct[item] = len(counts)
+            item_top_k = top_k or _HIGH_CARDINALITY_TOP_K
+        value_counts.append((item, _top_counts(counts, item_top_k)))
+
+    table = _count_table(value_counts)
+    table.attrs["distinct"] = distinct
+    return table
+
+
+def _value_counts(col):
+    """
+    Counts the categories of one column, NA values dropped.
+    """
+    return col.value_counts(dropna=True)
+
+
+def _sort_counts(counts):
+    """
+    Sorts the counts of the categories in decreasing order, the categories
+    of equal counts in increasing order, so that the order does not depend
+    on the order the categories were read in.
+    """
+    try:
+        counts = counts.sort_index(kind="mergesort")
+    except TypeError:
+        # Categories of mixed types are ordered by their text
+        counts = counts.iloc[np.argsort(counts.index.astype(str),
+                                        kind="mergesort")]
+    return counts.sort_values(ascending=False, kind="mergesort")
+
+
+def _top_counts(counts, top_k=None, n_values=None):
+    """
+    Keeps the top_k most frequent categories and sums the remaining ones
+    into an "Other" category.
+
+    Parameters
+    -----------
+    counts: `pandas.Series`
+        The counts indexed by category, sorted in decreasing order
+    top_k: `int`, optional
+        The number of categories to keep, None keeps all of them
+    n_values: `int`, optional
+        The total number of values, when `counts` only holds the largest
+        counts of a sketch
+
+    Returns
+    --------
+    `pandas.Series`
+        The counts of the kept categories and of "Other"
+    """
+    if top_k is None:
+        return counts
+    kept = counts.iloc[:top_k]
+    if n_values is None:
+        if len(counts) <= top_k:
+            return counts
+        other = counts.iloc[top_k:].sum()
+    else:
+        other = n_values - kept.sum()
+        if other <= 0:
+            return kept
+    return pd.concat([kept, pd.Series([other], index=[_OTHER_LABEL])])
+
+
+def _count_table(value_counts):
+    """
+    Formats the category counts of several variables as one long-form
+    table.
+
+    Parameters
+    -----------
+    value_counts: `list`
+        A list of (variable name, `pandas.Series` of counts indexed by
+        category) tuples
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        A dataframe with the columns 'variable', 'category' and 'count'
+    """
+    tables = []
+    for item, counts in value_counts:
+        tables.append(pd.DataFrame({"variable": item,
+                                    "category": counts.index.astype(object),
+                                    "count": counts.to_numpy()}))
+
+    if not tables:
+        return pd.DataFrame({"variable": pd.Series([], dtype=object),
+                             "category": pd.Series([], dtype=object),
+                             "count": pd.Series([], dtype=np.int64)})
+    return pd.concat(tables, ignore_index=True)
+
+
+@cache.cached("num_vars")
+def describe_num_var(dataframe, num_vars=None, bins=30, bin_strategy="shared",
+                     quantile_error=None, n_jobs=1, backend="thread",
+                     sample=None):
     """This function takes dataframe and numeric variable names and provides
     statistical summary of the numeric variables for a dataframe.
     Also, the function plots the histogram of each numeric variable.
 
     Parameters
     -----------
-    dataframe: `pandas.DataFrame`
-        The dataframe to be inspected.
-    num_vars: `list`
+    dataframe: `pandas.DataFrame` or `numpy.ndarray`
+        The dataframe to be inspected, or a 2d numeric array such as a
+        `numpy.memmap` or `numpy.load(path, mmap_mode='r')`, which is
+        walked in blocks of rows without being copied. The quantiles and
+        median of an array are estimated, see `quantile_error`.
+    num_vars: `list`, optional
         A list of unique character strings of the names of
-        the numeric variables.
+        the numeric variables, naming every column of an array. If
+        omitted, the numeric variables of a dataframe are inferred by
+        `inference.infer_column_types`.
+    bins: `int`, optional
+        The number of histogram bins of each numeric variable.
+    bin_strategy: `str`, optional
+        "shared" (default) uses the same bins for every variable, spanning
+        the overall range, "per_column" spans the range of each variable.
+    quantile_error: `float`, optional
+        None (default) computes the exact quantiles and median. A rank
+        error between 0 and 1 estimates them with a mergeable KLL sketch
+        instead, see `sketches.KLLSketch`.
+    n_jobs: `int`, optional
+        The number of workers summarizing and binning the variables, -1 for
+        one worker per core. The results do not depend on it.
+    backend: `str`, optional
+        "thread" (default) or "process", the kind of workers. Processes
+        read the numeric values from a shared memory-mapped file instead
+        of a pickled copy.
+    sample: `int` or `sampling.Sample`, optional
+        If given, the statistics are estimated from a sample of the rows,
+        an `int` drawing that many rows uniformly with a fixed seed. The
+        standard errors and the 95% confidence intervals of the quantiles,
+        median, mean and sd are then kept in
+        `summary.attrs["standard_error"]`, `summary.attrs["lower"]` and
+        `summary.attrs["upper"]`, and the bin counts are scaled to the
+        whole dataframe.
 
     Returns
     --------
     tuple
         a tuple a statistical summary of the numeric variables as a
         `pandas.Dataframe` and a grid of `altair` plot containing
-        all histograms
+        all histograms. The histograms are binned before plotting, so
+        the plot only holds the bin counts. The approximate rows of the
+        summary are listed in `summary.attrs["approximate"]`.
 
     Examples
     ---------
@@ -234,6 +827,88 @@ def describe_num_var(dataframe, num_vars):
     >>> summary
     >>> plot
     """
+    _, num_vars = _infer_vars(dataframe, [], num_vars)
+    summary, hist = _num_tables(dataframe, num_vars, bins, bin_strategy,
+                                quantile_error, n_jobs, backend, sample)
+
+    # Plot only the bin counts
+    plot = _num_chart(hist, independent=(bin_strategy == "per_column"))
+
+    return summary, plot
+
+
+def _num_tables(dataframe, num_vars, bins=30, bin_strategy="shared",
+                quantile_error=None, n_jobs=1, backend="thread",
+                sample=None):
+    """
+    Computes the summary and the bin counts of `describe_num_var`, see
+    `tables.num_summary`.
+    """
+    if not isinstance(dataframe, np.ndarray):
+        _check_num_input(dataframe, num_vars)
+
+    # Check the histogram options
+    if not isinstance(bins, int) or bins <= 0:
+        raise Exception("The value of the argument 'bins' " +
+                        "should be a positive integer.")
+
+    if bin_strategy not in _BIN_STRATEGIES:
+        raise Exception("The value of the argument 'bin_strategy' " +
+                        "should be one of " + ", ".join(_BIN_STRATEGIES) +
+                        ".")
+
+    if quantile_error is not None and not 0 < quantile_error < 1:
+        raise Exception("The value of the argument 'quantile_error' " +
+                        "should be between 0 and 1.")
+
+    if isinstance(dataframe, np.ndarray):
+        # Imported here as the arrays module is built on this one
+        from t_eda_analysis import arrays
+
+        arrays.check_array(dataframe, num_vars)
+        if sample is not None:
+            raise Exception("The argument 'sample' is only supported " +
+                            "for dataframes.")
+        return arrays.describe_array(dataframe, num_vars, bins,
+                                     bin_strategy, quantile_error)
+
+    workers = parallel.check_jobs(n_jobs, backend)
+    if workers == 1:
+        backend = "thread"
+
+    n_population = len(dataframe)
+    if sample is not None:
+        sample = sampling.check_sample(sample, dataframe)
+        dataframe = sampling.draw(dataframe, sample, num_vars)
+
+    shape = (len(dataframe), len(num_vars))
+    with parallel.shared_block(shape, backend) as (block, ref), \
+            parallel.pool(workers, backend) as run:
+        _numeric_block(dataframe, num_vars, out=block)
+        summary, hist = _describe_block(ref, num_vars, bins, bin_strategy,
+                                        quantile_error, run)
+
+    if sample is not None:
+        sampling.attach_num_errors(summary, dataframe, num_vars,
+                                   n_population, sample)
+        hist["count"] = sampling.scale_counts(hist["count"], len(dataframe),
+                                              n_population)
+
+    return summary, hist
+
+
+def _check_num_input(dataframe, num_vars):
+    """
+    Checks the dataframe and the numeric variables of a report.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe to be inspected.
+    num_vars: `list`
+        A list of unique character strings of the names of
+        the numeric variables.
+    """
     # Check the dataframe input
     if not isinstance(dataframe, pd.DataFrame):
         raise Exception("The value of the argument 'dataframe' " +
@@ -255,36 +930,76 @@ def describe_num_var(dataframe, num_vars):
         raise Exception("The argument 'num_vars' should be a subset of" +
                         " the column names from the dataframe.")
 
-    # Subset and transpose the dataframe for later use
-    df = pd.DataFrame(dataframe[num_vars]).T
-
     # Check if only the numeric columns are selected
-    if not np.issubdtype(df.to_numpy().dtype, np.number):
+    if not all(_is_numeric(dataframe[item].dtype) for item in num_vars):
         raise Exception("Only numeric columns expected, please " +
                         "check the input.")
 
-    # Calculate the statistical summaries
-    stat_funs = [np.nanmin, np.nanmax, np.nanmedian, np.nanmean, np.nanstd]
-    temp = []
-    for fun in stat_funs:
-        data_stat = df.apply(fun, axis=1)
-        temp.append(data_stat)
 
-    temp_df = pd.DataFrame(temp)
-    quantiles_df = pd.DataFrame([np.nanquantile(df, 0.25, axis=1),
-                                 np.nanquantile(df, 0.75, axis=1)])
-    quantiles_df.columns = num_vars
+def _describe_block(block, num_vars, bins=30, bin_strategy="shared",
+                    quantile_error=None, run=parallel.serial):
+    """
+    Summarizes and bins every column of a numeric block, see
+    `describe_num_var`.
+
+    Parameters
+    -----------
+    block: `numpy.ndarray` or `tuple`
+        A rows x variables float64 array, NaN marking missing values, or
+        its reference from `parallel.shared_block`.
+    num_vars: `list`
+        The names of the block columns.
+    bins: `int`, optional
+        The number of bins of each variable.
+    bin_strategy: `str`, optional
+        "shared" or "per_column", see `describe_num_var`.
+    quantile_error: `float`, optional
+        If given, estimate the quantiles with a KLL sketch of that rank
+        error.
+    run: `function`, optional
+        Runs the work of each column, see `parallel.pool`.
+
+    Returns
+    --------
+    tuple
+        The statistical summary as a `pandas.DataFrame` and the long-form
+        table of bin counts.
+    """
+    # Calculate the statistical summaries in a single pass per column
+    summary = pd.DataFrame(_numeric_summary(block, quantile_error, run),
+                           index=_SUMMARY_INDEX, columns=num_vars)
+    summary.attrs["approximate"] = [] if quantile_error is None \
+        else list(_QUANTILE_ROWS)
 
-    summary = pd.concat([quantiles_df, temp_df])
+    # Bin the values
+    hist = _histogram_table(block, num_vars, bins, bin_strategy,
+                            summary.loc["min"], summary.loc["max"], run)
+    return summary, hist
 
-    # Change the index more readable
-    summary.index = ["25%", "75%", "min", "max", "median", "mean", "sd"]
 
-    # Make the histogram
-    df_to_plot = df.T.melt().dropna()
-    plot = alt.Chart(df_to_plot).mark_bar().encode(
-        alt.X("value:Q", bin=alt.Bin(maxbins=30), title="Value"),
-        y='count()'
+def _num_chart(hist, independent=False):
+    """
+    Plots a long-form table of bin counts as a grid of histograms.
+
+    Parameters
+    -----------
+    hist: `pandas.DataFrame`
+        A dataframe with the columns 'variable', 'value' (bin start),
+        'value_end' (bin end) and 'count'.
+    independent: `bool`, optional
+        Whether each histogram has its own x scale.
+
+    Returns
+    --------
+    `altair`
+        a grid of `altair` plot containing all histograms
+    """
+    import altair as alt
+
+    plot = alt.Chart(hist).mark_bar().encode(
+        alt.X("value:Q", bin="binned", title="Value"),
+        alt.X2("value_end:Q"),
+        alt.Y("count:Q", title="Count")
     ).properties(
         width=300,
         height=300,
@@ -293,21 +1008,331 @@ def describe_num_var(dataframe, num_vars):
         facet='variable:N',
         columns=3
     )
+    if independent:
+        plot = plot.resolve_scale(x="independent")
 
-    return summary, plot
+    return plot
+
+
+def _is_numeric(dtype):
+    """
+    Checks whether a column dtype is a plain numpy numeric type.
+    """
+    return isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.number)
+
+
+def _numeric_block(dataframe, num_vars, out=None):
+    """
+    Copies the numeric columns of a dataframe into a single Fortran-ordered
+    float64 array, one column at a time, so that every variable is
+    contiguous in memory and no transposed or object copy is made.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The dataframe holding the numeric variables.
+    num_vars: `list`
+        The names of the numeric variables.
+    out: `numpy.ndarray`, optional
+        A rows x variables Fortran-ordered float64 array to fill, such as
+        a block of `parallel.shared_block`.
+
+    Returns
+    --------
+    `numpy.ndarray`
+        A rows x variables float64 array.
+    """
+    block = out
+    if block is None:
+        block = np.empty((len(dataframe), len(num_vars)), dtype=np.float64,
+                         order="F")
+    for j, item in enumerate(num_vars):
+        block[:, j] = dataframe[item].to_numpy(dtype=np.float64)
+    return block
+
+
+def _numeric_summary(block, quantile_error=None, run=parallel.serial,
+                     seed=0):
+    """
+    Computes the statistical summary of every column of a numeric block.
+
+    Parameters
+    -----------
+    block: `numpy.ndarray` or `tuple`
+        A rows x variables float64 array, NaN marking missing values, or
+        its reference from `parallel.shared_block`.
+    quantile_error: `float`, optional
+        If given, estimate the quantiles with a KLL sketch of that rank
+        error.
+    run: `function`, optional
+        Runs the summary of each column, see `parallel.pool`.
+    seed: `int`, optional
+        The seed of the KLL sketches, the same for every column so that
+        the estimates do not depend on the workers.
+
+    Returns
+    --------
+    `numpy.ndarray`
+        A len(_SUMMARY_INDEX) x variables array with the rows ordered
+        as `_SUMMARY_INDEX`.
+    """
+    n_vars = parallel.open_block(block).shape[1]
+    summary = np.full((len(_SUMMARY_INDEX), n_vars), np.nan)
+    columns = run(_summarize_block_column,
+                  [(block, j, quantile_error, seed) for j in range(n_vars)])
+    for j, column in enumerate(columns):
+        summary[:, j] = column
+    return summary
+
+
+def _summarize_block_column(block, j, quantile_error=None, seed=0):
+    """
+    Summarizes the column j of a block or of a block reference.
+    """
+    return _summarize_column(parallel.open_block(block)[:, j],
+                             quantile_error, seed)
+
+
+def _summarize_column(values, quantile_error=None, seed=0):
+    """
+    Fused summary kernel for one column. The moments follow the same
+    arithmetic as `numpy.nanmean` and `numpy.nanstd`, and all the order
+    statistics come from one `numpy.partition` of the non-NA values, using
+    the interpolation of `numpy.nanquantile` and `numpy.nanmedian`.
+
+    Parameters
+    -----------
+    values: `numpy.ndarray`
+        A 1d float64 array, NaN marking missing values.
+    quantile_error: `float`, optional
+        If given, estimate the quantiles with a KLL sketch of that rank
+        error instead of partitioning the values.
+    seed: `int`, optional
+        The seed of the KLL sketch.
+
+    Returns
+    --------
+    list
+        The summary values ordered as `_SUMMARY_INDEX`.
+    """
+    mask = np.isnan(values)
+    n_valid = values.size - np.count_nonzero(mask)
+    if n_valid == 0:
+        return [np.nan] * len(_SUMMARY_INDEX)
+
+    # Moments
+    filled = np.where(mask, 0.0, values)
+    mean = filled.sum() / n_valid
+    np.subtract(filled, mean, out=filled)
+    filled[mask] = 0.0
+    np.multiply(filled, filled, out=filled)
+    sd = np.sqrt(filled.sum() / n_valid)
+
+    # Order statistics
+    valid = values[~mask]
+    if quantile_error is not None:
+        sketch = KLLSketch(quantile_error, seed).update(valid)
+        q25, q75, median = sketch.quantile([0.25, 0.75, 0.5])
+        return [q25, q75, valid.min(), valid.max(), median, mean, sd]
+
+    q25, q75 = 0.25 * (n_valid - 1), 0.75 * (n_valid - 1)
+    kth = {0, n_valid - 1, (n_valid - 1) // 2, n_valid // 2}
+    for q in (q25, q75):
+        kth.update((int(q), min(int(q) + 1, n_valid - 1)))
+    valid.partition(sorted(kth))
+
+    def quantile(q):
+        below, above = int(q), min(int(q) + 1, n_valid - 1)
+        return _lerp(valid[below], valid[above], q - below)
+
+    if n_valid % 2:
+        median = valid[n_valid // 2]
+    else:
+        median = (valid[(n_valid - 1) // 2] + valid[n_valid // 2]) / 2.0
+
+    return [quantile(q25), quantile(q75), valid[0], valid[n_valid - 1],
+            median, mean, sd]
+
+
+def _lerp(a, b, t):
+    """
+    Linear interpolation between a and b, rounded like `numpy.quantile`.
+    """
+    diff = b - a
+    if t >= 0.5:
+        return b - diff * (1 - t)
+    return a + diff * t
+
+
+def _histogram_table(block, num_vars, bins, bin_strategy, mins, maxs,
+                     run=parallel.serial):
+    """
+    Bins every column of a numeric block with `numpy.histogram` and
+    returns the counts in long form.
+
+    Parameters
+    -----------
+    block: `numpy.ndarray` or `tuple`
+        A rows x variables float64 array, NaN marking missing values, or
+        its reference from `parallel.shared_block`.
+    num_vars: `list`
+        The names of the block columns.
+    bins: `int`
+        The number of bins of each variable.
+    bin_strategy: `str`
+        "shared" or "per_column", see `describe_num_var`.
+    mins, maxs: array-like
+        The minimum and maximum of each column, NaN for empty columns.
+        The columns are binned over the range of their finite values.
+    run: `function`, optional
+        Runs the binning of each column, see `parallel.pool`.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        A dataframe with the columns 'variable', 'value' (bin start),
+        'value_end' (bin end) and 'count'.
+    """
+    ranges = _bin_ranges(
+        mins, maxs, bin_strategy,
+        lambda j: _finite_range(parallel.open_block(block)[:, j]))
+    tasks = [(block, j, bins, bin_range)
+             for j, bin_range in enumerate(ranges) if bin_range is not None]
+
+    results = iter(run(_bin_block_column, tasks))
+    counts = [None if bin_range is None else next(results)[0]
+              for bin_range in ranges]
+    return _bin_table(num_vars, counts, ranges, bins)
 
 
-def calc_cor(dataframe, num_vars):
+def _bin_block_column(block, j, bins, bin_range):
+    """
+    Bins the finite values of the column j of a block or of a block
+    reference with `numpy.histogram`.
+    """
+    values = parallel.open_block(block)[:, j]
+    values = values[np.isfinite(values)]
+    return np.histogram(values, bins=bins, range=bin_range)
+
+
+def _bin_ranges(mins, maxs, bin_strategy, finite_range):
+    """
+    Computes the bin range of every numeric variable from its minimum and
+    maximum. Only the finite values are binned, like
+    `accumulators.Histograms`, so the range of a variable holding infinite
+    values is the one of its finite values.
+
+    Parameters
+    -----------
+    mins, maxs: array-like
+        The minimum and maximum of each variable, NaN for empty variables.
+    bin_strategy: `str`
+        "shared" or "per_column", see `describe_num_var`.
+    finite_range: `function`
+        Called with the position of a variable holding infinite values,
+        returns the range of its finite values, or None.
+
+    Returns
+    --------
+    list
+        The range of every variable, None for the variables without finite
+        values.
+    """
+    ranges = []
+    for j, (low, high) in enumerate(zip(mins, maxs)):
+        if np.isnan(low):
+            ranges.append(None)
+        elif np.isfinite(low) and np.isfinite(high):
+            ranges.append((low, high))
+        else:
+            ranges.append(finite_range(j))
+
+    found = [bin_range for bin_range in ranges if bin_range is not None]
+    if bin_strategy == "shared" and found:
+        shared_range = (min(low for low, _ in found),
+                        max(high for _, high in found))
+        ranges = [None if bin_range is None else shared_range
+                  for bin_range in ranges]
+    return ranges
+
+
+def _finite_range(values):
+    """
+    Returns
+    --------
+    tuple
+        The minimum and maximum of the finite values, None if there is
+        none.
+    """
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return None
+    return values.min(), values.max()
+
+
+def _bin_table(num_vars, counts, ranges, bins):
+    """
+    Formats the bin counts of the numerical variables in long form, the
+    variables without range being left out.
+
+    Parameters
+    -----------
+    num_vars: `list`
+        The names of the variables.
+    counts: `list`
+        The bin counts of every variable.
+    ranges: `list`
+        The bin range of every variable, see `_bin_ranges`.
+    bins: `int`
+        The number of bins of each variable.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        A dataframe with the columns 'variable', 'value' (bin start),
+        'value_end' (bin end) and 'count'.
+    """
+    tables = []
+    for item, item_counts, bin_range in zip(num_vars, counts, ranges):
+        if bin_range is not None:
+            edges = np.histogram_bin_edges([], bins, bin_range)
+            tables.append(pd.DataFrame({"variable": item,
+                                        "value": edges[:-1],
+                                        "value_end": edges[1:],
+                                        "count": item_counts}))
+    return _hist_frame(tables)
+
+
+def _hist_frame(tables):
+    """
+    Concatenates the bin tables of several variables, keeping the columns
+    of an empty table.
+    """
+    if not tables:
+        return pd.DataFrame({"variable": pd.Series([], dtype=object),
+                             "value": pd.Series([], dtype=np.float64),
+                             "value_end": pd.Series([], dtype=np.float64),
+                             "count": pd.Series([], dtype=np.int64)})
+    return pd.concat(tables, ignore_index=True)
+
+
+@cache.cached("num_vars")
+def calc_cor(dataframe, num_vars, return_table=False):
     """
     This function evaluates the correlation between the numeric
     variables of a given dataframe.
 
     Parameters
     -----------
-    dataframe: `pandas.DataFrame`
-        The data frame whose EDA analysis is to be performed.
+    dataframe: `pandas.DataFrame` or `numpy.ndarray`
+        The data frame whose EDA analysis is to be performed, or a 2d
+        numeric array such as a `numpy.memmap`, whose cross-products are
+        accumulated over blocks of rows without copying it.
     num_var: `list`
-        A list of unique strings of column names containing numeric variables.
+        A list of unique strings of column names containing numeric variables,
+        naming every column of an array.
+    return_table: `bool`, optional
+        Whether to also return the long-form correlation table.
 
     Returns
     --------
@@ -315,6 +1340,10 @@ def calc_cor(dataframe, num_vars):
         A correlogram plot labelled with the correlation coefficients
         of -1 to 1 between each numeric column and other numeric variables
         in the dataframe.
+    tuple
+        If `return_table` is True, a tuple of the long-form correlation
+        table as a `pandas.DataFrame` with the columns 'Var1', 'Var2' and
+        'Corr', and the correlogram plot.
 
     Examples
     ---------
@@ -327,6 +1356,196 @@ def calc_cor(dataframe, num_vars):
     >>> calc_cor(X, num_vars)
     """
 
+    new_df = _cor_table(dataframe, num_vars)
+    corr_chart = _corr_chart(new_df)
+    if return_table:
+        return new_df, corr_chart
+    return corr_chart
+
+
+@cache.cached("num_vars")
+def calc_cor_pairs(dataframe, num_vars, top_k=20, threshold=None,
+                   max_memory=2 ** 27, dtype=np.float64):
+    """
+    This function finds the most correlated pairs of numeric variables of
+    a given dataframe without building the full correlation matrix. The
+    columns are standardized once and the correlation matrix is computed
+    in tiles that fit in `max_memory`, keeping only the selected pairs.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The data frame whose EDA analysis is to be performed.
+    num_var: `list`
+        A list of unique strings of column names containing numeric variables.
+    top_k: `int`, optional
+        The number of pairs with the largest absolute correlation to keep.
+        None keeps every pair passing the `threshold`.
+    threshold: `float`, optional
+        If given, only the pairs with an absolute correlation of at least
+        `threshold` are kept.
+    max_memory: `int`, optional
+        The maximum number of bytes used by a tile of the correlation matrix
+        and the selection of its pairs.
+    dtype: `numpy.dtype`, optional
+        The floating point type of the computation, `numpy.float32` halves
+        the memory used by the standardized columns and the tiles.
+
+    Returns
+    --------
+    tuple
+        A tuple of the selected pairs as a `pandas.DataFrame` with the
+        columns 'Var1', 'Var2' and 'Corr', sorted by decreasing absolute
+        correlation, and a correlogram plot of the variables in those
+        pairs, limited to the first 50 variables of the strongest pairs.
+
+    Examples
+    ---------
+    >>> X= pandas.DataFrame({
+    'width':[40, 10, 5]
+    'height':[10,20,30]
+    'depth':[1, 2, 4]
+    })
+    >>>num_var = ['height', 'width', 'depth']
+    >>> pairs, plot = calc_cor_pairs(X, num_vars, top_k=2)
+    """
+
+    _check_cor_input(dataframe, num_vars)
+
+    if top_k is None and threshold is None:
+        raise Exception("Either the argument 'top_k' or the argument " +
+                        "'threshold' should be given.")
+
+    if top_k is not None and (not isinstance(top_k, int) or top_k <= 0):
+        raise Exception("The value of the argument 'top_k' " +
+                        "should be a positive integer.")
+
+    if threshold is not None and not 0 <= threshold <= 1:
+        raise Exception("The value of the argument 'threshold' " +
+                        "should be between 0 and 1.")
+
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise Exception("The value of the argument 'dtype' " +
+                        "should be a floating point type.")
+
+    z = _standardize(dataframe, num_vars, dtype)
+    n_vars = z.shape[1]
+    # A tile comes with a scratch copy of its absolute values and two masks
+    width = int(np.sqrt(max_memory / (2 * dtype.itemsize + 2)))
+    width = min(max(width, 1), max(n_vars, 1))
+
+    # Walk the upper triangle of the correlation matrix tile by tile
+    rows = np.empty(0, dtype=np.intp)
+    cols = np.empty(0, dtype=np.intp)
+    corrs = np.empty(0, dtype=dtype)
+    for i0 in range(0, n_vars, width):
+        for j0 in range(i0, n_vars, width):
+            tile = z[:, i0:i0 + width].T @ z[:, j0:j0 + width]
+            if i0 == j0:
+                # Only the pairs above the diagonal are kept
+                for r in range(tile.shape[0]):
+                    tile[r, :r + 1] = np.nan
+            floor = threshold
+            if top_k is not None and len(corrs) == top_k:
+                floor = max(floor or 0, np.abs(corrs).min())
+            i, j, values = _tile_pairs(tile, top_k, floor)
+            rows = np.concatenate([rows, i + i0])
+            cols = np.concatenate([cols, j + j0])
+            corrs = np.concatenate([corrs, values])
+            if top_k is not None and len(corrs) > top_k:
+                best = np.argpartition(-np.abs(corrs), top_k - 1)[:top_k]
+                rows, cols, corrs = rows[best], cols[best], corrs[best]
+
+    order = np.argsort(-np.abs(corrs), kind="stable")
+    names = np.array(num_vars, dtype=object)
+    pairs = pd.DataFrame({'Var1': names[rows[order]],
+                          'Var2': names[cols[order]],
+                          'Corr': np.clip(corrs[order], -1, 1)})
+
+    # Plot the correlogram of the variables in the strongest pairs
+    strongest = np.column_stack([rows[order], cols[order]]).ravel()
+    idx = np.sort(list(dict.fromkeys(strongest))[:_MAX_CORRELOGRAM_VARS])
+    idx = idx.astype(np.intp)
+    corr = np.clip(z[:, idx].T @ z[:, idx], -1, 1)
+    np.fill_diagonal(corr, 1)
+    corr = pd.DataFrame(corr.astype(np.float64), index=names[idx],
+                        columns=names[idx])
+    return pairs, _corr_chart(_corr_table(corr))
+
+
+def _tile_pairs(tile, top_k=None, floor=None):
+    """
+    Selects the candidate pairs of a tile of the correlation matrix. The
+    cells are compared with a floor on the absolute correlation before
+    any index is built, so that only the surviving cells are indexed.
+
+    Parameters
+    -----------
+    tile: `numpy.ndarray`
+        A tile of the correlation matrix, NaN marking the excluded cells.
+    top_k: `int`, optional
+        If given, the floor is raised to the top_k-th largest absolute
+        correlation of the tile.
+    floor: `float`, optional
+        The smallest absolute correlation kept.
+
+    Returns
+    --------
+    tuple
+        The row and column indices in the tile and the correlations of
+        the kept cells.
+    """
+    if top_k is not None and tile.size > top_k:
+        score = np.abs(tile).ravel()
+        # NaN would be partitioned as the largest values
+        np.fmax(score, -1, out=score)
+        score.partition(score.size - top_k)
+        kth = score[score.size - top_k]
+        del score
+        floor = kth if floor is None else max(floor, kth)
+
+    if floor is None:
+        keep = ~np.isnan(tile)
+    else:
+        keep = tile >= floor
+        keep |= tile <= -floor
+    kept = np.flatnonzero(keep)
+    del keep
+    i, j = np.divmod(kept, tile.shape[1])
+    return i, j, tile.ravel()[kept]
+
+
+def _cor_table(dataframe, num_vars):
+    """
+    Computes the long-form correlation table of `calc_cor` over the rows
+    without NA values, see `tables.correlation`.
+    """
+    if isinstance(dataframe, np.ndarray):
+        from t_eda_analysis import arrays
+
+        arrays.check_array(dataframe, num_vars)
+        return arrays.array_corr(dataframe, num_vars)
+
+    _check_cor_input(dataframe, num_vars)
+
+    df_num = dataframe.loc[:, num_vars]
+    df_num = df_num.dropna()
+
+    return _corr_table(df_num.corr(method='pearson'))
+
+
+def _check_cor_input(dataframe, num_vars):
+    """
+    Checks the input of the correlation functions.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The data frame whose EDA analysis is to be performed.
+    num_var: `list`
+        A list of unique strings of column names containing numeric variables.
+    """
     # Test input 'dataframe' is a dataframe
     if not isinstance(dataframe, pd.DataFrame):
         raise Exception("Input 'dataframe' is not a dataframe")
@@ -351,24 +1570,120 @@ def calc_cor(dataframe, num_vars):
         raise Exception("The elements in the argument 'num_vars' " +
                         "should be unique.")
 
-    df_num = dataframe.loc[:, num_vars]
-    df_num = df_num.dropna()
 
-    df_corr = round(df_num.corr(method='pearson'), 2)
+def _standardize(dataframe, num_vars, dtype=np.float64):
+    """
+    Centers the rows without NA values of every numeric variable and
+    scales them to unit norm, so that the correlation between two
+    variables is the dot product of their columns.
+
+    Parameters
+    -----------
+    dataframe: `pandas.DataFrame`
+        The data frame holding the numeric variables.
+    num_var: `list`
+        A list of unique strings of column names containing numeric variables.
+    dtype: `numpy.dtype`, optional
+        The floating point type of the result.
+
+    Returns
+    --------
+    `numpy.ndarray`
+        A Fortran-ordered rows x variables array, with NaN columns for
+        the constant variables.
+    """
+    complete = np.ones(len(dataframe), dtype=bool)
+    for item in num_vars:
+        complete &= dataframe[item].notna().to_numpy()
+
+    z = np.empty((np.count_nonzero(complete), len(num_vars)), dtype=dtype,
+                 order="F")
+    for j, item in enumerate(num_vars):
+        values = dataframe[item].to_numpy(dtype=np.float64)[complete]
+        values -= values.mean() if len(values) else 0.0
+        norm = np.sqrt(np.dot(values, values))
+        z[:, j] = values / norm if norm > 0 else np.nan
+    return z
+
+
+def _block_corr(block):
+    """
+    Computes the Pearson correlation matrix of the rows without NA values
+    of a numeric block, standardizing the block in place so that no copy
+    of it is made. The block should not be read afterwards.
+
+    Parameters
+    -----------
+    block: `numpy.ndarray`
+        A writable rows x variables float64 array, NaN marking missing
+        values.
+
+    Returns
+    --------
+    `numpy.ndarray`
+        The variables x variables correlation matrix, NaN for the constant
+        variables like `pandas.DataFrame.corr`.
+    """
+    complete = np.ones(block.shape[0], dtype=bool)
+    for j in range(block.shape[1]):
+        complete &= ~np.isnan(block[:, j])
+    n_complete = np.count_nonzero(complete)
+
+    # Move the complete rows to the top of each column, then scale them
+    norms = np.zeros(block.shape[1])
+    for j in range(block.shape[1]):
+        values = block[:, j][complete]
+        values -= values.mean() if n_complete else 0.0
+        norms[j] = np.sqrt(np.dot(values, values))
+        block[:n_complete, j] = values / norms[j] if norms[j] > 0 else np.nan
+
+    z = block[:n_complete]
+    corr = np.clip(z.T @ z, -1, 1)
+    np.fill_diagonal(corr, np.where(norms > 0, 1.0, np.nan))
+    return corr
+
+
+def _corr_table(corr):
+    """
+    Formats a correlation matrix as the long-form lower triangle
+    correlation table, with the variables in sorted order.
 
+    Parameters
+    -----------
+    corr: `pandas.DataFrame`
+        A square correlation matrix.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        A dataframe with the columns 'Var1', 'Var2' and 'Corr', holding
+        every pair of variables once, including each variable with itself.
+    """
     # Code adapted from https://github.com/altair-viz/altair/pull/1945/files
-    corr_list = sorted(df_corr.columns.to_list())
-    corr_list_copy = corr_list.copy()
-    rows = []
-
-    # Format the data to make a lower triangle correlation maxtix
-    for i in corr_list:
-        for j in corr_list_copy:
-            rows.append([i, j, df_num.corr().loc[i, j]])
-        corr_list_copy.remove(i)
-
-    # Create dataframe from list of rows
-    new_df = pd.DataFrame(rows, columns=['Var1', 'Var2', 'Corr'])
+    corr_list = sorted(corr.columns.to_list())
+    values = corr.loc[corr_list, corr_list].to_numpy()
+    names = np.array(corr_list, dtype=object)
+    i, j = np.triu_indices(len(corr_list))
+
+    return pd.DataFrame({'Var1': names[i], 'Var2': names[j],
+                         'Corr': values[i, j]})
+
+
+def _corr_chart(new_df):
+    """
+    Plots a long-form correlation table as a correlogram.
+
+    Parameters
+    -----------
+    new_df: `pandas.DataFrame`
+        A dataframe with the columns 'Var1', 'Var2' and 'Corr'.
+
+    Returns
+    --------
+    `altair`
+        A correlogram plot labelled with the correlation coefficients.
+    """
+    import altair as alt
 
     # Create the rectangle heatmap as the base with text layer
     heatmap = alt.Chart(new_df).mark_rect().encode(
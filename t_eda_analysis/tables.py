@@ -0,0 +1,94 @@
+from t_eda_analysis import cache
+from t_eda_analysis import t_eda_analysis as eda
+
+
+def na_counts(dataframe, n_jobs=1, backend="thread"):
+    """
+    Counts the NA values in each column, see `count_na_values`.
+
+    Returns
+    --------
+    `pandas.Series`
+        The number of NA values in each column, indexed by column name.
+    """
+    return eda.count_na_values(dataframe, n_jobs, backend)
+
+
+@cache.cached("cat_vars")
+def category_counts(dataframe, cat_vars, top_k=None,
+                    max_distinct=eda._MAX_DISTINCT, n_jobs=1,
+                    backend="thread", sample=None):
+    """
+    Counts the categories of the categorical variables without plotting
+    them, so Altair is never imported. See `describe_cat_var` for the
+    arguments.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        The long-form counts with the columns 'variable', 'category' and
+        'count', plotted by `describe_cat_var`. A sampled table also has
+        the columns 'lower' and 'upper'.
+
+    Examples
+    ---------
+    >>> from t_eda_analysis import tables
+    >>> tables.category_counts(X, ['type'], top_k=10)
+    """
+    return eda._cat_table(dataframe, cat_vars, top_k, max_distinct, n_jobs,
+                          backend, sample)
+
+
+@cache.cached("num_vars")
+def num_summary(dataframe, num_vars, bins=30, bin_strategy="shared",
+                quantile_error=None, n_jobs=1, backend="thread",
+                sample=None):
+    """
+    Summarizes and bins the numerical variables, see `describe_num_var`
+    for the arguments.
+
+    Returns
+    --------
+    tuple
+        The statistical summary as a `pandas.DataFrame`, like
+        `describe_num_var`, and the long-form bin counts with the columns
+        'variable', 'value', 'value_end' and 'count'.
+
+    Examples
+    ---------
+    >>> summary, bins = tables.num_summary(X, ['height', 'width'])
+    """
+    return eda._num_tables(dataframe, num_vars, bins, bin_strategy,
+                           quantile_error, n_jobs, backend, sample)
+
+
+@cache.cached("num_vars")
+def correlation(dataframe, num_vars):
+    """
+    Computes the correlation of the numerical variables over the rows
+    without NA values, like `calc_cor`.
+
+    Returns
+    --------
+    `pandas.DataFrame`
+        The long-form correlation table with the columns 'Var1', 'Var2'
+        and 'Corr'.
+    """
+    return eda._cor_table(dataframe, num_vars)
+
+
+def report_tables(dataframe, cat_vars, num_vars, n_jobs=1, backend="thread",
+                  sample=None):
+    """
+    Computes every table of `generate_report` in one plan.
+
+    Returns
+    --------
+    dict
+        The NA counts as 'na_counts', the category counts as 'categories',
+        the numeric summary as 'summary', the bin counts as 'histograms'
+        and the correlation table as 'correlation'. A sampled report also
+        describes its sample as 'sample'.
+    """
+    return eda._report_tables(dataframe, cat_vars, num_vars, n_jobs,
+                              backend, sample)
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from t_eda_analysis import t_eda_analysis as eda
+from t_eda_analysis.accumulators import CategoryCounts, Histograms, \
+    ReportAccumulator
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_report_accumulator():
+    """
+    Tests the ReportAccumulator matches the in memory functions whether the
+    rows are added at once, chunk by chunk or merged from partial
+    accumulators.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(2000)
+    full = ReportAccumulator(cat_vars, num_vars).update(data)
+    chunked = ReportAccumulator(cat_vars, num_vars)
+    for start in range(0, len(data), 300):
+        chunked.update(data.iloc[start:start + 300])
+    merged = ReportAccumulator(cat_vars, num_vars).update(data.iloc[:700])
+    merged.merge(ReportAccumulator(cat_vars, num_vars)
+                 .update(data.iloc[700:]))
+
+    summary, _ = eda.describe_num_var(data, num_vars)
+    cor_table, _ = eda.calc_cor(data, num_vars, return_table=True)
+    cat_table = eda._category_counts(data, cat_vars)
+
+    for acc in [full, chunked, merged]:
+        assert acc.n_rows == len(data), "All the rows should be counted."
+        assert acc.na_counts().equals(eda.count_na_values(data)), \
+            "The NA values are not correctly counted."
+
+        acc_summary = acc.num_summary()
+        assert list(acc_summary.index) == list(summary.index), \
+            "The summary should have the index of describe_num_var."
+        for stat in ["min", "max"]:
+            assert acc_summary.loc[stat].equals(summary.loc[stat]), \
+                "The minimum and maximum are not correctly calculated."
+        for stat in ["mean", "sd"]:
+            assert np.allclose(acc_summary.loc[stat], summary.loc[stat]), \
+                "The mean and standard deviation are not correctly " \
+                "calculated."
+
+        for stat, q in [("25%", 0.25), ("75%", 0.75), ("median", 0.5)]:
+            for col in num_vars:
+                rank = (data[col] < acc_summary.loc[stat, col]).mean() / \
+                    data[col].notna().mean()
+                assert abs(rank - q) < 0.02, \
+                    "The quantiles are not correctly estimated."
+
+        hist = acc.hist_table()
+        assert hist.groupby('variable')['count'].sum().to_dict() == \
+            data[num_vars].notna().sum().to_dict(), \
+            "Every value should fall in one histogram bin."
+        assert hist.groupby('variable').size().max() <= 30, \
+            "There should be at most 30 bins per variable."
+
+        assert acc.cat_table().equals(cat_table), \
+            "The categories are not correctly counted."
+
+        acc_cor = acc.corr_table()
+        assert acc_cor[['Var1', 'Var2']].equals(cor_table[['Var1', 'Var2']])
+        assert np.allclose(acc_cor['Corr'], cor_table['Corr']), \
+            "The correlation coefficients are not correctly calculated."
+
+        assert "altair" in str(type(acc.cat_chart()))
+        assert "altair" in str(type(acc.num_chart()))
+        assert "altair" in str(type(acc.corr_chart()))
+
+    # Tests the Exceptions are correctly raised
+    with pytest.raises(Exception) as e:
+        ReportAccumulator(cat_vars, ['N1', 'N1'])
+    assert str(e.value) == "The elements in the argument 'num_vars' " \
+                           "should be unique."
+    with pytest.raises(Exception) as e:
+        ReportAccumulator(cat_vars, ['C4']).update(data)
+    assert str(e.value) == "Only numeric columns expected, please " \
+                           "check the input."
+    with pytest.raises(Exception) as e:
+        full.merge(ReportAccumulator(cat_vars, ['N1']))
+    assert str(e.value) == "Only accumulators of the same variables " \
+                           "can be merged."
+
+
+def test_histograms():
+    """
+    Tests the power of two histograms stay aligned when they are merged.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    values = np.concatenate([np.linspace(0, 1, 100),
+                             np.linspace(-50, 3000, 100)])[:, None]
+    one = Histograms(1, bins=10).update(values)
+    two = Histograms(1, bins=10).update(values[:100])
+    two.merge(Histograms(1, bins=10).update(values[100:]))
+
+    for hist in [one, two]:
+        table = hist.table(['x'])
+        assert len(table) <= 10, "There should be at most 10 bins."
+        assert table['count'].sum() == 200, "Every value should be binned."
+        assert table['value'].iloc[0] <= -50 and \
+            table['value_end'].iloc[-1] > 3000, \
+            "The bins should cover all the values."
+        width = table['value_end'] - table['value']
+        assert (width == width.iloc[0]).all() and \
+            np.log2(width.iloc[0]).is_integer(), \
+            "The bins should share a power of two width."
+    assert one.table(['x']).equals(two.table(['x'])), \
+        "Merged histograms should match a histogram of all the values."
+
+
+def test_category_counts():
+    """
+    Tests the CategoryCounts switch to sketches for the variables with many
+    distinct categories, also when they are merged with exact counts.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    rng = np.random.RandomState(0)
+    data = helper_create_data(2000)
+    data['ID'] = rng.zipf(1.3, len(data)) % 5000
+    exact = data['ID'].value_counts()
+
+    whole = CategoryCounts(['C1', 'ID'], max_distinct=100).update(data)
+    merged = CategoryCounts(['C1', 'ID'], max_distinct=100)
+    merged.update(data.iloc[:50])
+    merged.merge(CategoryCounts(['C1', 'ID'], max_distinct=100)
+                 .update(data.iloc[50:]))
+
+    for counts in [whole, merged]:
+        assert 'ID' in counts.heavy_hitters and \
+            'C1' not in counts.heavy_hitters, \
+            "Only the variable with many categories should be sketched."
+        distinct = counts.distinct_counts()
+        assert distinct['C1'] == data['C1'].nunique()
+        assert abs(distinct['ID'] / len(exact) - 1) < 0.05, \
+            "The number of distinct categories should be estimated."
+
+        table = counts.table()
+        ids = table[table['variable'] == 'ID']
+        assert list(ids['category'][:5]) == list(exact.index[:5]), \
+            "The most frequent categories should be kept."
+        assert len(ids) == 21 and ids['category'].iloc[-1] == 'Other', \
+            "The top 20 categories and 'Other' should be kept."
+        assert ids['count'].sum() == exact.sum(), \
+            "The remaining values should be counted in 'Other'."
+        assert table.attrs['distinct'] == {'ID': distinct['ID']}
+        assert table[table['variable'] == 'C1'].equals(
+            eda._category_counts(data, ['C1'])), \
+            "The other variables should be counted exactly."
+
+    # Categories of equal counts are ordered the same way everywhere
+    ties = pd.DataFrame({'T': list('cabbac')})
+    table = CategoryCounts(['T']).update(ties.iloc[:3]) \
+        .update(ties.iloc[3:]).table()
+    assert list(table['category']) == ['a', 'b', 'c'] and \
+        table.equals(eda._category_counts(ties.iloc[::-1], ['T'])), \
+        "The categories of equal counts should be sorted."
+    assert CategoryCounts(['T']).max_distinct == eda._MAX_DISTINCT, \
+        "The variables should be sketched above the cap of the plots."
@@ -0,0 +1,70 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from t_eda_analysis import arrays, tables
+from t_eda_analysis import t_eda_analysis as eda
+
+
+def test_memmap_input(tmp_path, monkeypatch):
+    """
+    Tests describe_num_var and calc_cor accept a memory-mapped array and
+    walk it in blocks of rows without copying it.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal((200000, 4))
+    values[:, 1] = values[:, 0] * 2 + rng.standard_normal(200000)
+    values[rng.random(200000) < 0.05, 2] = np.nan
+    num_vars = ['a', 'b', 'c', 'd']
+    path = str(tmp_path / "values.npy")
+    np.save(path, values)
+    data = pd.DataFrame(values, columns=num_vars)
+
+    mapped = np.load(path, mmap_mode='r')
+    monkeypatch.setattr(arrays, "_BLOCK_BYTES", 2 ** 16)
+    tracemalloc.start()
+    tables.num_summary(mapped, num_vars)
+    tables.correlation(mapped, num_vars)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < values.nbytes / 10, "The array should not be copied."
+
+    summary, plot = eda.describe_num_var(mapped, num_vars)
+    table, _ = eda.calc_cor(mapped, num_vars, return_table=True)
+
+    expected, expected_plot = eda.describe_num_var(data, num_vars)
+    exact_rows = ["min", "max", "mean", "sd"]
+    assert np.allclose(summary.loc[exact_rows], expected.loc[exact_rows])
+    assert np.allclose(summary.loc["median"], expected.loc["median"],
+                       atol=0.05)
+    assert summary.attrs["approximate"] == ["25%", "75%", "median"]
+    pd.testing.assert_frame_equal(plot.data, expected_plot.data)
+
+    expected_table, _ = eda.calc_cor(data, num_vars, return_table=True)
+    assert np.allclose(table['Corr'], expected_table['Corr']), \
+        "The correlation coefficients are not correctly calculated."
+
+    # Integer arrays are converted one block at a time
+    counts = np.arange(30).reshape(10, 3)
+    summary, _ = eda.describe_num_var(counts, ['x', 'y', 'z'])
+    assert list(summary.loc["max"]) == [27, 28, 29]
+
+    with pytest.raises(Exception) as e:
+        eda.describe_num_var(mapped, ['a', 'b'])
+    assert str(e.value) == "The argument 'num_vars' should name every " \
+                           "column of the array."
+    with pytest.raises(Exception) as e:
+        eda.calc_cor(np.zeros(5), ['a'])
+    assert str(e.value) == "The value of the argument 'dataframe' should " \
+                           "be a pandas dataframe or a 2d numeric array."
+    with pytest.raises(Exception) as e:
+        eda.describe_num_var(mapped, num_vars, sample=100)
+    assert str(e.value) == "The argument 'sample' is only supported " \
+                           "for dataframes."
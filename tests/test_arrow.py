@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from t_eda_analysis import arrow, tables
+from tests.test_t_eda_analysis import helper_create_data
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3', 'N4']
+
+
+def test_arrow(tmp_path):
+    """
+    Tests the Parquet and Arrow functions match the pandas ones, reading
+    the NA counts and extremes from the Parquet statistics.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(3000)
+    data['N4'] = np.arange(len(data)) % 97
+    path = str(tmp_path / "data.parquet")
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    pq.write_table(table, path, row_group_size=700)
+    bare = str(tmp_path / "bare.parquet")
+    pq.write_table(table, bare, row_group_size=700, write_statistics=False)
+
+    stats = arrow.column_stats(path)
+    assert stats.attrs["read_columns"] == [], \
+        "The statistics should be read from the footer only."
+    assert (stats["rows"] == len(data)).all()
+    assert list(stats["na_count"]) == list(data.isna().sum())
+    assert stats.loc['N1', 'min'] == data['N1'].min() and \
+        stats.loc['N4', 'max'] == 96
+    assert stats.loc['C4', 'min'] == data['C4'].dropna().min()
+
+    bare_stats = arrow.column_stats(bare, ['N1', 'C2'])
+    assert bare_stats.attrs["read_columns"] == ['N1', 'C2'], \
+        "The columns without statistics should be decoded."
+    assert bare_stats.equals(stats.loc[['N1', 'C2']])
+    for source in [path, bare, table]:
+        assert arrow.count_na_values(source).equals(
+            tables.na_counts(data)), "The NA values are not counted."
+
+    expected, expected_bins = tables.num_summary(data, num_vars)
+    for source in [path, table]:
+        summary, bins = arrow.num_summary(source, num_vars,
+                                          quantile_error=None)
+        pd.testing.assert_frame_equal(summary, expected)
+        pd.testing.assert_frame_equal(bins, expected_bins)
+
+    summary, bins = arrow.num_summary(bare, num_vars, batch_size=500)
+    assert summary.attrs["approximate"] == ["25%", "75%", "median"]
+    exact_rows = ["min", "max", "mean", "sd"]
+    assert np.allclose(summary.loc[exact_rows], expected.loc[exact_rows])
+    assert np.allclose(summary.loc["median"], expected.loc["median"],
+                       rtol=0.1)
+    pd.testing.assert_frame_equal(bins, expected_bins)
+
+    counts = arrow.category_counts(path, cat_vars, batch_size=500)
+    expected = tables.category_counts(data, cat_vars)
+    assert counts.equals(expected), \
+        "The categories are not correctly counted."
+
+    with pytest.raises(Exception) as e:
+        arrow.num_summary(path, ['C4'])
+    assert str(e.value) == "Only numeric columns expected, please " \
+                           "check the input."
+    with pytest.raises(Exception) as e:
+        arrow.column_stats(path, ['X'])
+    assert str(e.value) == "The argument 'columns' should be a subset " \
+                           "of the column names from the source."
+    with pytest.raises(Exception) as e:
+        arrow.count_na_values(data)
+    assert str(e.value) == "The value of the argument 'source' should be " \
+                           "the path of a Parquet file or an Arrow table."
+
+
+def test_arrow_infinite(tmp_path):
+    """
+    Tests the Parquet histograms bin the finite values of columns holding
+    infinite values.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = pd.DataFrame({'N1': [1.0, 2.0, np.inf, 4.0, np.nan],
+                         'N2': [-np.inf, 0.5, 3.0, 1.5, 2.5]})
+    path = str(tmp_path / "inf.parquet")
+    pq.write_table(pa.Table.from_pandas(data, preserve_index=False), path)
+    for quantile_error in [None, 0.01]:
+        summary, bins = arrow.num_summary(path, ['N1', 'N2'], bins=4,
+                                          quantile_error=quantile_error)
+        expected, expected_bins = tables.num_summary(data, ['N1', 'N2'],
+                                                     bins=4)
+        pd.testing.assert_frame_equal(bins, expected_bins)
+        assert summary.loc['max', 'N1'] == np.inf, \
+            "The summary should keep the infinite extremes."
+
+
+def test_arrow_nan(tmp_path):
+    """
+    Tests the NaN values of Arrow floating columns are counted as NA and
+    not as categories, like the NaN values of a dataframe.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    columns = {'N1': [1.0, np.nan, 2.0, 1.0, np.nan, 3.0],
+               'N2': [0.5, np.nan, None, 2.5, 3.5, 4.5],
+               'C1': ['a', 'b', None, 'a', 'a', 'b']}
+    data = pd.DataFrame(columns)
+    # NaN stays a value, only None is a null
+    table = pa.table({item: pa.array(values)
+                      for item, values in columns.items()})
+    assert table.column('N1').null_count == 0 and \
+        table.column('N2').null_count == 1
+    path = str(tmp_path / "nan.parquet")
+    pq.write_table(table, path, row_group_size=4)
+
+    for source in [path, table]:
+        assert arrow.count_na_values(source, batch_size=4).equals(
+            tables.na_counts(data)), "The NaN values are not counted as NA."
+        counts = arrow.category_counts(source, ['N1', 'C1'], batch_size=4)
+        assert counts.equals(tables.category_counts(data, ['N1', 'C1'])), \
+            "The NaN values are counted as categories."
+        summary, bins = arrow.num_summary(source, ['N1', 'N2'],
+                                          quantile_error=None)
+        expected, expected_bins = tables.num_summary(data, ['N1', 'N2'])
+        pd.testing.assert_frame_equal(summary, expected)
+        pd.testing.assert_frame_equal(bins, expected_bins)
@@ -0,0 +1,82 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from t_eda_analysis import async_report, report
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_report_sections(monkeypatch):
+    """
+    Tests the sections of a report are yielded without blocking the event
+    loop, and that identical concurrent requests share one computation.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(1000)
+    created = []
+
+    class CountedReport(report.EDAReport):
+        def __init__(self, *args, **kwargs):
+            created.append(args)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(async_report, "EDAReport", CountedReport)
+
+    async def collect(*args, **kwargs):
+        sections = {}
+        async for name, value in async_report.report_sections(*args,
+                                                              **kwargs):
+            sections[name] = value
+        return sections
+
+    async def ticks(stop):
+        count = 0
+        while not stop.done():
+            count += 1
+            await asyncio.sleep(0)
+        return count
+
+    async def run():
+        stop = asyncio.get_running_loop().create_future()
+        ticker = asyncio.ensure_future(ticks(stop))
+        first, second = await asyncio.gather(
+            collect(data, cat_vars, num_vars),
+            collect(data.copy(), cat_vars, num_vars))
+        stop.set_result(None)
+        return first, second, await ticker
+
+    first, second, count = asyncio.run(run())
+    assert len(created) == 1, "The identical requests are not coalesced"
+    assert set(first) == {"na_counts", "categories", "summary",
+                          "histograms", "correlation", "cat_chart",
+                          "num_chart", "corr_chart"}, \
+        "The sections are not all yielded"
+    assert first["summary"] is second["summary"], \
+        "The coalesced requests do not share the sections"
+    assert count > 1, "The event loop is blocked"
+
+    expected = report.EDAReport(data, cat_vars, num_vars)
+    pd.testing.assert_frame_equal(first["summary"], expected.summary)
+    pd.testing.assert_frame_equal(first["correlation"],
+                                  expected.correlation)
+    pd.testing.assert_series_equal(first["na_counts"], expected.na_counts)
+
+    sections = asyncio.run(collect(data, None, ["N1"], charts=False))
+    assert len(created) == 2 and "cat_chart" not in sections and \
+        list(sections["summary"].columns) == ["N1"], \
+        "The finished requests are computed again"
+    assert async_report._running == {}, \
+        "The finished reports are not released"
+
+    with pytest.raises(Exception):
+        asyncio.run(collect(data, ["N9"], num_vars))
+    with pytest.raises(Exception):
+        asyncio.run(collect(data.values, cat_vars, num_vars))
@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from t_eda_analysis import batch, tables
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+_profile = batch._profile
+
+
+def test_profile_tables(tmp_path, monkeypatch):
+    """
+    Tests many tables are profiled concurrently with one result per table,
+    failures included, and that the memory budget keeps the large tables
+    from running together.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(500)
+    path = str(tmp_path / "houses.csv")
+    data.to_csv(path, index=False)
+    sources = [data, path, str(tmp_path / "missing.csv"), data[num_vars]]
+
+    for backend in ["thread", "process"]:
+        results = batch.profile_tables(sources, cat_vars, num_vars,
+                                       n_jobs=2, backend=backend)
+        assert [result.name for result in results] == \
+            ["table0", "houses", "missing", "table3"], \
+            "The results are not in the order of the tables"
+        assert [result.ok for result in results] == \
+            [True, True, False, False], \
+            "The failures are not kept with their tables"
+        summary, bins = tables.num_summary(data, num_vars)
+        pd.testing.assert_frame_equal(results[0].tables["summary"], summary)
+        assert np.allclose(results[1].tables["summary"], summary,
+                           equal_nan=True), \
+            "The summary of a file is not correct"
+        assert isinstance(results[2].error, Exception) and \
+            "missing.csv" in results[2].traceback, \
+            "The error of a missing file is not kept"
+
+    results = batch.profile_tables({"a": data[num_vars]}, n_jobs=1,
+                                   output_dir=str(tmp_path / "html"))
+    assert results[0].ok and results[0].num_vars == num_vars and \
+        results[0].cat_vars == [], "The variables are not inferred"
+    assert (tmp_path / "html" / "a.html").exists(), \
+        "The HTML report is not saved"
+
+    # Counts the tables running at a time
+    state = {"running": set(), "peak": 0, "together": []}
+    lock = threading.Lock()
+
+    def fake_profile(name, *args):
+        with lock:
+            state["running"].add(name)
+            state["peak"] = max(state["peak"], len(state["running"]))
+            state["together"].append(set(state["running"]))
+        time.sleep(0.05)
+        with lock:
+            state["running"].discard(name)
+        return name
+
+    monkeypatch.setattr(batch, "_profile", fake_profile)
+    size = batch._estimate_memory(data)
+    names = batch.profile_tables([data] * 6, n_jobs=4, backend="thread",
+                                 max_memory=size)
+    assert names == ["table{}".format(i) for i in range(6)] and \
+        state["peak"] == 1, "The memory budget is not respected"
+    state["peak"] = 0
+    batch.profile_tables([data] * 6, n_jobs=4, backend="thread",
+                         max_memory=None)
+    assert state["peak"] > 1, "The tables do not run concurrently"
+
+    # The small tables fill the budget left by a large table
+    big = pd.concat([data] * 4, ignore_index=True)
+    state["together"] = []
+    names = batch.profile_tables(
+        {"big0": big, "big1": big, "small0": data, "small1": data},
+        n_jobs=4, backend="thread",
+        max_memory=batch._estimate_memory(big) + 2 * size)
+    assert names == ["big0", "big1", "small0", "small1"], \
+        "The results are not in the order of the tables"
+    assert {"big0", "small0", "small1"} in state["together"] and \
+        not any({"big0", "big1"} <= together
+                for together in state["together"]), \
+        "The small tables do not run alongside the large ones"
+
+    with pytest.raises(Exception):
+        batch.profile_tables(data)
+    with pytest.raises(Exception):
+        batch.profile_tables([data, 1])
+    with pytest.raises(Exception):
+        batch.profile_tables(["a/x.csv", "b/x.csv"])
+    with pytest.raises(Exception):
+        batch.profile_tables([data], max_memory=0)
+
+
+def _crash_profile(name, *args):
+    """
+    Kills the worker profiling the table named 'crash'.
+    """
+    if name == "crash":
+        os._exit(1)
+    return _profile(name, *args)
+
+
+def test_profile_tables_worker_killed(monkeypatch):
+    """
+    Tests a worker process dying fails only its table, the other tables
+    being profiled by a new pool.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(200)
+    monkeypatch.setattr(batch, "_profile", _crash_profile)
+    sources = {"a": data, "crash": data, "b": data, "c": data, "d": data}
+    results = batch.profile_tables(sources, cat_vars, num_vars, n_jobs=2,
+                                   max_memory=None)
+    assert [result.name for result in results] == list(sources), \
+        "The results are not in the order of the tables"
+    assert [result.ok for result in results] == \
+        [True, False, True, True, True], \
+        "The tables running with the dead worker are not profiled"
+    assert isinstance(results[1].error, batch.BrokenProcessPool), \
+        "The error of the dead worker is not kept"
@@ -0,0 +1,74 @@
+import json
+import tracemalloc
+
+from benchmarks import run_benchmarks
+from t_eda_analysis import t_eda_analysis as eda
+
+
+def test_benchmarks(tmp_path, monkeypatch):
+    """
+    Tests the benchmark suite runs on a small grid, writes JSON results and
+    reports the regressions between two results.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    output = tmp_path / "new.json"
+    assert run_benchmarks.main(["--rows", "200", "--columns", "5", "20",
+                                "--na-densities", "0.1",
+                                "--cardinalities", "5", "--repeat", "1",
+                                "--max-cells", "1000",
+                                "--output", str(output)]) == 0
+
+    with open(output) as file:
+        results = json.load(file)
+    assert {"python", "numpy", "pandas"} <= set(results["meta"])
+    imports = results["meta"]["import_seconds"]
+    assert set(imports) == set(run_benchmarks.IMPORTS) and \
+        all(seconds > 0 for seconds in imports.values()), \
+        "The import times should be recorded."
+    records = results["results"]
+    assert len(records) == 2 * len(run_benchmarks.FUNCTIONS), \
+        "Every function should be recorded for every configuration."
+    ran = [record for record in records if record["status"] == "ok"]
+    assert {record["function"] for record in ran} == \
+        set(run_benchmarks.FUNCTIONS) and \
+        all(record["columns"] == 5 for record in ran), \
+        "The configurations above max_cells should be skipped."
+    assert all(record["wall_seconds"] > 0 and record["peak_bytes"] > 0
+               for record in ran)
+
+    slower = json.loads(json.dumps(results))
+    for record in slower["results"]:
+        if record["status"] == "ok":
+            record["wall_seconds"] *= 2
+    assert run_benchmarks.compare(results, results) == []
+    regressions = run_benchmarks.compare(results, slower)
+    assert len(regressions) == len(ran) and \
+        all(metric == "wall_seconds" for _, _, metric, _, _ in regressions)
+    slower_path = tmp_path / "slower.json"
+    with open(slower_path, "w") as file:
+        json.dump(slower, file)
+    assert run_benchmarks.main(["--compare", str(output),
+                                str(slower_path)]) == 1
+
+    # The repeats are timed without tracing the memory
+    tracing = []
+    monkeypatch.setattr(run_benchmarks, "_call",
+                        lambda *args: tracing.append(tracemalloc.is_tracing()))
+    run_benchmarks.measure("calc_cor", None, [], [], repeat=2)
+    assert tracing == [False, False, True], \
+        "Only the memory run should be traced."
+
+    # A failed report is recorded as an error, not timed
+    monkeypatch.undo()
+    monkeypatch.setattr(eda, "generate_report",
+                        lambda *args: print("The report failed") or False)
+    records = run_benchmarks.run([100], [5], [0.0], [5], ["generate_report"],
+                                 repeat=1)["results"]
+    assert [record["status"] for record in records] == ["error"] and \
+        records[0]["error"] == "The report failed" and \
+        "wall_seconds" not in records[0], \
+        "A failed report should be recorded as an error."
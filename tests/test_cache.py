@@ -0,0 +1,106 @@
+import pytest
+
+from t_eda_analysis import cache
+from t_eda_analysis import t_eda_analysis as eda
+from t_eda_analysis.profile import EDAProfile
+from tests.test_t_eda_analysis import helper_create_data
+
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_cache(tmp_path):
+    """
+    Tests the results of the report functions are cached on the content of
+    the columns they read, evicted in least recently used order and read
+    back from disk.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data()
+    summary, plot = eda.describe_num_var(data, num_vars)
+    assert cache.stats() is None, "The cache should be disabled by default."
+
+    try:
+        cache.enable(max_entries=2)
+        first, _ = eda.describe_num_var(data, num_vars)
+        second, second_plot = eda.describe_num_var(data.copy(), num_vars)
+        assert cache.stats()['hits'] == 1 and \
+            cache.stats()['misses'] == 1, \
+            "An equal dataframe should hit the cache."
+        assert second.equals(summary) and second.attrs == summary.attrs \
+            and second_plot.to_dict() == plot.to_dict(), \
+            "The cached results should equal the computed ones."
+        second.iloc[0, 0] = -1
+        third, _ = eda.describe_num_var(data, num_vars)
+        assert third.equals(summary), \
+            "Changing a result should not change the cache."
+
+        # Other columns, arguments and values are cached separately
+        data['C4'] = 'dog'
+        eda.describe_num_var(data, num_vars, n_jobs=2)
+        assert cache.stats()['hits'] == 3, \
+            "Only the columns read should be fingerprinted."
+        eda.describe_num_var(data, num_vars, bins=10)
+        changed = data.copy()
+        changed.loc[0, 'N1'] = 1000
+        assert eda.describe_num_var(changed, num_vars)[0].loc['max', 'N1'] \
+            == 1000, "A changed value should not hit the cache."
+        assert cache.stats()['misses'] == 3
+        assert cache.stats()['entries'] == 2, \
+            "At most 2 results should be kept."
+        eda.describe_num_var(data, num_vars)
+        assert cache.stats()['misses'] == 4, \
+            "The least recently used result should be evicted."
+
+        # The calls inferring the variables are cached on every column
+        cache.enable()
+        summary, _ = eda.describe_num_var(data)
+        assert eda.describe_num_var(data)[0].equals(summary) and \
+            cache.stats()['hits'] == 1, \
+            "The calls with inferred variables should hit the cache."
+        changed = data.copy()
+        changed['C4'] = 1.5
+        assert 'C4' in eda.describe_num_var(changed)[0].columns and \
+            cache.stats()['hits'] == 1, \
+            "A change of the inferred variables should not hit the cache."
+        eda.describe_num_var(data, list(summary.columns))
+        assert cache.stats()['hits'] == 1
+
+        # Tests the disk tier
+        cache.enable(max_entries=1, directory=str(tmp_path))
+        eda.calc_cor(data, num_vars)
+        eda.count_na_values(data)
+        eda.calc_cor(data, num_vars)
+        assert cache.stats()['disk_hits'] == 1, \
+            "An evicted result should be read back from disk."
+        cache.enable(directory=str(tmp_path))
+        eda.count_na_values(data)
+        assert cache.stats()['disk_hits'] == 1, \
+            "The disk tier should be shared by new caches."
+        cache.clear()
+        assert not list(tmp_path.iterdir()), "The files should be removed."
+
+        # The chunks of the accumulators are not cached
+        cache.enable()
+        profile = EDAProfile(['C4'], num_vars)
+        for start in range(0, len(data), 10):
+            profile.update(data.iloc[start:start + 10])
+        assert cache.stats()['misses'] == 0 and \
+            cache.stats()['entries'] == 0, \
+            "The chunks of a profile should not fill the cache."
+
+        # Invalid arguments still raise the Exceptions of the functions
+        with pytest.raises(Exception) as e:
+            eda.describe_num_var(data, ['Y1'])
+        assert str(e.value) == "The argument 'num_vars' should be a " \
+                               "subset of the column names from the " \
+                               "dataframe."
+        with pytest.raises(Exception) as e:
+            cache.enable(max_entries=0)
+        assert str(e.value) == "The value of the argument 'max_entries' " \
+                               "should be a positive integer."
+    finally:
+        cache.disable()
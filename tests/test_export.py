@@ -0,0 +1,117 @@
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from t_eda_analysis import export
+from t_eda_analysis import t_eda_analysis as eda
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_save_html(tmp_path):
+    """
+    Tests the HTML export stores every dataset once, in a columnar encoding
+    that decodes back to the records of the charts.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(1000)
+    report = eda.generate_report(data, cat_vars, num_vars, lazy=True)
+    path = str(tmp_path / "report.html")
+    assert report.save_html(path, title="Cars <2020>") == path
+    with open(path, encoding="utf-8") as file:
+        html = file.read()
+
+    assert "<title>Cars &lt;2020&gt;</title>" in html
+    assert "Number of NA values in each column" in html
+    datasets = dict(re.findall(r'<script type="application/json" '
+                               r'id="(data-\w+)">(.*?)</script>', html))
+    expected = list(report.chart.to_dict()["datasets"].values())
+    assert len(datasets) == len(expected) and \
+        len(re.findall(r'id="data-', html)) == len(expected), \
+        "Every dataset should be stored once."
+    for values in datasets.values():
+        assert _decode(json.loads(values)) in expected, \
+            "The datasets should decode to the records of the charts."
+    specs = re.findall(r'class="eda-spec" data-target="chart-\d" '
+                       r"data-datasets='(.*?)'>(.*?)</script>", html)
+    assert len(specs) == 3
+    for names, spec in specs:
+        spec = json.loads(spec)
+        assert "datasets" not in spec and \
+            set(json.loads(names)) <= set(datasets)
+    assert len(html) < len(report.chart.to_json()), \
+        "The page should be smaller than the inline specs."
+
+    # The datasets can be written next to the page
+    sidecar = str(tmp_path / "sidecar.html")
+    report.save_html(sidecar, data_dir=str(tmp_path / "data"))
+    with open(sidecar, encoding="utf-8") as file:
+        html = file.read()
+    assert 'id="data-' not in html and 'var dataDir = "data";' in html
+    assert sorted(os.listdir(str(tmp_path / "data"))) == \
+        sorted(name + ".json" for name in datasets)
+
+    assert "cdn.jsdelivr.net/npm/vega-embed@" in html, \
+        "The scripts should be loaded from the CDN by default."
+    scripts = []
+    for name in ["vega", "vega-lite", "vega-embed"]:
+        script = tmp_path / (name + ".js")
+        script.write_text('var {} = "</script>";'.format(
+            name.replace("-", "_")))
+        scripts.append(str(script))
+    offline = str(tmp_path / "offline.html")
+    report.save_html(offline, scripts=scripts)
+    with open(offline, encoding="utf-8") as file:
+        html = file.read()
+    assert "cdn.jsdelivr.net" not in html and \
+        'var vega_embed = "<\\/script>";' in html, \
+        "The local scripts should be inlined and escaped."
+    with pytest.raises(Exception):
+        report.save_html(offline, scripts=scripts[:2])
+
+    # The tables of the charts are not limited to 5000 rows
+    wide = pd.DataFrame(np.random.default_rng(0).normal(size=(100, 120)),
+                        columns=["N{}".format(i) for i in range(120)])
+    report = eda.generate_report(wide, [], list(wide.columns), lazy=True)
+    assert len(report.correlation) > 5000
+    wide_path = str(tmp_path / "wide.html")
+    assert report.save_html(wide_path) == wide_path
+    with open(wide_path, encoding="utf-8") as file:
+        datasets = re.findall(r'<script type="application/json" '
+                              r'id="data-\w+">(.*?)</script>', file.read())
+    assert max(json.loads(values)["length"] for values in datasets) == \
+        len(report.correlation), "The large tables should be saved."
+
+    output = str(tmp_path / "eager.html")
+    assert eda.generate_report(data, cat_vars, num_vars, output=output)
+    assert os.path.exists(output)
+
+    encoded = export._encode(pd.DataFrame({'a': ['x', 'x', 'x'],
+                                           'b': [1.5, np.nan, None]}))
+    assert encoded == {"length": 3,
+                       "columns": {"a": {"dictionary": ["x"],
+                                         "codes": [0, 0, 0]},
+                                   "b": [1.5, None, None]}}
+
+
+def _decode(dataset):
+    """
+    Decodes a columnar dataset like the script of the page.
+    """
+    columns = {}
+    for name, values in dataset["columns"].items():
+        if isinstance(values, dict):
+            values = [values["dictionary"][code] for code in values["codes"]]
+        columns[name] = values
+    return [{name: values[i] for name, values in columns.items()}
+            for i in range(dataset["length"])]
@@ -0,0 +1,88 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from t_eda_analysis import inference
+from t_eda_analysis import t_eda_analysis as eda
+
+
+def helper_typed_data(n_rows):
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        "id": ["row{}".format(i) for i in range(n_rows)],
+        "city": rng.choice(["Paris", "Oslo", "Lima", None], n_rows),
+        "price": rng.normal(size=n_rows),
+        "rooms": rng.integers(1, 5, n_rows),
+        "sold": rng.random(n_rows) > 0.5,
+        "grade": pd.Categorical(rng.choice(list("abc"), n_rows)),
+        "amount": rng.integers(0, 10 ** 6, n_rows).astype(str),
+        "day": pd.Series(pd.date_range("2020-01-01", periods=n_rows,
+                                       freq="H").astype(str)),
+        "stamp": pd.date_range("2020-01-01", periods=n_rows, freq="T"),
+        "empty": pd.Series([None] * n_rows, dtype=object)})
+
+
+def test_infer_column_types():
+    """
+    Tests the column roles are inferred from the dtypes and a bounded
+    sample of the object columns, and that the report functions use them
+    when the variables are omitted.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_typed_data(2000)
+    roles = inference.infer_column_types(data)
+    assert roles == {"cat_vars": ["city", "sold", "grade"],
+                     "num_vars": ["price", "rooms"],
+                     "datetime_vars": ["day", "stamp"],
+                     "numeric_text_vars": ["amount"],
+                     "other_vars": ["id", "empty"]}, \
+        "The inferred roles are not correct"
+    assert inference.infer_column_types(data, sample_rows=500) == roles, \
+        "The roles inferred from a sample are not correct"
+
+    # The time depends on the sample, not the number of rows
+    large = pd.concat([data] * 100, ignore_index=True)
+    start = time.perf_counter()
+    assert inference.infer_column_types(large, sample_rows=500) == roles, \
+        "The roles of a large dataframe are not correct"
+    assert time.perf_counter() - start < 5, \
+        "The roles of a large dataframe are not inferred from a sample"
+
+    summary, plot = eda.describe_num_var(data)
+    assert list(summary.columns) == roles["num_vars"], \
+        "The numerical variables are not inferred"
+    chart = eda.describe_cat_var(data[["city", "price"]])
+    assert set(chart.data["variable"]) == {"city"}, \
+        "The categorical variables are not inferred"
+    report = eda.generate_report(data, lazy=True)
+    assert report.cat_vars == roles["cat_vars"] and \
+        report.num_vars == roles["num_vars"], \
+        "The report variables are not inferred"
+    report = eda.generate_report(data[["price", "rooms"]], lazy=True)
+    assert report.cat_vars == [] and report.chart.to_dict(), \
+        "The report of a table without categorical variable fails"
+    report = eda.generate_report(data, num_vars=["rooms"], lazy=True)
+    assert report.cat_vars == roles["cat_vars"] and \
+        report.num_vars == ["rooms"], \
+        "The given variables are not kept"
+
+    typed = pd.DataFrame({"price": data["price"],
+                          "wait": pd.to_timedelta(data["rooms"], unit="D"),
+                          "signal": data["price"] * 1j})
+    assert inference.infer_column_types(typed)["other_vars"] == \
+        ["wait", "signal"], \
+        "The durations and complex numbers are inferred as numbers"
+    summary, plot = eda.describe_num_var(typed)
+    assert list(summary.columns) == ["price"], \
+        "The durations and complex numbers are summarized"
+
+    with pytest.raises(Exception):
+        inference.infer_column_types(data.values)
+    with pytest.raises(Exception):
+        inference.infer_column_types(data, sample_rows=0)
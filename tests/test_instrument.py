@@ -0,0 +1,70 @@
+import pytest
+
+from t_eda_analysis import cache, instrument
+from t_eda_analysis import t_eda_analysis as eda
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_stage_records():
+    """
+    Tests generate_report passes a record of every stage to the callbacks.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(5000)
+    records = []
+    assert eda.generate_report(data, cat_vars, num_vars,
+                               callbacks=[records.append])
+    assert [record.stage for record in records] == \
+        ["na_counts", "categories", "numeric_summary", "correlation",
+         "charts"], "Every stage should be recorded in order."
+    for record in records:
+        assert record.wall_seconds > 0 and record.cpu_seconds >= 0
+        assert record.peak_bytes is None, \
+            "The memory should only be traced on request."
+    by_stage = {record.stage: record for record in records}
+    assert (by_stage["na_counts"].rows, by_stage["na_counts"].columns) == \
+        data.shape
+    assert (by_stage["numeric_summary"].rows,
+            by_stage["numeric_summary"].columns) == (5000, 3)
+    assert by_stage["categories"].columns == 4
+    assert set(records[0].as_dict()) == \
+        {"stage", "wall_seconds", "cpu_seconds", "peak_bytes",
+         "max_rss_bytes", "rows", "columns"}
+
+    # Every callback gets the records, with the traced memory
+    first, second = [], []
+    assert eda.generate_report(data, cat_vars, num_vars, sample=1000,
+                               callbacks=[first.append, second.append],
+                               trace_memory=True)
+    assert first[0].stage == "sample" and first[1].rows == 1000
+    assert [record.stage for record in first] == \
+        [record.stage for record in second]
+    numeric = [record for record in first
+               if record.stage == "numeric_summary"][0]
+    assert numeric.peak_bytes >= 1000 * 3 * 8, \
+        "The numeric block should be traced."
+
+    # The stages read from the cache are not run
+    cache.enable()
+    try:
+        eda.generate_report(data, cat_vars, num_vars)
+        records = []
+        eda.generate_report(data, cat_vars, num_vars,
+                            callbacks=[records.append])
+        assert [record.stage for record in records] == ["charts"]
+    finally:
+        cache.disable()
+
+    with pytest.raises(Exception) as e:
+        instrument.Stages(callbacks=print)
+    assert str(e.value) == "The value of the argument 'callbacks' " \
+                           "should be a list of functions."
+    assert not eda.generate_report(data, cat_vars, num_vars,
+                                   callbacks=[None])
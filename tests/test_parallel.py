@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from t_eda_analysis import parallel
+from t_eda_analysis import t_eda_analysis as eda
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_parallel_report(monkeypatch):
+    """
+    Tests the report functions give the same results with thread and
+    process workers as in a single thread.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(3000)
+    na_counts = eda.count_na_values(data)
+    cat_plot = eda.describe_cat_var(data, cat_vars)
+    summary, num_plot = eda.describe_num_var(data, num_vars)
+    col_summary, col_plot = eda.describe_num_var(data, num_vars,
+                                                 bin_strategy="per_column")
+
+    for n_jobs, backend in [(4, "thread"), (2, "process"), (-1, "thread")]:
+        assert eda.count_na_values(data, n_jobs, backend).equals(na_counts), \
+            "The NA values should not depend on the workers."
+
+        p = eda.describe_cat_var(data, cat_vars, n_jobs=n_jobs,
+                                 backend=backend)
+        assert p.data.equals(cat_plot.data), \
+            "The categories should not depend on the workers."
+
+        par_summary, par_plot = eda.describe_num_var(
+            data, num_vars, n_jobs=n_jobs, backend=backend)
+        assert par_summary.equals(summary) and \
+            par_plot.data.equals(num_plot.data), \
+            "The numeric summary should not depend on the workers."
+        par_summary, par_plot = eda.describe_num_var(
+            data, num_vars, bin_strategy="per_column", n_jobs=n_jobs,
+            backend=backend)
+        assert par_summary.equals(col_summary) and \
+            par_plot.data.equals(col_plot.data), \
+            "The histograms should not depend on the workers."
+
+    assert eda.generate_report(data, cat_vars, num_vars, n_jobs=2)
+
+    # Tests only the numeric work is sent to processes, which read the
+    # shared block instead of pickled columns
+    sent = []
+
+    class RecordingExecutor(parallel.ProcessPoolExecutor):
+        def map(self, func, *iterables, **kwargs):
+            sent.append(func)
+            return super().map(func, *iterables, **kwargs)
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", RecordingExecutor)
+    tables = eda._report_tables(data, cat_vars, num_vars, n_jobs=2,
+                                backend="process")
+    eda.count_na_values(data, n_jobs=2, backend="process")
+    eda.describe_cat_var(data, cat_vars, n_jobs=2, backend="process")
+    assert set(sent) == {eda._summarize_block_column,
+                         eda._bin_block_column}, \
+        "The NA and category scans should not be sent to processes."
+    assert tables["na_counts"].equals(na_counts), \
+        "The NA values are not correctly counted."
+
+    # Tests the shared blocks
+    with parallel.shared_block((5, 2), "process") as (block, ref):
+        block[:] = np.arange(10).reshape(5, 2)
+        shared = parallel.open_block(ref)
+        assert isinstance(shared, np.memmap) and \
+            np.array_equal(shared, block), \
+            "The workers should read the block from the shared file."
+    with parallel.shared_block((0, 2), "process") as (block, ref):
+        assert parallel.open_block(ref) is block
+
+    # Tests the Exceptions are correctly raised
+    with pytest.raises(Exception) as e:
+        eda.describe_num_var(data, num_vars, n_jobs=0)
+    assert str(e.value) == "The value of the argument 'n_jobs' " \
+                           "should be a positive integer or -1."
+    with pytest.raises(Exception) as e:
+        eda.count_na_values(data, backend="gpu")
+    assert str(e.value) == "The value of the argument 'backend' " \
+                           "should be one of thread, process."
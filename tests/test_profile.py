@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from t_eda_analysis import t_eda_analysis as eda
+from t_eda_analysis.profile import EDAProfile
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_eda_profile():
+    """
+    Tests the EDAProfile renders the outputs of the report functions for
+    all the rows appended so far.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(2000)
+    profile = EDAProfile(cat_vars, num_vars)
+    for start in range(0, 1000, 250):
+        profile.update(data.iloc[start:start + 250])
+    assert profile.n_rows == 1000, "Every appended row should be counted."
+
+    # Appending the next rows updates every output
+    profile.update(data.iloc[1000:])
+    assert profile.count_na_values().equals(eda.count_na_values(data)), \
+        "The NA values are not correctly counted."
+
+    cat_plot = profile.describe_cat_var(n_cols=2)
+    expected = eda.describe_cat_var(data, cat_vars)
+    assert cat_plot.data.equals(expected.data), \
+        "The categories are not correctly counted."
+
+    summary, num_plot = profile.describe_num_var()
+    expected, _ = eda.describe_num_var(data, num_vars)
+    exact_rows = ["min", "max", "mean", "sd"]
+    pd.testing.assert_frame_equal(summary.loc[exact_rows],
+                                  expected.loc[exact_rows])
+    assert summary.attrs["approximate"] == ["25%", "75%", "median"]
+    assert num_plot.data['count'].sum() == data[num_vars].notna().sum().sum()
+
+    cor_table, cor_plot = profile.calc_cor(return_table=True)
+    expected, _ = eda.calc_cor(data, num_vars, return_table=True)
+    assert np.allclose(cor_table['Corr'], expected['Corr']), \
+        "The correlation coefficients are not correctly calculated."
+    assert "altair" in str(type(profile.calc_cor()))
+
+    assert profile.report(), "The report should be printed."
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from t_eda_analysis import t_eda_analysis as eda
+from t_eda_analysis.report import EDAReport
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_lazy_report():
+    """
+    Tests generate_report returns a lazy report computing each section on
+    its first access.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(2000)
+    records = []
+    report = eda.generate_report(data, cat_vars, num_vars, lazy=True,
+                                 callbacks=[records.append])
+    assert isinstance(report, EDAReport)
+    assert report.computed() == [] and records == [], \
+        "Nothing should be computed before an access."
+
+    summary = report.summary
+    expected, _ = eda.describe_num_var(data, num_vars)
+    pd.testing.assert_frame_equal(summary, expected)
+    assert [record.stage for record in records] == ["numeric_summary"], \
+        "Only the numeric summary should be computed."
+    assert report.summary is summary, "The sections should be memoized."
+    assert "histograms" in report.computed()
+    assert "chart" not in report.computed()
+
+    assert report.na_counts.equals(eda.count_na_values(data))
+    assert "altair" in str(type(report.corr_chart))
+    assert set(report.computed()) == \
+        {"summary", "histograms", "na_counts", "correlation", "corr_chart"}
+
+    # The chart computes the missing sections and is then kept
+    chart = report.chart
+    assert "altair" in str(type(chart)) and report.chart is chart
+    assert set(report.categories['variable']) == set(cat_vars)
+    assert [record.stage for record in records][-2:] == \
+        ["categories", "charts"]
+
+    # A sampled report uses the same sample for every section
+    sampled = eda.generate_report(data, cat_vars, num_vars, lazy=True,
+                                  sample=500)
+    assert sampled.summary.attrs["sample"]["rows"] == 500
+    tables = eda._report_tables(data, cat_vars, num_vars, sample=500)
+    assert sampled.na_counts.equals(tables["na_counts"])
+    assert sampled.categories.equals(tables["categories"])
+    assert sampled.show() is sampled.chart
+
+    with pytest.raises(Exception) as e:
+        eda.generate_report(data, cat_vars, ['N9'], lazy=True)
+    assert str(e.value) == "The argument 'num_vars' should be a subset " \
+                           "of the column names from the dataframe."
+    assert not eda.generate_report(data, cat_vars, ['N9'])
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from t_eda_analysis import sampling
+from t_eda_analysis import t_eda_analysis as eda
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_sampled_num_var():
+    """
+    Tests describe_num_var estimates the summary from a sample with
+    confidence intervals covering the exact statistics.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    np.random.seed(0)
+    data = helper_create_data(100000)
+    exact, exact_plot = eda.describe_num_var(data, num_vars)
+
+    for sample in [5000, sampling.Sample(5000, method="reservoir", seed=3),
+                   sampling.Sample(5000, "stratified", strata='C4')]:
+        summary, plot = eda.describe_num_var(data, num_vars, sample=sample)
+        info = summary.attrs["sample"]
+        assert info["rows"] == 5000 and info["population"] == len(data), \
+            "The sample should be described."
+        assert summary.attrs["approximate"] == list(summary.index)
+
+        lower, upper = summary.attrs["lower"], summary.attrs["upper"]
+        se = summary.attrs["standard_error"]
+        for row in lower.index:
+            assert ((lower.loc[row] <= summary.loc[row]) &
+                    (summary.loc[row] <= upper.loc[row])).all(), \
+                "The estimates should be within their intervals."
+            assert (se.loc[row] > 0).all()
+        covered = (lower <= exact.loc[lower.index]) & \
+            (exact.loc[lower.index] <= upper)
+        assert covered.to_numpy().mean() >= 0.8, \
+            "The intervals should cover the exact statistics."
+
+        assert abs(plot.data['count'].sum() /
+                   exact_plot.data['count'].sum() - 1) < 0.01, \
+            "The bin counts should be scaled to the whole dataframe."
+
+    # The same seed draws the same sample
+    first, _ = eda.describe_num_var(data, num_vars, sample=5000)
+    second, _ = eda.describe_num_var(data, num_vars, sample=5000)
+    assert first.equals(second), "The sample should be seeded."
+
+    # A sample larger than the dataframe keeps every row
+    small = data.iloc[:100]
+    summary, _ = eda.describe_num_var(small, num_vars, sample=1000)
+    assert summary.equals(eda.describe_num_var(small, num_vars)[0])
+    assert (summary.attrs["standard_error"].fillna(0) == 0).all().all()
+
+
+def test_sampled_cat_var():
+    """
+    Tests describe_cat_var and generate_report estimate the counts from a
+    sample.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    np.random.seed(0)
+    data = helper_create_data(50000)
+    exact = eda.describe_cat_var(data, cat_vars).data
+    sample = sampling.Sample(4000, method="stratified", strata='C4')
+    data_plot = eda.describe_cat_var(data, cat_vars, sample=sample).data
+
+    assert (data_plot['lower'] <= data_plot['count']).all() and \
+        (data_plot['count'] <= data_plot['upper']).all()
+    merged = exact.merge(data_plot, on=['variable', 'category'])
+    covered = (merged['lower'] <= merged['count_x']) & \
+        (merged['count_x'] <= merged['upper'])
+    assert covered.mean() > 0.8, \
+        "The intervals should cover the exact counts."
+    c4 = data_plot[data_plot['variable'] == 'C4']
+    assert np.allclose(c4['count'].sum(), data['C4'].notna().sum(),
+                       rtol=0.01), \
+        "The strata should be sampled in proportion to their sizes."
+
+    tables = eda._report_tables(data, cat_vars, num_vars, sample=2000)
+    assert tables['sample']['rows'] == 2000
+    assert tables['na_counts'].index.equals(data.columns)
+    assert np.allclose(sampling.scale_counts([20, 0], 2000, 50000),
+                       [500, 0]), "The counts should be scaled."
+    assert eda.generate_report(data, cat_vars, num_vars, sample=2000)
+
+
+def test_sampling():
+    """
+    Tests the sampling methods draw the expected rows.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = pd.DataFrame({'x': np.arange(10000),
+                         'g': ['rare'] + ['common'] * 9999})
+    chunks = [data.iloc[start:start + 700]
+              for start in range(0, len(data), 700)]
+    rows = sampling.reservoir_sample(chunks, 500, seed=1)
+    assert len(rows) == 500 and rows['x'].is_unique and \
+        rows['x'].is_monotonic_increasing, \
+        "The rows should be drawn without replacement in their order."
+    assert rows.equals(sampling.reservoir_sample(chunks, 500, seed=1))
+    assert abs(rows['x'].mean() - 5000) < 500, \
+        "The rows should be drawn uniformly."
+    assert sampling.reservoir_sample([], 5).empty
+
+    strata = sampling.Sample(100, method="stratified", strata='g')
+    rows = sampling.draw(data, strata, ['x', 'g'])
+    assert 'rare' in set(rows['g']) and len(rows) == 100, \
+        "Every stratum should be sampled."
+    many = pd.DataFrame({'x': np.arange(100), 'g': np.arange(100) % 10})
+    for n in [10, 12]:
+        rows = sampling.draw(many, sampling.Sample(n, "stratified",
+                                                   strata='g'), ['x', 'g'])
+        assert len(rows) == n and rows['g'].nunique() == 10, \
+            "Every stratum should be sampled."
+
+    with pytest.raises(Exception) as e:
+        sampling.Sample(0)
+    assert str(e.value) == "The value of the argument 'n' " \
+                           "should be a positive integer."
+    with pytest.raises(Exception) as e:
+        sampling.Sample(10, method="stratified")
+    assert str(e.value) == "The argument 'strata' should be the name of " \
+                           "a column, only for the stratified method."
+    with pytest.raises(Exception) as e:
+        eda.describe_num_var(data, ['x'], sample=0.5)
+    assert str(e.value) == "The value of the argument 'sample' should be " \
+                           "a positive integer or a Sample."
+    with pytest.raises(Exception) as e:
+        eda.describe_num_var(data, ['x'], sample=sampling.Sample(
+            10, method="stratified", strata='y'))
+    assert str(e.value) == "The argument 'strata' should be one of the " \
+                           "column names from the dataframe."
+    with pytest.raises(Exception) as e:
+        sampling.draw(many, sampling.Sample(5, "stratified", strata='g'),
+                      ['x'])
+    assert str(e.value) == "The value of the argument 'n' should be at " \
+                           "least the number of strata, 10."
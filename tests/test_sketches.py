@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from t_eda_analysis import arrays, tables
+from t_eda_analysis.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+def test_kll_sketch():
+    """
+    Tests the KLLSketch estimates quantiles within its rank error, whether
+    it is built at once or merged from sketches of separate chunks.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    rng = np.random.RandomState(0)
+    values = rng.exponential(3, 200000)
+    values[rng.randint(0, len(values), 1000)] = np.nan
+    valid = np.sort(values[~np.isnan(values)])
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+    whole = KLLSketch(error=0.01, seed=0).update(values)
+    merged = KLLSketch(error=0.01, seed=1)
+    for chunk in np.array_split(values, 13):
+        merged.merge(KLLSketch(error=0.01, seed=2).update(chunk))
+
+    for sketch in [whole, merged]:
+        assert sketch.count == len(valid), "NA values should be ignored."
+        assert len(sketch) < 2000, "The sketch should stay small."
+        ranks = np.searchsorted(valid, sketch.quantile(qs)) / len(valid)
+        assert np.all(np.abs(ranks - qs) < 0.01), \
+            "The quantiles should be estimated within the rank error."
+
+    # Tests small and empty sketches
+    small = KLLSketch().update([4.0, 1.0, 3.0, 2.0])
+    assert small.quantile(0.5) == np.quantile([1, 2, 3, 4], 0.5), \
+        "A sketch that kept every value should be exact."
+    assert small.quantile(1) == 4 and small.quantile(0) == 1
+    assert np.isnan(KLLSketch().quantile(0.5)), \
+        "An empty sketch should estimate NA quantiles."
+
+    with pytest.raises(Exception) as e:
+        KLLSketch(error=0)
+    assert str(e.value) == "The value of the argument 'error' " \
+                           "should be between 0 and 1."
+
+
+def test_kll_sketch_seed():
+    """
+    Tests the approximate quantiles are the same for identical calls and
+    whatever the number of workers, the sketches having a fixed seed.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame(rng.exponential(3, (50000, 3)),
+                        columns=['N1', 'N2', 'N3'])
+    num_vars = list(data.columns)
+
+    assert KLLSketch().update(data['N1']).quantile(0.5) == \
+        KLLSketch().update(data['N1']).quantile(0.5), \
+        "The default seed should be fixed."
+    first, _ = tables.num_summary(data, num_vars, quantile_error=0.01)
+    second, _ = tables.num_summary(data, num_vars, quantile_error=0.01)
+    workers, _ = tables.num_summary(data, num_vars, quantile_error=0.01,
+                                    n_jobs=2)
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(first, workers)
+    first, _ = arrays.describe_array(data.to_numpy(), num_vars)
+    second, _ = arrays.describe_array(data.to_numpy(), num_vars)
+    pd.testing.assert_frame_equal(first, second)
+    other, _ = arrays.describe_array(data.to_numpy(), num_vars, seed=1)
+    assert not first.equals(other), "The seed should be used."
+
+
+def test_hyperloglog():
+    """
+    Tests the HyperLogLog estimates the number of distinct values within
+    its error, whether it is built at once or merged from sketches of
+    separate chunks.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    rng = np.random.RandomState(0)
+    values = rng.randint(0, 50000, 200000)
+    n_distinct = len(np.unique(values))
+
+    whole = HyperLogLog().update(values)
+    merged = HyperLogLog()
+    for chunk in np.array_split(values, 7):
+        merged.merge(HyperLogLog().update(chunk.astype(object)))
+
+    for hll in [whole, merged]:
+        assert abs(hll.estimate() / n_distinct - 1) < 0.03, \
+            "The number of distinct values should be estimated within " \
+            "the error."
+    assert np.array_equal(whole.registers, merged.registers), \
+        "A value should have the same hash whatever its dtype."
+
+    small = HyperLogLog().update(["a", "b", "c", None, "a"])
+    assert round(small.estimate()) == 3, \
+        "Small cardinalities should be almost exact."
+    assert HyperLogLog().estimate() == 0
+
+    with pytest.raises(Exception) as e:
+        HyperLogLog(precision=2)
+    assert str(e.value) == "The value of the argument 'precision' " \
+                           "should be an integer between 4 and 18."
+    with pytest.raises(Exception) as e:
+        whole.merge(HyperLogLog(precision=10))
+    assert str(e.value) == "Only sketches of the same precision " \
+                           "can be merged."
+
+
+def test_space_saving():
+    """
+    Tests the SpaceSaving sketch finds the most frequent values and bounds
+    the error of their counts, whether it is built at once or merged from
+    sketches of separate chunks.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    rng = np.random.RandomState(0)
+    values = pd.Series(rng.zipf(1.5, 100000) % 20000).astype(str)
+    exact = values.value_counts()
+
+    whole = SpaceSaving(capacity=200).update(values)
+    merged = SpaceSaving(capacity=200)
+    for chunk in np.array_split(values, 9):
+        merged.merge(SpaceSaving(capacity=200).update(chunk))
+
+    for top in [whole, merged]:
+        assert top.n_values == len(values), "Every value should be counted."
+        assert len(top.counts) == 200, "At most 200 values are counted."
+        assert list(top.top(10).index) == list(exact.index[:10]), \
+            "The most frequent values should be found."
+        truth = exact[top.counts.index]
+        assert (top.counts >= truth).all() and \
+            (top.counts - top.errors <= truth).all(), \
+            "The counts should be overestimated by at most their error."
+        missing = exact.drop(top.counts.index)
+        assert (missing <= top.min_count()).all(), \
+            "The values not counted should be rarer than min_count."
+
+    with pytest.raises(Exception) as e:
+        SpaceSaving(capacity=0)
+    assert str(e.value) == "The value of the argument 'capacity' " \
+                           "should be a positive integer."
@@ -0,0 +1,124 @@
+import pandas as pd
+import pytest
+
+from t_eda_analysis import streaming
+from t_eda_analysis.accumulators import ReportAccumulator
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_profile_stream(tmp_path):
+    """
+    Tests the profile_stream function reads every source chunk by chunk and
+    matches the statistics of the whole data.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(1000)
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+    expected = ReportAccumulator(cat_vars, num_vars).update(data)
+
+    sources = [str(path), path, data,
+               pd.read_csv(path, chunksize=150),
+               [data.iloc[:10], data.iloc[10:]]]
+    for source in sources:
+        acc = streaming.profile_stream(source, cat_vars, num_vars,
+                                       chunksize=100)
+        assert acc.n_rows == len(data), "All the rows should be read."
+        assert acc.na_counts().equals(expected.na_counts()), \
+            "The NA values are not correctly counted."
+        assert acc.cat_table().equals(expected.cat_table()), \
+            "The categories are not correctly counted."
+        summary = acc.num_summary()
+        exact_rows = ["min", "max", "mean", "sd"]
+        pd.testing.assert_frame_equal(summary.loc[exact_rows],
+                                      expected.num_summary().loc[exact_rows])
+        assert summary.attrs["approximate"] == ["25%", "75%", "median"], \
+            "The sketched rows should be reported as approximate."
+
+    # Tests only the requested columns are read
+    chunks = list(streaming.iter_chunks(path, chunksize=400,
+                                        columns=['N1']))
+    assert [len(chunk) for chunk in chunks] == [400, 400, 200], \
+        "The file should be read 400 rows at a time."
+    assert list(chunks[0].columns) == ['N1'], \
+        "Only the requested columns should be read."
+
+    with pytest.raises(Exception) as e:
+        list(streaming.iter_chunks(data, chunksize=0))
+    assert str(e.value) == "The value of the argument 'chunksize' " \
+                           "should be a positive integer."
+
+
+def test_profile_partitions(tmp_path):
+    """
+    Tests the profile_partitions function merges the profiles of separate
+    partitions into the statistics of the whole data.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(1500)
+    partitions = [data.iloc[:500]]
+    for i, start in enumerate([500, 1000]):
+        path = tmp_path / "day={}.csv".format(i)
+        data.iloc[start:start + 500].to_csv(path, index=False)
+        partitions.append(str(path))
+    expected = ReportAccumulator(cat_vars, num_vars).update(data)
+
+    for n_jobs, backend in [(2, "process"), (1, "thread")]:
+        acc = streaming.profile_partitions(
+            partitions, cat_vars, num_vars, n_jobs=n_jobs, backend=backend,
+            chunksize=200)
+        assert acc.n_rows == len(data), "All the rows should be read."
+        assert acc.na_counts().equals(expected.na_counts()), \
+            "The NA values are not correctly counted."
+        assert acc.cat_table().equals(expected.cat_table()), \
+            "The categories are not correctly counted."
+        summary = acc.num_summary()
+        pd.testing.assert_frame_equal(
+            summary.loc[["min", "max", "mean", "sd"]],
+            expected.num_summary().loc[["min", "max", "mean", "sd"]])
+        assert acc.hist_table().equals(expected.hist_table()), \
+            "The histogram bins are not correctly merged."
+        pd.testing.assert_frame_equal(acc.corr_table(),
+                                      expected.corr_table())
+
+    with pytest.raises(Exception) as e:
+        streaming.profile_partitions(partitions, cat_vars, ['C4'])
+    assert str(e.value) == "Only numeric columns expected, please " \
+                           "check the input."
+
+
+def test_generate_report_stream(tmp_path):
+    """
+    Tests the generate_report_stream function to make sure the outputs are
+    correct.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data()
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+
+    # Positive test case: Checking whether the function runs properly or not
+    assert streaming.generate_report_stream(path, cat_vars, num_vars,
+                                            chunksize=64), \
+        "Expected True but False returned"
+
+    # Negative test case: Checking whether the function returns False
+    # for wrong input
+    assert not streaming.generate_report_stream(path, cat_vars,
+                                                "String Input"), \
+        "Expected False but True returned"
@@ -1,3 +1,5 @@
+import tracemalloc
+
 import altair as alt
 import numpy as np
 import pandas as pd
@@ -72,6 +74,55 @@ def test_generate_report():
         "Expected False but True returned"
 
 
+def test_report_tables():
+    """
+    Tests the shared plan of generate_report computes the tables of the
+    report functions with a single copy of the numeric variables.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data(2000)
+    cat_vars = ['C1', 'C2', 'C3', 'C4']
+    num_vars = ['N1', 'N2', 'N3']
+    tables = eda._report_tables(data, cat_vars, num_vars)
+
+    assert tables['na_counts'].equals(eda.count_na_values(data)), \
+        'The NA values are not correctly counted'
+    assert tables['categories'].equals(
+        eda.describe_cat_var(data, cat_vars).data), \
+        'The categories are not correctly counted'
+    summary, plot = eda.describe_num_var(data, num_vars)
+    assert tables['summary'].equals(summary) and \
+        tables['histograms'].equals(plot.data), \
+        'The numeric summary is not correctly calculated'
+    cor_table, _ = eda.calc_cor(data, num_vars, return_table=True)
+    assert tables['correlation'][['Var1', 'Var2']].equals(
+        cor_table[['Var1', 'Var2']]) and \
+        np.allclose(tables['correlation']['Corr'], cor_table['Corr']), \
+        'The correlation is not correctly calculated'
+
+    # Testing the constant variables have NA correlations like calc_cor
+    data['N4'] = 1.0
+    corr = eda._report_tables(data, [], ['N1', 'N4'])['correlation']
+    expected, _ = eda.calc_cor(data, ['N1', 'N4'], return_table=True)
+    assert corr['Corr'].isna().equals(expected['Corr'].isna())
+
+    # Testing the peak memory is about one copy of the numeric block
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame(rng.normal(size=(100000, 10)),
+                        columns=['X' + str(i) for i in range(10)])
+    data.iloc[::7, 3] = np.nan
+    tracemalloc.start()
+    eda._report_tables(data, [], list(data.columns))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 1.5 * data.to_numpy().nbytes, \
+        'The numeric block should be copied only once'
+
+
 def test_describe_cat_var():
     """
     Tests the describe_cat_var function to make sure the outputs are correct.
@@ -133,9 +184,57 @@ def test_describe_cat_var():
 
     # Testing if the specified columns has been plotted or not
     p = eda.describe_cat_var(data, cat_vars)
-    assert set(p.data.columns) == set(cat_vars), \
+    assert set(p.data['variable']) == set(cat_vars), \
         'The specified categorical columns were not plotted'
 
+    # Testing the plot only holds the counts, with NA values dropped
+    # in each column separately
+    for col in cat_vars:
+        counts = p.data[p.data['variable'] == col]
+        expected = data[col].value_counts()
+        assert len(counts) == len(expected), \
+            'Each category should be counted once'
+        assert dict(zip(counts['category'], counts['count'])) == \
+            expected.to_dict(), 'The categories are not correctly counted'
+
+    # Testing the top_k categories and the "Other" bucket
+    p = eda.describe_cat_var(data, ['C2'], top_k=2)
+    expected = data['C2'].value_counts()
+    assert list(p.data['category']) == list(expected.index[:2]) + \
+        ['Other'], 'Only the top 2 categories should be plotted'
+    assert p.data['count'].sum() == expected.sum(), \
+        'The remaining categories should be counted in "Other"'
+
+    # Testing a positive integer is passed to top_k
+    try:
+        eda.describe_cat_var(data, cat_vars, top_k=0)
+        assert False, 'Exception must be thorwn for this test case'
+    except Exception as ex:
+        assert "The value of the argument 'top_k' must be a positive " \
+               "non zero integer" == str(ex), 'Expected exception not thrown'
+
+    # Testing the columns with many categories are cut down to the top 20
+    data['ID'] = np.arange(len(data)) % 50
+    p = eda.describe_cat_var(data, ['C1', 'ID'], max_distinct=30)
+    ids = p.data[p.data['variable'] == 'ID']
+    assert len(ids) == 21 and ids['category'].iloc[-1] == 'Other', \
+        'Only the top 20 categories of ID should be plotted'
+    assert ids['count'].sum() == len(data), \
+        'The remaining categories should be counted in "Other"'
+    assert len(p.data[p.data['variable'] == 'C1']) == data['C1'].nunique(), \
+        'Every category of C1 should be plotted'
+    assert 'Histogram of ID (50 distinct)' in p.to_json(), \
+        'The number of distinct categories should be shown'
+
+    # Testing a positive integer is passed to max_distinct
+    try:
+        eda.describe_cat_var(data, cat_vars, max_distinct=0)
+        assert False, 'Exception must be thorwn for this test case'
+    except Exception as ex:
+        assert "The value of the argument 'max_distinct' must be a " \
+               "positive non zero integer" == str(ex), \
+               'Expected exception not thrown'
+
 
 def test_calc_cor():
     """
@@ -181,6 +280,20 @@ def test_calc_cor():
     # Tests if the plot type is correct
     assert "altair" in str(type(chart)), "Plot type is not an Altair object"
 
+    # Tests the long-form table is returned next to the chart
+    table, chart = eda.calc_cor(data, ["N3", "N1", "N2"], return_table=True)
+    assert table.equals(chart.data), \
+        "The returned table should be the plotted table"
+    assert len(table) == 6, "Each pair should appear once"
+    assert list(zip(table["Var1"], table["Var2"])) == [
+        ("N1", "N1"), ("N1", "N2"), ("N1", "N3"),
+        ("N2", "N2"), ("N2", "N3"), ("N3", "N3")], \
+        "The pairs should form the triangle in sorted order"
+    expected = data[["N3", "N1", "N2"]].dropna().corr()
+    for var1, var2, corr in table.itertuples(index=False):
+        assert corr == expected.loc[var1, var2], \
+            "The correlation coefficients are not correctly calculated"
+
     # Tests the exception is correctly raised when columns are not numeric
     with pytest.raises(Exception) as e:
         assert eda.calc_cor(data, ["C4"])
@@ -220,6 +333,94 @@ def test_calc_cor():
     # Generate test data from the helper function.
 
 
+def test_calc_cor_pairs():
+    """
+    Tests the blocked correlation function calc_cor_pairs to make sure the
+    selected pairs match the full correlation matrix.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data()
+    data['N4'] = data['N1'] * 2 + data['N2']
+    data['N5'] = 1.0
+    num_vars = ["N1", "N2", "N3", "N4", "N5"]
+
+    corr = data[num_vars].dropna().corr()
+    expected = {}
+    for i, var1 in enumerate(num_vars):
+        for var2 in num_vars[i + 1:]:
+            if not np.isnan(corr.loc[var1, var2]):
+                expected[(var1, var2)] = corr.loc[var1, var2]
+    ranked = sorted(expected, key=lambda pair: -abs(expected[pair]))
+
+    # Tests the top pairs match the full matrix, with tiles of one variable
+    pairs, chart = eda.calc_cor_pairs(data, num_vars, top_k=3, max_memory=8)
+    assert list(zip(pairs["Var1"], pairs["Var2"])) == ranked[:3], \
+        "The most correlated pairs are not correctly selected"
+    for var1, var2, value in pairs.itertuples(index=False):
+        assert np.isclose(value, expected[(var1, var2)]), \
+            "The correlation coefficients are not correctly calculated"
+
+    # Tests the plot only shows the variables of the selected pairs
+    plotted = set(chart.data["Var1"]) | set(chart.data["Var2"])
+    assert plotted == set(pairs["Var1"]) | set(pairs["Var2"]), \
+        "The plot should be restricted to the selected variables"
+    assert "altair" in str(type(chart)), "Plot type is not an Altair object"
+
+    # Tests the threshold in single precision
+    pairs, _ = eda.calc_cor_pairs(data, num_vars, top_k=None,
+                                  threshold=0.3, dtype=np.float32)
+    assert set(zip(pairs["Var1"], pairs["Var2"])) == \
+        {pair for pair in expected if abs(expected[pair]) >= 0.3}, \
+        "The pairs above the threshold are not correctly selected"
+
+    # Tests the tiles and their selection stay within the memory budget
+    wide = pd.DataFrame(np.random.default_rng(0).normal(size=(50, 600)),
+                        columns=["V{}".format(i) for i in range(600)])
+    wide_vars = list(wide.columns)
+    eda.calc_cor_pairs(wide, wide_vars, top_k=3)
+    z_bytes = wide.size * 8
+    for dtype in [np.float64, np.float32]:
+        for top_k, threshold in [(20, None), (None, 0.5)]:
+            tracemalloc.start()
+            eda.calc_cor_pairs(wide, wide_vars, top_k=top_k,
+                               threshold=threshold, max_memory=2 ** 20,
+                               dtype=dtype)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert peak < z_bytes + 2 * 2 ** 20, \
+                "The tiles exceed the memory budget"
+
+    # Tests the correlogram is limited to the strongest pairs
+    pairs, chart = eda.calc_cor_pairs(wide, wide_vars, top_k=None,
+                                      threshold=0)
+    plotted = set(chart.data["Var1"]) | set(chart.data["Var2"])
+    assert len(pairs) == 600 * 599 // 2 and \
+        len(plotted) == eda._MAX_CORRELOGRAM_VARS and \
+        {pairs["Var1"][0], pairs["Var2"][0]} <= plotted, \
+        "The correlogram should be limited to the strongest pairs"
+
+    # Tests the exceptions are correctly raised for wrong options
+    with pytest.raises(Exception) as e:
+        eda.calc_cor_pairs(data, num_vars, top_k=None)
+    assert str(e.value) == "Either the argument 'top_k' or the argument " \
+                           "'threshold' should be given."
+    with pytest.raises(Exception) as e:
+        eda.calc_cor_pairs(data, num_vars, top_k=0)
+    assert str(e.value) == "The value of the argument 'top_k' should be " \
+                           "a positive integer."
+    with pytest.raises(Exception) as e:
+        eda.calc_cor_pairs(data, num_vars, threshold=2)
+    assert str(e.value) == "The value of the argument 'threshold' should " \
+                           "be between 0 and 1."
+    with pytest.raises(Exception) as e:
+        eda.calc_cor_pairs(data, ["C4"])
+    assert str(e.value) == "Columns are not all numeric"
+
+
 # noinspection PyBroadException
 def test_describe_na_value():
     """
@@ -278,6 +479,33 @@ def test_describe_na_value():
                                         [0, 1]],
                                        index=na_categorical_dataframe.columns))
 
+    # Test the compact mask formats agree with the 0/1 dataframe
+    expected_mask = np.array([[False, False],
+                              [True, False],
+                              [False, False]])
+    for output in ["bool", "uint8"]:
+        mask, na_counts = eda.describe_na_values(na_numerical_dataframe,
+                                                 output=output)
+        assert np.array_equal(mask.astype(bool), expected_mask), \
+            "The NA mask is not correctly calculated."
+        assert list(na_counts) == [0, 1, 0], \
+            "The NA counts are not correctly calculated."
+    assert eda.describe_na_values(na_numerical_dataframe,
+                                  output="uint8")[0].dtype == np.uint8
+
+    packed, na_counts = eda.describe_na_values(na_categorical_dataframe,
+                                               output="packed")
+    assert packed.shape == (3, 1), "The mask should be packed into bytes."
+    assert np.array_equal(np.unpackbits(packed, axis=1, count=2),
+                          [[0, 0], [0, 0], [1, 0]]), \
+        "The packed NA mask is not correctly calculated."
+    assert list(na_counts.index) == ["col_1", "col_2", "col_3"]
+
+    with pytest.raises(Exception) as e:
+        eda.describe_na_values(no_na_dataframe, output="abc")
+    assert str(e.value) == "The value of the argument 'output' must be " \
+                           "one of dataframe, bool, uint8, packed"
+
 
 def test_describe_num_var():
     """
@@ -311,6 +539,44 @@ def test_describe_num_var():
     assert summary['N1'][6] == np.nanstd(test_col), \
         "Standard deviation is not correctly calculated."
 
+    assert summary.attrs["approximate"] == [], \
+        "The exact summary should not have approximate rows."
+
+    # Test the approximate quantiles are close to the exact ones.
+    approx, _ = eda.describe_num_var(test_data, ['N1', 'N2'],
+                                     quantile_error=0.01)
+    assert approx.attrs["approximate"] == ["25%", "75%", "median"], \
+        "The sketched rows should be reported as approximate."
+    assert approx.drop(["25%", "75%", "median"]).equals(
+        summary.drop(["25%", "75%", "median"])), \
+        "Only the quantiles should be approximate."
+    for stat, q in [("25%", 0.25), ("75%", 0.75), ("median", 0.5)]:
+        rank = (test_col < approx.loc[stat, 'N1']).sum() / \
+            test_col.notna().sum()
+        assert abs(rank - q) < 0.03, \
+            "The approximate quantiles are not close to the exact ones."
+    with pytest.raises(Exception) as e:
+        assert eda.describe_num_var(test_data, ['N1'], quantile_error=2)
+    assert str(e.value) == "The value of the argument 'quantile_error' " \
+                           "should be between 0 and 1."
+
+    # Test the summary keeps the column order and the readable index.
+    assert list(summary.columns) == ['N1', 'N2'], \
+        "The summary columns should follow 'num_vars'."
+    assert list(summary.index) == ["25%", "75%", "min", "max",
+                                   "median", "mean", "sd"], \
+        "The summary index is not correct."
+
+    # Test integer and all NA columns are summarised.
+    int_data = pd.DataFrame({'I1': [4, 1, 3, 2],
+                             'E1': [np.nan] * 4})
+    int_summary, _ = eda.describe_num_var(int_data, ['I1', 'E1'])
+    assert list(int_summary['I1']) == [1.75, 3.25, 1, 4, 2.5, 2.5,
+                                       np.std([1, 2, 3, 4])], \
+        "The integer column is not correctly summarised."
+    assert int_summary['E1'].isna().all(), \
+        "An all NA column should be summarised as NA."
+
     # Test the plot type is correct.
     assert isinstance(plot, alt.vegalite.v3.api.FacetChart), \
         "Plot type is not an Altair object."
@@ -320,8 +586,43 @@ def test_describe_num_var():
     # Test the axes of the plot is correctly mapped.
     assert plot.to_dict()['spec']['encoding']['x']['field'] == 'value', \
         "Plot x-axis should be mapped to value."
-    assert plot.to_dict()['spec']['encoding']['y']['aggregate'] == 'count', \
-        "Plot y-axis should be mapped to value after aggregating with count()."
+    assert plot.to_dict()['spec']['encoding']['y']['field'] == 'count', \
+        "Plot y-axis should be mapped to the pre-aggregated bin counts."
+
+    # Test the plot only holds the bin counts of every variable.
+    hist = plot.data
+    assert len(hist) == 2 * 30, "The plot should hold 30 bins per variable."
+    for col in ['N1', 'N2']:
+        assert hist.loc[hist['variable'] == col, 'count'].sum() == \
+            test_data[col].notna().sum(), \
+            "The bin counts should add up to the number of non NA values."
+    assert hist.groupby('variable')['value'].min().nunique() == 1, \
+        "The bins should be shared between the variables by default."
+
+    # Test the number of bins and the per column bin strategy.
+    _, plot = eda.describe_num_var(test_data, ['N1', 'N2'], bins=5,
+                                   bin_strategy="per_column")
+    hist = plot.data
+    assert len(hist) == 2 * 5, "The plot should hold 5 bins per variable."
+    for col in ['N1', 'N2']:
+        col_hist = hist[hist['variable'] == col]
+        assert col_hist['value'].min() == test_data[col].min(), \
+            "The first bin should start at the variable minimum."
+        assert col_hist['value_end'].max() == test_data[col].max(), \
+            "The last bin should end at the variable maximum."
+    assert plot.to_dict()['resolve']['scale']['x'] == 'independent', \
+        "The per column bins should use independent x scales."
+
+    # Test the Exception is correctly raised when the histogram options
+    # are wrong.
+    with pytest.raises(Exception) as e:
+        assert eda.describe_num_var(test_data, ['N1'], bins=0)
+    assert str(e.value) == "The value of the argument 'bins' " \
+                           "should be a positive integer."
+    with pytest.raises(Exception) as e:
+        assert eda.describe_num_var(test_data, ['N1'], bin_strategy="abc")
+    assert str(e.value) == "The value of the argument 'bin_strategy' " \
+                           "should be one of shared, per_column."
 
     # Test the Exception is correctly raised when the type of `dataframe`
     # argument is wrong.
@@ -365,3 +666,65 @@ def test_describe_num_var():
         assert eda.describe_num_var(test_data, ['N1', 'C4'])
     assert str(e.value) == "Only numeric columns expected," \
                            " please check the input."
+
+
+def test_describe_num_var_infinite():
+    """
+    Tests the histograms of variables holding infinite values bin their
+    finite values, for dataframes and arrays.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    test_data = pd.DataFrame({'N1': [1.0, 2.0, np.inf, 4.0, np.nan],
+                              'N2': [-np.inf, 0.5, 3.0, 1.5, 2.5],
+                              'N3': [np.inf, -np.inf, np.nan, np.inf,
+                                     np.nan]})
+    num_vars = ['N1', 'N2', 'N3']
+    for bin_strategy in ['shared', 'per_column']:
+        for data in [test_data, test_data.to_numpy()]:
+            summary, plot = eda.describe_num_var(data, num_vars, bins=4,
+                                                 bin_strategy=bin_strategy)
+            hist = plot.data
+            assert summary.loc['max', 'N1'] == np.inf and \
+                summary.loc['min', 'N2'] == -np.inf, \
+                "The summary should keep the infinite extremes."
+            assert set(hist['variable']) == {'N1', 'N2'}, \
+                "The variables without finite values should not be binned."
+            assert np.isfinite(hist[['value', 'value_end']]).all().all(), \
+                "The bins should span the finite values."
+            counts = hist.groupby('variable')['count'].sum()
+            assert counts['N1'] == 3 and counts['N2'] == 4, \
+                "The bin counts should add up to the finite values."
+    assert eda.generate_report(test_data.assign(C1=list('abcab')), ['C1'],
+                               num_vars), \
+        "The report should handle infinite values."
+
+
+def test_count_na_values():
+    """
+    Tests the count_na_values function to make sure the outputs are correct.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    data = helper_create_data()
+    na_counts = eda.count_na_values(data)
+
+    # Test the counts match the NA values in each column
+    assert isinstance(na_counts, pd.Series), \
+        "The NA counts should be a pandas Series."
+    assert list(na_counts.index) == list(data.columns), \
+        "The NA counts should be indexed by the column names."
+    assert na_counts.equals(data.isna().sum().rename(na_counts.name)), \
+        "The NA counts are not correctly calculated."
+
+    # Test the Exception is correctly raised when the input is not
+    # a dataframe
+    with pytest.raises(Exception) as e:
+        eda.count_na_values([1, 2, 3])
+    assert str(e.value) == "the input data is not a dataframe."
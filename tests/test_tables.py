@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pandas as pd
+
+from t_eda_analysis import tables
+from t_eda_analysis import t_eda_analysis as eda
+from tests.test_t_eda_analysis import helper_create_data
+
+cat_vars = ['C1', 'C2', 'C3', 'C4']
+num_vars = ['N1', 'N2', 'N3']
+
+
+def test_tables():
+    """
+    Tests the compute-only functions return the tables behind the plots
+    without importing Altair.
+
+    Returns
+    --------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    code = ("import sys\n"
+            "import numpy as np\n"
+            "import pandas as pd\n"
+            "from t_eda_analysis import tables\n"
+            "data = pd.DataFrame({'C1': list('abcab'), 'N1': np.arange(5),\n"
+            "                     'N2': np.arange(5) ** 2})\n"
+            "tables.report_tables(data, ['C1'], ['N1', 'N2'])\n"
+            "tables.num_summary(data, ['N1'])\n"
+            "tables.category_counts(data, ['C1'])\n"
+            "tables.correlation(data, ['N1', 'N2'])\n"
+            "tables.na_counts(data)\n"
+            "assert 'altair' not in sys.modules\n")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    data = helper_create_data(1000)
+    summary, bins = tables.num_summary(data, num_vars, bins=10)
+    expected, plot = eda.describe_num_var(data, num_vars, bins=10)
+    pd.testing.assert_frame_equal(summary, expected)
+    pd.testing.assert_frame_equal(bins, plot.data)
+    assert tables.category_counts(data, cat_vars).equals(
+        eda.describe_cat_var(data, cat_vars).data)
+    table, _ = eda.calc_cor(data, num_vars, return_table=True)
+    assert tables.correlation(data, num_vars).equals(table)
+    assert tables.na_counts(data).equals(eda.count_na_values(data))
+    assert set(tables.report_tables(data, cat_vars, num_vars)) == \
+        {"na_counts", "categories", "summary", "histograms", "correlation"}